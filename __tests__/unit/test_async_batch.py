@@ -0,0 +1,160 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from task_script_utils.datetime_parser import (
+    DatetimeConfig,
+    aiter_parse,
+    parse,
+    parse_many_async,
+)
+from task_script_utils.datetime_parser.parser_exceptions import DatetimeParserError
+
+CONFIG = DatetimeConfig(fold=0)
+VALUES = [
+    "2021-11-07 01:30:00 America/Chicago",
+    "2021-01-01T10:00:00.123456789+05:30",
+    "13/01/2021 12:13 PM",
+    "Wednesday, January 13th 2021 12:13:14 PM",
+    "2021-12-23 12:12:12",
+]
+EXPECTED = [parse(value, config=CONFIG).isoformat() for value in VALUES]
+
+
+async def collect(async_iterator):
+    return [parsed async for parsed in async_iterator]
+
+
+@pytest.mark.parametrize("executor", [None, "thread", "process"])
+def test_parse_many_async(executor):
+    parsed = asyncio.run(
+        parse_many_async(VALUES, config=CONFIG, chunk_size=2, executor=executor)
+    )
+    assert [value.isoformat() for value in parsed] == EXPECTED
+
+
+def test_parse_many_async_with_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parsed = asyncio.run(
+            parse_many_async(VALUES, config=CONFIG, chunk_size=1, executor=executor)
+        )
+        # The executor is not shut down
+        assert executor.submit(lambda: 1).result() == 1
+    assert [value.isoformat() for value in parsed] == EXPECTED
+
+
+@pytest.mark.parametrize("executor", [None, "process"])
+def test_parse_many_async_errors(executor):
+    values = [*VALUES, "not a datetime"]
+    with pytest.raises(DatetimeParserError):
+        asyncio.run(parse_many_async(values, config=CONFIG, executor=executor))
+
+    parsed = asyncio.run(
+        parse_many_async(values, config=CONFIG, executor=executor, errors="coerce")
+    )
+    assert parsed[-1] is None
+
+
+def test_parse_many_async_raises_first_error_in_order():
+    chunks_parsed = []
+
+    class SlowFirstChunkExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            delay = 0.2 if args[0] == ["not a datetime 0"] else 0.02
+
+            def slow(*args, **kwargs):
+                threading.Event().wait(delay)
+                chunks_parsed.append(args[0])
+                return fn(*args, **kwargs)
+
+            return super().submit(slow, *args, **kwargs)
+
+    values = ["not a datetime 0", "not a datetime 1", *VALUES * 20]
+    with SlowFirstChunkExecutor(max_workers=2) as executor:
+        with pytest.raises(DatetimeParserError, match="not a datetime 0"):
+            asyncio.run(
+                parse_many_async(values, config=CONFIG, chunk_size=1, executor=executor)
+            )
+    # The chunks that hadn't started when the first chunk failed were cancelled
+    assert len(chunks_parsed) < len(values)
+
+
+def test_aiter_parse_iterable():
+    parsed = asyncio.run(
+        collect(aiter_parse(iter(VALUES), config=CONFIG, chunk_size=2))
+    )
+    assert [value.isoformat() for value in parsed] == EXPECTED
+
+
+def test_aiter_parse_async_iterable():
+    async def read_values():
+        for value in VALUES:
+            await asyncio.sleep(0)
+            yield value
+
+    parsed = asyncio.run(collect(aiter_parse(read_values(), config=CONFIG)))
+    assert [value.isoformat() for value in parsed] == EXPECTED
+
+
+def test_aiter_parse_yields_control_between_chunks():
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        parsed = await collect(aiter_parse(VALUES * 4, config=CONFIG, chunk_size=1))
+        task.cancel()
+        return parsed
+
+    parsed = asyncio.run(main())
+    assert len(parsed) == len(VALUES) * 4
+    assert len(ticks) >= len(VALUES) * 4
+
+
+def test_parse_many_async_cancellation():
+    started = threading.Event()
+    release = threading.Event()
+    chunks_parsed = []
+
+    class BlockingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            def blocking(*args, **kwargs):
+                started.set()
+                release.wait(5)
+                chunks_parsed.append(None)
+                return fn(*args, **kwargs)
+
+            return super().submit(blocking, *args, **kwargs)
+
+    async def main(executor):
+        task = asyncio.ensure_future(
+            parse_many_async(
+                VALUES * 10, config=CONFIG, chunk_size=1, executor=executor
+            )
+        )
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with BlockingExecutor(max_workers=1) as executor:
+        asyncio.run(main(executor))
+        release.set()
+    # Only the chunk that had started was parsed
+    assert len(chunks_parsed) == 1
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        asyncio.run(parse_many_async(VALUES, chunk_size=0))
+    with pytest.raises(ValueError):
+        asyncio.run(parse_many_async(VALUES, executor="fiber"))
+    with pytest.raises(ValueError):
+        asyncio.run(collect(aiter_parse(VALUES, errors="ignore")))
@@ -0,0 +1,110 @@
+import pytest
+
+from task_script_utils.datetime_parser import DatetimeConfig, parse, parse_many
+from task_script_utils.datetime_parser.batch import (
+    FAILED,
+    NOT_ENCODED,
+    RESULT_FIELDS,
+    _parse_pickled_chunk,
+    _parse_to_record,
+    decode_ts_datetime,
+    encode_ts_datetime,
+    records_to_tsformat,
+)
+from task_script_utils.datetime_parser.parser_exceptions import DatetimeParserError
+
+CONFIG = DatetimeConfig(fold=1)
+
+batch_test_cases = [
+    "2021-11-07 01:30:00 America/Chicago",
+    "2021-03-14 02:30:00 America/Chicago",
+    "2021-01-01T10:00:00.123456789+05:30",
+    "2021-01-01T10:00:00.000001 -00:30",
+    "13/01/2021 12:13 PM",
+    "Wednesday, January 13th 2021 12:13:14 PM",
+    "Jan 13 2021 12:13:14.5 +00:00",
+    "0001-01-01 00:00:00",
+    "9999-12-31 23:59:59.999999999",
+    "1969-12-31 23:59:59 Etc/UTC",
+]
+
+
+def assert_same_ts_datetimes(actual, expected):
+    assert [value.isoformat() for value in actual] == [
+        value.isoformat() for value in expected
+    ]
+    assert [value.tsformat() for value in actual] == [
+        value.tsformat() for value in expected
+    ]
+    assert [value.datetime for value in actual] == [
+        value.datetime for value in expected
+    ]
+
+
+@pytest.mark.parametrize("datetime_str", batch_test_cases)
+def test_encode_and_decode_ts_datetime(datetime_str):
+    ts_datetime = parse(datetime_str, config=CONFIG)
+    decoded = decode_ts_datetime(encode_ts_datetime(ts_datetime))
+    assert_same_ts_datetimes([decoded], [ts_datetime])
+    assert decoded.tzinfo == ts_datetime.tzinfo
+
+
+def test_records_to_tsformat():
+    import numpy as np
+
+    parsed = [parse(value, config=CONFIG) for value in batch_test_cases]
+    records = [encode_ts_datetime(value) for value in parsed]
+    records.insert(2, (FAILED, 0, -1, -1, 0, 0, 0, 0))
+    tsformats = records_to_tsformat(np.array(records, dtype=list(RESULT_FIELDS)))
+    assert tsformats.pop(2) is None
+    assert tsformats == [value.tsformat() for value in parsed]
+
+
+def test_too_many_subsecond_digits_are_not_encoded():
+    datetime_str = "2021-01-01T10:00:00.1234567890123456789+05:30"
+    ts_datetime = parse(datetime_str, config=CONFIG)
+    assert encode_ts_datetime(ts_datetime) is None
+    assert _parse_to_record(datetime_str, (), CONFIG)[0] == NOT_ENCODED
+
+
+def test_parse_many_in_calling_process():
+    expected = [parse(value, config=CONFIG) for value in batch_test_cases]
+    assert_same_ts_datetimes(parse_many(batch_test_cases, config=CONFIG), expected)
+
+
+def test_parse_many_with_workers():
+    values = [*batch_test_cases, "2021-01-01T10:00:00.1234567890123456789+05:30"]
+    expected = [parse(value, config=CONFIG) for value in values]
+    assert_same_ts_datetimes(parse_many(values, config=CONFIG, workers=2), expected)
+
+
+def test_parse_many_with_formats():
+    formats = ("DD/MM/YYYY HH:mm", "YYYY-MM-DD HH:mm:ss.SSSSSS")
+    values = ["01/02/2021 12:13", "2021-02-01 12:13:14.123456"] * 3
+    expected = [parse(value, formats, CONFIG) for value in values]
+    actual = parse_many(values, formats, CONFIG, workers=2)
+    assert_same_ts_datetimes(actual, expected)
+
+
+def test_parse_many_pickled_chunks():
+    records = _parse_pickled_chunk(batch_test_cases, (), CONFIG)
+    expected = [parse(value, config=CONFIG) for value in batch_test_cases]
+    assert_same_ts_datetimes([decode_ts_datetime(r) for r in records], expected)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_errors(workers):
+    values = ["2021-01-01 10:00:00", "not a datetime", None]
+    with pytest.raises(DatetimeParserError):
+        parse_many(values, config=CONFIG, workers=workers)
+
+    parsed = parse_many(values, config=CONFIG, workers=workers, errors="coerce")
+    assert parsed[0].isoformat() == "2021-01-01T10:00:00"
+    assert parsed[1:] == [None, None]
+
+
+def test_parse_many_invalid_arguments():
+    with pytest.raises(ValueError):
+        parse_many(batch_test_cases, errors="ignore")
+    with pytest.raises(ValueError):
+        parse_many(batch_test_cases, workers=0)
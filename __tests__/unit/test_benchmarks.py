@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from benchmarks import memory, speed
+from benchmarks.harness import compare, load_baseline, save_baseline
+
+
+def test_compare_with_tolerances():
+    baseline = {
+        "results": {"fast": 100.0, "slow": 100.0, "noisy": 100.0},
+        "tolerances": {"noisy": 2.0},
+    }
+    results = {"fast": 90.0, "slow": 160.0, "noisy": 250.0, "new": 10.0}
+    comparisons = {
+        comparison.name: comparison
+        for comparison in compare(results, baseline, tolerance=0.5)
+    }
+    assert not comparisons["fast"].regressed
+    assert comparisons["slow"].regressed
+    assert comparisons["slow"].ratio == pytest.approx(1.6)
+    assert not comparisons["noisy"].regressed
+    assert comparisons["new"].ratio is None
+    assert not comparisons["new"].regressed
+
+
+def test_save_baseline_keeps_tolerances(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    assert load_baseline(path)["results"] == {}
+
+    save_baseline(path, {"parse": 1.26}, {"tolerances": {"parse": 0.1}})
+    baseline = load_baseline(path)
+    assert baseline["results"] == {"parse": 1.3}
+    assert baseline["tolerances"] == {"parse": 0.1}
+
+
+@pytest.mark.parametrize("scenario", speed.scenarios(), ids=lambda s: s.name)
+def test_speed_scenarios_run(scenario):
+    scenario.func()
+
+
+def test_speed_main(tmp_path):
+    path = str(tmp_path / "speed.json")
+    assert speed.main(["-k", "isnumber", "--baseline", path, "--save-baseline"]) == 0
+    assert set(json.loads(open(path, encoding="utf-8").read())["results"]) == {
+        "isnumber/number",
+        "isnumber/text",
+    }
+    args = ["-k", "isnumber", "--baseline", path, "--repeat", "1"]
+    assert speed.main([*args, "--tolerance", "1000"]) == 0
+
+
+def test_measure_tracemalloc():
+    scenario = memory.Scenario("bytes", lambda rows: bytearray(rows))
+    measured = memory.measure_tracemalloc(scenario, 1_000_000)
+    assert 1_000_000 <= measured["retained_bytes"] <= measured["peak_bytes"]
+
+
+def test_memory_run():
+    results = memory.run(rows=20, keyword="parse_loop/ts_datetimes")
+    assert {
+        "parse_loop/ts_datetimes/peak_bytes",
+        "parse_loop/ts_datetimes/retained_bytes",
+    } <= set(results)
+    assert results["parse_loop/ts_datetimes/retained_bytes"] > 0
+
+
+def test_memory_run_of_streams():
+    results = memory.run(rows=20, keyword="aiter_parse/stream")
+    assert {
+        "aiter_parse/stream/peak_bytes",
+        "aiter_parse/stream/retained_bytes",
+    } <= set(results)
@@ -1,5 +1,22 @@
 import pytest
-from task_script_utils.check_file_type import check_file_type
+from task_script_utils.check_file_type import (
+    BINARY,
+    CSV,
+    EMPTY,
+    HDF5,
+    HTML,
+    JSON,
+    OLE,
+    PDF,
+    TEXT,
+    TSV,
+    XLSX,
+    XML,
+    ZIP,
+    check_file_type,
+    check_file_types,
+    sniff_header,
+)
 
 
 def test_check_file_type():
@@ -10,3 +27,61 @@ def test_check_file_type():
         check_file_type("/tetrascience/123456/example-file1.txt", ["xlsx", "csv"])
     with pytest.raises(ValueError):
         check_file_type("", None)
+
+
+header_test_cases = [
+    (b"a,b,c\n1,2,3\n4,5,6\n", CSV),
+    (b"a\tb\n1\t2\n", TSV),
+    ("a,b\nMünchen,2\n".encode("cp1252"), CSV),
+    ("a\tb\n1\t2\n".encode("utf-16"), TSV),
+    (b"\xef\xbb\xbfHeader line\nplain text\n", TEXT),
+    (b' {"a": 1}', JSON),
+    (b'<?xml version="1.0"?><run/>', XML),
+    (b"<!DOCTYPE html><html></html>", HTML),
+    (b"%PDF-1.4\n", PDF),
+    (b"\x89HDF\r\n\x1a\n\x00\x00", HDF5),
+    (b"\x00" * 512 + b"\x89HDF\r\n\x1a\n", HDF5),
+    (b"PK\x03\x04\x14\x00\x00\x00[Content_Types].xml...xl/workbook.xml", XLSX),
+    (b"PK\x03\x04\x14\x00\x00\x00data.bin", ZIP),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1\x00", OLE),
+    (bytes(range(256)), BINARY),
+    (b"", EMPTY),
+]
+
+
+@pytest.mark.parametrize("header, content_type", header_test_cases)
+def test_sniff_header(header, content_type):
+    assert sniff_header(header) == content_type
+
+
+def test_check_file_types(tmp_path):
+    files = {
+        "run.csv": b"a,b\n1,2\n",
+        "renamed.csv": b"%PDF-1.4\n",
+        "empty.csv": b"",
+        "plate.xlsx": b"PK\x03\x04\x14\x00\x00\x00[Content_Types].xml xl/",
+        "notes.txt": b"free text\n",
+        "data.raw": b"\x00\x01",
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_bytes(content)
+    paths = [str(tmp_path / name) for name in files] + [str(tmp_path / "gone.csv")]
+
+    checks = check_file_types(paths, ["csv", "xlsx", "raw"], workers=4)
+    assert [check.path for check in checks] == paths
+    assert [check.valid for check in checks] == [
+        True,
+        False,
+        False,
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert checks[0].content_type == CSV
+    assert checks[1].error == "the content of the csv file is pdf"
+    assert checks[4].extension == "txt" and "expected file type" in checks[4].error
+    assert checks[6].content_type is None and checks[6].error
+    assert check_file_types(paths[:1], "CSV", workers=1) == checks[:1]
+    with pytest.raises(ValueError):
+        check_file_types(paths, None)
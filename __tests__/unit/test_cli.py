@@ -0,0 +1,141 @@
+import csv
+import subprocess
+import sys
+
+import pytest
+
+from task_script_utils.datetime_parser.cli import main
+
+ROWS = [
+    ["id", "start", "end"],
+    ["1", "2021-12-23T12:12:12", "2021-12-23 13:00:00 IST"],
+    ["2", "not a datetime", ""],
+    ["3", "13/01/2021 12:13 PM", "Wednesday, January 13th 2021 12:13:14 PM"],
+    ["4"],
+]
+
+
+@pytest.fixture
+def input_path(tmp_path):
+    path = tmp_path / "input.csv"
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        csv.writer(file).writerows(ROWS)
+    return str(path)
+
+
+def read_rows(path, delimiter=","):
+    with open(path, encoding="utf-8", newline="") as file:
+        return list(csv.reader(file, delimiter=delimiter))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_convert_in_place(input_path, tmp_path, workers):
+    output_path = str(tmp_path / "output.csv")
+    errors_path = str(tmp_path / "errors.csv")
+    args = [input_path, "-o", output_path, "-c", "start", "-c", "2"]
+    args += ["--tz", "IST=+05:30", "--errors-file", errors_path]
+    args += ["--workers", str(workers), "--chunk-size", "2", "-q"]
+    assert main(args) == 0
+
+    assert read_rows(output_path) == [
+        ["id", "start", "end"],
+        ["1", "2021-12-23T12:12:12", "2021-12-23T07:30:00Z"],
+        ["2", "not a datetime", ""],
+        ["3", "2021-01-13T12:13:00", "2021-01-13T12:13:14"],
+        ["4"],
+    ]
+    assert read_rows(errors_path) == [
+        ["row", "column", "value", "error"],
+        ["2", "start", "not a datetime", "InvalidDateError: not a datetime"],
+    ]
+
+
+def test_convert_to_new_columns(input_path, tmp_path, capsys):
+    output_path = str(tmp_path / "output.tsv")
+    tsv_path = str(tmp_path / "input.tsv")
+    with open(tsv_path, "w", encoding="utf-8", newline="") as file:
+        csv.writer(file, delimiter="\t").writerows(read_rows(input_path))
+
+    args = [tsv_path, "-o", output_path, "-c", "start", "--suffix", "_ts"]
+    assert main([*args, "-f", "DD/MM/YYYY hh:mm A"]) == 0
+
+    rows = read_rows(output_path, delimiter="\t")
+    assert rows[0] == ["id", "start", "end", "start_ts"]
+    assert [row[-1] for row in rows[1:]] == [
+        "2021-12-23T12:12:12",
+        "",
+        "2021-01-13T12:13:00",
+        "",
+    ]
+    assert rows[4] == ["4", "", "", ""]
+    assert "4 rows, 3 values, 1 failed" in capsys.readouterr().err
+
+
+def test_new_columns_follow_the_widest_row(tmp_path):
+    input_path = tmp_path / "input.csv"
+    input_path.write_text(
+        "1,2021-12-23T12:12:12\n2,2021-12-24T12:12:12,extra,fields\n3\n",
+        encoding="utf-8",
+    )
+    output_path = str(tmp_path / "output.csv")
+    args = [str(input_path), "-o", output_path, "-c", "1", "--suffix", "_ts", "-q"]
+    assert main([*args, "--no-header"]) == 0
+    assert read_rows(output_path) == [
+        ["1", "2021-12-23T12:12:12", "", "", "2021-12-23T12:12:12"],
+        ["2", "2021-12-24T12:12:12", "extra", "fields", "2021-12-24T12:12:12"],
+        ["3", "", "", "", ""],
+    ]
+
+    # Rows longer than the header
+    input_path.write_text(
+        "id,when\n1,2021-12-23T12:12:12\n2,2021-12-24T12:12:12,extra\n",
+        encoding="utf-8",
+    )
+    args = [str(input_path), "-o", output_path, "-c", "when", "--suffix", "_ts"]
+    assert main([*args, "-q"]) == 0
+    assert read_rows(output_path) == [
+        ["id", "when", "", "when_ts"],
+        ["1", "2021-12-23T12:12:12", "", "2021-12-23T12:12:12"],
+        ["2", "2021-12-24T12:12:12", "extra", "2021-12-24T12:12:12"],
+    ]
+
+
+def test_output_must_not_be_the_input(input_path):
+    for option in ("-o", "--errors-file"):
+        with pytest.raises(SystemExit) as raised:
+            main([input_path, "-c", "start", option, input_path])
+        assert raised.value.code == 2
+    assert read_rows(input_path) == ROWS
+
+
+def test_config_flags(tmp_path):
+    input_path = tmp_path / "input.csv"
+    input_path.write_text("12/11/10 10:20:30\n", encoding="utf-8")
+    output_path = str(tmp_path / "output.csv")
+
+    args = [str(input_path), "-o", output_path, "-c", "0", "--no-header", "-q"]
+    assert main([*args, "--day-first", "--no-year-first"]) == 0
+    assert read_rows(output_path) == [["2010-11-12T10:20:30"]]
+    assert main([*args, "--no-day-first", "--year-first"]) == 0
+    assert read_rows(output_path) == [["2012-11-10T10:20:30"]]
+
+
+def test_stdin_to_stdout():
+    completed = subprocess.run(
+        [sys.executable, "-m", "task_script_utils.datetime_parser", "-c", "when"],
+        input=b"when\n2021-12-23T12:12:12Z\n",
+        capture_output=True,
+        check=True,
+    )
+    assert completed.stdout.splitlines() == [b"when", b"2021-12-23T12:12:12Z"]
+    assert b"1 rows, 1 values, 0 failed" in completed.stderr
+
+
+@pytest.mark.parametrize(
+    "args",
+    [["-c", "missing"], ["-c", "7"], ["-c", "start", "--workers", "0"]],
+)
+def test_invalid_arguments(input_path, args):
+    with pytest.raises(SystemExit) as raised:
+        main([input_path, *args])
+    assert raised.value.code == 2
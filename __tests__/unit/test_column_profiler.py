@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+
+from task_script_utils.column_profiler import (
+    DATETIME,
+    NUMERIC,
+    STRING,
+    profile_column,
+    profile_columns,
+)
+from task_script_utils.datetime_parser import DatetimeConfig, parse
+from task_script_utils.datetime_parser.corpus import CORPUS_CONFIG, generate_corpus
+
+
+def test_numeric_column():
+    profile = profile_column(["1", " 2.5 ", "", "NaN", "-inf", "1e3"] * 10, "od")
+    assert profile.name == "od"
+    assert profile.kind == NUMERIC
+    assert profile.values.dtype == np.float64
+    assert profile.values[:2].tolist() == [1.0, 2.5]
+    assert np.isnan(profile.values[2]) and np.isnan(profile.values[3])
+    assert profile.values[4] == -np.inf
+    assert (profile.count, profile.invalid) == (50, 0)
+
+
+def test_booleans_are_not_numbers():
+    profile = profile_column([True, False] * 20)
+    assert profile.kind == STRING
+    assert profile.values.tolist() == [True, False] * 20
+
+
+def test_sampling_stops_early():
+    values = [str(index) for index in range(1000)]
+    profile = profile_column(values, min_sample=20)
+    assert profile.kind == NUMERIC
+    assert profile.sampled == 20
+    assert profile.values[999] == 999.0
+
+
+def test_datetime_column_infers_format():
+    values = [f"2021-12-23 12:12:{second:02d}.{second:03d}" for second in range(60)]
+    profile = profile_column(values)
+    assert profile.kind == DATETIME
+    assert profile.format == "YYYY-MM-DD HH:mm:ss.SSS"
+    assert profile.values.dtype == np.dtype("datetime64[ns]")
+    assert str(profile.values[1]) == "2021-12-23T12:12:01.001000000"
+
+
+def test_datetime_format_follows_config():
+    values = ["13/11/2010 10:20", "01/02/2010 10:20"] * 20
+    profile = profile_column(values, config=DatetimeConfig(day_first=True))
+    assert profile.format == "DD/MM/YYYY HH:mm"
+    assert str(profile.values[1]) == "2010-02-01T10:20:00.000000000"
+
+
+@pytest.mark.parametrize(
+    "values, fmt, expected",
+    [
+        ([f"202112{day:02d}" for day in range(1, 29)], "YYYYMMDD", "2021-12-02"),
+        (
+            [f"20211223{hour:02d}1212" for hour in range(24)],
+            "YYYYMMDDHHmmss",
+            "2021-12-23T01:12:12",
+        ),
+    ],
+)
+def test_compact_datetime_column(values, fmt, expected):
+    profile = profile_column(values)
+    assert profile.kind == DATETIME
+    assert profile.format == fmt
+    assert str(profile.values[1]).startswith(expected)
+    assert profile.invalid == 0
+
+
+def test_digit_columns_that_are_not_dates():
+    values = [str(12345678 + index) for index in range(40)]
+    profile = profile_column(values)
+    assert profile.kind == NUMERIC
+    assert profile.values[0] == 12345678.0
+
+    # Numbers that happen to be valid dates stay numbers in a numeric column
+    values = ["20211223"] + [str(98765432 + index) for index in range(39)]
+    profile = profile_column(values)
+    assert profile.kind == NUMERIC
+    assert profile.values[0] == 20211223.0
+    assert profile.invalid == 0
+
+
+def test_mixed_layouts_have_no_format():
+    values = [entry.datetime_str for entry in generate_corpus(200, seed=5)]
+    profile = profile_column(values, config=CORPUS_CONFIG)
+    assert profile.kind == DATETIME
+    assert profile.format is None
+    assert profile.invalid == 0
+    expected = parse(values[7], config=CORPUS_CONFIG).tsformat().rstrip("Z")
+    assert str(profile.values[7]).startswith(expected[:19])
+
+
+def test_invalid_cells_are_missing():
+    values = ["2021-12-23T12:12:12Z"] * 99 + ["not a date"]
+    profile = profile_column(values)
+    assert profile.kind == DATETIME
+    assert profile.invalid == 1
+    assert np.isnat(profile.values[99])
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["1"] * 30 + ["a"] * 10,
+        ["x", "y", "z"] * 10,
+        ["2021-12-23", "1.5"] * 20,
+    ],
+)
+def test_string_columns(values):
+    profile = profile_column(values)
+    assert profile.kind == STRING
+    assert profile.values.dtype == object
+    assert profile.values.tolist() == values
+    assert profile.format is None
+
+
+def test_profile_columns():
+    header = ["time", "value", "sample"]
+    rows = [
+        [f"2021-01-{day:02d} 10:00:00", str(day), f"S{day}"] for day in range(1, 29)
+    ]
+    profiles = profile_columns(dict(zip(header, zip(*rows))))
+    assert [profiles[name].kind for name in header] == [DATETIME, NUMERIC, STRING]
+    assert profiles["time"].format == "YYYY-MM-DD HH:mm:ss"
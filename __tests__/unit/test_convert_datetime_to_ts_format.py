@@ -1,8 +1,11 @@
 from dateutil import tz
 import pytest
 from task_script_utils.convert_datetime_to_ts_format import (
+    _thread_date_data_parsers,
     convert_datetime_to_ts_format,
+    convert_datetimes_to_ts_format,
 )
+from task_script_utils.datetime_parser import DatetimeConfig
 
 
 def test_no_timezone():
@@ -75,3 +78,80 @@ def test_YDM_order():
     ]
     for raw, format, expect in raw_format_expect:
         assert convert_datetime_to_ts_format(raw, format) == expect
+
+
+batch_test_cases = [
+    # raws, datetime_format, timezone
+    (["2019-07-17 11:21:00", "2020-06-18 13:17:57.54036"], "", ""),
+    (["2020-03-06T17:19:45.706000-05:00", "2020-04-30T20:27:41.000Z"], "", ""),
+    (["2019-07-17 11:21:00", "2020-04-30T20:27:41.000Z"], "", "GMT+3"),
+    (["2019-07-17 11:21:00"], "", tz.tzoffset("GMT", -5 * 60 * 60)),
+    (["2019-07-17 11:21:00"], "", "Not/A_Timezone"),
+    (
+        ["20200512T235847.070Z", "20211231T000000.999Z"],
+        "YYYYMMDDTHHmmss.SZ",
+        "",
+    ),
+    (["2020-03-06T17:19:45.706000-05:00"], "YYYY-DD-MMTHH:mm:ss.SZZ", "GMT+5"),
+    (["2020-03-06 17:19:45"], "YYYY-MM-DD HH:mm:ss", tz.tzutc()),
+]
+
+
+@pytest.mark.parametrize("raws, datetime_format, timezone", batch_test_cases)
+def test_batch_matches_single_conversion(raws, datetime_format, timezone):
+    expected = [
+        convert_datetime_to_ts_format(raw, datetime_format, timezone) for raw in raws
+    ]
+    assert convert_datetimes_to_ts_format(raws, datetime_format, timezone) == expected
+
+
+def test_batch_unreadable_format():
+    with pytest.raises(ValueError):
+        convert_datetimes_to_ts_format(["2019-07-17 11:21:00", "20200512T235847.070Z"])
+
+
+configured_dateparser_test_cases = [
+    # raw, expect
+    ("2019-07-17 11:21:00", "2019-07-17T11:21:00.000"),
+    ("2020-06-18 13:17:57.54036", "2020-06-18T13:17:57.540"),
+    ("2020-03-06T17:19:45.706000-05:00", "2020-03-06T22:19:45.706Z"),
+    ("July 17, 2019 11:21 AM", "2019-07-17T11:21:00.000"),
+]
+
+
+@pytest.mark.parametrize("raw, expect", configured_dateparser_test_cases)
+def test_configured_dateparser(raw, expect):
+    assert convert_datetime_to_ts_format(raw, languages=["en"]) == expect
+    assert (
+        convert_datetime_to_ts_format(raw, datetime_config=DatetimeConfig()) == expect
+    )
+    assert convert_datetimes_to_ts_format(
+        [raw], languages=["en"], datetime_config=DatetimeConfig()
+    ) == [expect]
+
+
+def test_dateparser_settings():
+    settings = {"TIMEZONE": "UTC", "RETURN_AS_TIMEZONE_AWARE": True}
+    assert (
+        convert_datetime_to_ts_format(
+            "2019-07-17 11:21:00", dateparser_settings=settings
+        )
+        == "2019-07-17T11:21:00.000Z"
+    )
+
+
+def test_configured_dateparser_is_reused():
+    convert_datetime_to_ts_format("2019-07-17 11:21:00", locales=["en-GB"])
+    cached_parsers = dict(_thread_date_data_parsers())
+    convert_datetime_to_ts_format("2019-07-17 11:21:00", locales=["en-GB"])
+    assert _thread_date_data_parsers() == cached_parsers
+
+
+def test_datetime_config_falls_back_to_dateparser():
+    # Ambiguous for the datetime parser, dateparser assumes month first
+    assert (
+        convert_datetime_to_ts_format(
+            "11-12-2022 10:00:00", datetime_config=DatetimeConfig()
+        )
+        == "2022-11-12T10:00:00.000"
+    )
@@ -0,0 +1,51 @@
+import pytest
+
+from task_script_utils.datetime_parser import parse
+from task_script_utils.datetime_parser.corpus import (
+    CORPUS_CONFIG,
+    LAYOUTS,
+    generate_corpus,
+    read_corpus,
+    write_corpus,
+)
+
+
+def test_corpus_is_deterministic():
+    first = list(generate_corpus(50, seed=3))
+    assert first == list(generate_corpus(50, seed=3))
+    assert first != list(generate_corpus(50, seed=4))
+
+
+@pytest.mark.parametrize("layout", sorted(LAYOUTS))
+def test_expected_tsformat(layout):
+    for entry in generate_corpus(40, seed=11, layouts=[layout]):
+        assert entry.layout == layout
+        parsed = parse(entry.datetime_str, config=CORPUS_CONFIG)
+        assert parsed.tsformat() == entry.expected, entry.datetime_str
+
+
+def test_corpus_covers_timezones_and_fractions():
+    entries = list(generate_corpus(500, seed=0))
+    assert {entry.layout for entry in entries} == set(LAYOUTS)
+    strings = [entry.datetime_str for entry in entries]
+    assert any(value.endswith(" America/Chicago") for value in strings)
+    assert any(value.endswith(" IST") for value in strings)
+    assert any(value.endswith("Z") for value in strings)
+    assert any("." in entry.expected for entry in entries)
+    assert any(not entry.expected.endswith("Z") for entry in entries)
+
+
+def test_endless_corpus():
+    corpus = generate_corpus(seed=1)
+    assert len([next(corpus) for _ in range(10)]) == 10
+
+
+def test_unknown_layout():
+    with pytest.raises(ValueError):
+        next(generate_corpus(1, layouts=["iso", "julian"]))
+
+
+def test_write_and_read_corpus(tmp_path):
+    path = str(tmp_path / "corpus.tsv")
+    assert write_corpus(path, 100, seed=5) == 100
+    assert list(read_corpus(path)) == list(generate_corpus(100, seed=5))
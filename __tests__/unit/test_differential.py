@@ -0,0 +1,111 @@
+import pytest
+
+from task_script_utils.datetime_parser import instrumentation, parser_cache
+from task_script_utils.datetime_parser.corpus import CORPUS_CONFIG, generate_corpus
+from task_script_utils.datetime_parser.differential import (
+    COERCED,
+    PATHS,
+    Outcome,
+    _parse_each,
+    _path_parsers,
+    _run_path,
+    reference_path,
+    run_differential,
+)
+from task_script_utils.datetime_parser.utils import fixed_width_formats
+
+FORMATS = ("YYYY-MM-DD HH:mm:ss.SSSSSS Z", "YYYYMMDDHHmmss", "YYYY-MM-DD HH:mm:ss")
+FORMATTED_VALUES = [
+    "2021-12-23 12:12:12.123456 +05:30",
+    "20211223121212",
+    "2021-12-23 12:12:12",
+    "2021-12-23 2:12:12",
+    "2021-1-23 12:12:12",
+    "2021-02-30 12:12:12",
+]
+
+
+def test_corpus_paths_match_reference():
+    values = [entry.datetime_str for entry in generate_corpus(60, seed=9)]
+    report = run_differential([*values, "not a datetime"], config=CORPUS_CONFIG)
+
+    assert report.ok, report.to_dict()["mismatches"]
+    assert set(report.paths) == set(PATHS)
+    assert report.reference.count == 61
+    assert all(result.throughput > 0 for result in report.paths.values())
+
+
+def test_fixed_width_formats_match_reference():
+    report = run_differential(FORMATTED_VALUES, FORMATS, paths=["parse"])
+    assert report.ok
+    assert report.to_dict()["mismatch_counts"] == {"parse": 0}
+
+
+def test_mismatches_are_reported():
+    reference = [
+        Outcome("2021-12-23T12:12:12", "2021-12-23T12:12:12", None),
+        Outcome(None, None, "InvalidDateError"),
+    ]
+
+    def parse_values(values, formats, config):
+        return [
+            Outcome("2021-12-23T12:12:13", "2021-12-23T12:12:13", None),
+            Outcome(None, None, COERCED),
+        ]
+
+    result, _ = _run_path(
+        "broken", parse_values, ["a", "b"], (), CORPUS_CONFIG, reference
+    )
+    assert result.mismatch_count == 1
+    (mismatch,) = result.mismatches
+    assert mismatch.value == "a"
+    assert mismatch.expected == reference[0]
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_batch_paths_name_errors(path):
+    values = ["2021-12-23T12:12:12", "not a datetime", "2021-02-30 12:12:12"]
+    expected = _parse_each(values, (), CORPUS_CONFIG)
+    _, outcomes = _run_path(
+        path, _path_parsers(2)[path], values, (), CORPUS_CONFIG, expected
+    )
+    assert outcomes == expected
+    assert all(outcome.error != COERCED for outcome in outcomes)
+
+
+def test_coerced_error_types_are_compared():
+    reference = [Outcome(None, None, "InvalidDateError")]
+
+    def parse_values(values, formats, config):
+        if instrumentation.ENABLED:
+            for value in values:
+                instrumentation.emit(
+                    instrumentation.ParseEvent(value, None, 0, {}, 0, "ValueError")
+                )
+        return [Outcome(None, None, COERCED) for _ in values]
+
+    result, _ = _run_path("broken", parse_values, ["a"], (), CORPUS_CONFIG, reference)
+    assert result.mismatch_count == 1
+    assert result.mismatches[0].actual == Outcome(None, None, "ValueError")
+
+
+def test_coerced_outcome_matches_errors_only():
+    coerced = Outcome(None, None, COERCED)
+    assert coerced.matches(Outcome(None, None, "InvalidDateError"))
+    assert not coerced.matches(Outcome("2021", "2021", None))
+    assert not Outcome(None, None, "ValueError").matches(
+        Outcome(None, None, "InvalidDateError")
+    )
+
+
+def test_reference_path_switches():
+    with reference_path():
+        assert not fixed_width_formats.ENABLED
+        assert not parser_cache.ORDER_LONG_FORMATS
+    assert fixed_width_formats.ENABLED
+    assert parser_cache.ORDER_LONG_FORMATS
+
+
+def test_unknown_path():
+    with pytest.raises(ValueError):
+        run_differential(["2021-12-23T12:12:12"], paths=["vectorized"])
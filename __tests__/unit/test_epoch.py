@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from task_script_utils.datetime_parser.batch import FAILED, decode_ts_datetime
+from task_script_utils.datetime_parser.epoch import (
+    MICROSECONDS,
+    MILLISECONDS,
+    NANOSECONDS,
+    SECONDS,
+    detect_epoch_unit,
+    epoch_records,
+    epoch_tsformats,
+)
+from task_script_utils.datetime_parser.parser_exceptions import DatetimeParserError
+
+epoch_test_cases = [
+    (1639745532, SECONDS, "2021-12-17T12:52:12Z"),
+    ("1639745532", SECONDS, "2021-12-17T12:52:12Z"),
+    (" 1639745532.50 ", SECONDS, "2021-12-17T12:52:12.50Z"),
+    ("1639745532.123456789", SECONDS, "2021-12-17T12:52:12.123456789Z"),
+    (1639745532.25, SECONDS, "2021-12-17T12:52:12.25Z"),
+    ("1.6e9", SECONDS, "2020-09-13T12:26:40Z"),
+    ("-1.5", SECONDS, "1969-12-31T23:59:58.5Z"),
+    (0, SECONDS, "1970-01-01T00:00:00Z"),
+    (1639745532123, MILLISECONDS, "2021-12-17T12:52:12.123Z"),
+    ("1639745532000.5", MILLISECONDS, "2021-12-17T12:52:12.0005Z"),
+    (1639745532123456, MICROSECONDS, "2021-12-17T12:52:12.123456Z"),
+    (1639745532123456789, NANOSECONDS, "2021-12-17T12:52:12.123456789Z"),
+    (-1, NANOSECONDS, "1969-12-31T23:59:59.999999999Z"),
+]
+
+
+@pytest.mark.parametrize("value, unit, expected", epoch_test_cases)
+def test_epoch_tsformats(value, unit, expected):
+    assert epoch_tsformats([value], unit) == [expected]
+    record = epoch_records([value], unit)[0].tolist()
+    assert decode_ts_datetime(record).tsformat() == expected
+
+
+def test_units_are_detected():
+    values = np.array([1639745532123, 1639745533123, 1639745534123])
+    assert detect_epoch_unit(values) == MILLISECONDS
+    assert epoch_tsformats(values) == [
+        "2021-12-17T12:52:12.123Z",
+        "2021-12-17T12:52:13.123Z",
+        "2021-12-17T12:52:14.123Z",
+    ]
+
+
+def test_invalid_epochs():
+    values = ["1639745532", "x", None, True, "nan", "1e20", "1.0000000000000000001"]
+    records = epoch_records(values, SECONDS, errors="coerce")
+    assert records["status"].tolist() == [0] + [FAILED] * 6
+    assert epoch_tsformats(values, SECONDS, errors="coerce")[1:] == [None] * 6
+    with pytest.raises(DatetimeParserError, match="'x'"):
+        epoch_records(values, SECONDS)
+    with pytest.raises(ValueError):
+        epoch_records(values, "minutes")
+    with pytest.raises(ValueError):
+        epoch_records(values, SECONDS, errors="ignore")
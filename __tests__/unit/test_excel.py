@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from task_script_utils.datetime_parser import DatetimeConfig, parse
+from task_script_utils.datetime_parser.batch import FAILED, PARSED
+from task_script_utils.datetime_parser.excel import (
+    EXCEL_1904,
+    excel_datetimes,
+    excel_records,
+    excel_tsformats,
+)
+from task_script_utils.datetime_parser.parser_exceptions import DatetimeParserError
+
+excel_1900_test_cases = [
+    (0, "1899-12-31T00:00:00"),
+    (0.75, "1899-12-31T18:00:00"),
+    (1, "1900-01-01T00:00:00"),
+    (59.5, "1900-02-28T12:00:00"),
+    (61, "1900-03-01T00:00:00"),
+    (44562, "2022-01-01T00:00:00"),
+    ("44562.25", "2022-01-01T06:00:00"),
+    (44562.5000000000579, "2022-01-01T12:00:00.000005"),
+    (1.9999999999999, "1900-01-02T00:00:00"),
+]
+
+
+@pytest.mark.parametrize("serial, expected", excel_1900_test_cases)
+def test_excel_1900(serial, expected):
+    assert excel_tsformats([serial]) == [expected]
+
+
+def test_excel_1904():
+    assert excel_tsformats(np.array([0, 1462, 43100.5]), EXCEL_1904) == [
+        "1904-01-01T00:00:00",
+        "1908-01-02T00:00:00",
+        "2022-01-01T12:00:00",
+    ]
+
+
+def test_timezones():
+    assert excel_tsformats([44562.5], tz="+05:30") == ["2022-01-01T06:30:00Z"]
+    # 2021-11-07 01:30, repeated in Chicago
+    values = [44507.0625]
+    assert excel_tsformats(values, tz="America/Chicago") == ["2021-11-07T06:30:00Z"]
+    assert excel_tsformats(values, tz="America/Chicago", fold=1) == [
+        "2021-11-07T07:30:00Z"
+    ]
+    parsed = parse("2021-11-07 01:30:00 America/Chicago", config=DatetimeConfig(fold=0))
+    (converted,) = excel_datetimes(values, tz="America/Chicago")
+    assert converted.isoformat() == parsed.isoformat()
+    assert converted.tsformat() == parsed.tsformat()
+    with pytest.raises(ValueError):
+        excel_records(values, tz="Not/A_Timezone")
+
+
+def test_invalid_serials():
+    values = [44562, 60, 60.5, -1, "x", None, np.nan, 3e6]
+    records = excel_records(values, errors="coerce")
+    assert records["status"].tolist() == [PARSED] + [FAILED] * 7
+    assert excel_datetimes(values, errors="coerce")[1:] == [None] * 7
+    with pytest.raises(DatetimeParserError, match="60"):
+        excel_records(values)
+    with pytest.raises(ValueError):
+        excel_records(values, date_system="1901")
+
+    # The 1904 system reaches 9999-12-31 four years earlier
+    values = [2957003, 2957004, 2958000]
+    assert excel_tsformats(values, EXCEL_1904, errors="coerce") == [
+        "9999-12-31T00:00:00",
+        None,
+        None,
+    ]
+    assert excel_datetimes(values, EXCEL_1904, errors="coerce")[1:] == [None] * 2
+    with pytest.raises(DatetimeParserError, match="2957004"):
+        excel_records(values, EXCEL_1904)
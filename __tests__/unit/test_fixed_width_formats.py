@@ -0,0 +1,71 @@
+import pytest
+from pendulum import now
+from task_script_utils.datetime_parser.utils.fixed_width_formats import (
+    compile_fixed_width_format,
+)
+from task_script_utils.datetime_parser.utils.manipulation import _formatter
+
+fixed_width_test_cases = [
+    # input_, format_
+    ("2021-12-23 12:12:12.123456", "YYYY-MM-DD HH:mm:ss.SSSSSS"),
+    ("2021-12-23T12:12:12.1", "YYYY-MM-DDTHH:mm:ss.S"),
+    ("23/12/2021 12:12", "DD/MM/YYYY HH:mm"),
+    ("20211223121212", "YYYYMMDDHHmmss"),
+    ("21-12-23 12:12:12", "YY-MM-DD HH:mm:ss"),
+    ("2021-12-23 11:12:12", "YYYY-MM-DD hh:mm:ss"),
+    ("2021-12-23 12:12:12 +05:30", "YYYY-MM-DD HH:mm:ss Z"),
+    ("2021-12-23 12:12:12 -0530", "YYYY-MM-DD HH:mm:ss ZZ"),
+    ("2021-12-23 12:12:12.000100+00:00", "YYYY-MM-DD HH:mm:ss.SSSSSSZ"),
+    ("2021-12", "YYYY-MM"),
+    ("2021", "YYYY"),
+]
+
+variable_width_formats = [
+    "YYYY-M-D HH:mm:ss",
+    "MMMM Do YYYY hh:mm:ss A",
+    "YYYY-MM-DD HH:mm:ss z",
+    "HH:mm:ss",
+    "YYYY-MM-DD [at] HH:mm",
+    "YYYY-MM-DD HH:mm:ss.SSSSSSSSS",
+    "YYYY-MM-DD HH:mm:ssSSSSSSYYYY",
+]
+
+fallback_test_cases = [
+    # Valid for pendulum but not laid out with fixed widths
+    ("2021-1-5 12:12:12", "YYYY-MM-DD HH:mm:ss"),
+    ("2021-12-23 12:12:12.1234567", "YYYY-MM-DD HH:mm:ss.SSSSSS"),
+    ("2021-12-23 12:12:12 +0530", "YYYY-MM-DD HH:mm:ss Z"),
+    ("2021-12-23 12:12:12", "YYYY-MM-DDTHH:mm:ss"),
+    ("2021-12-2a 12:12:12", "YYYY-MM-DD HH:mm:ss"),
+]
+
+
+@pytest.mark.parametrize("input_, format_", fixed_width_test_cases)
+def test_fixed_width_parser_matches_formatter(input_, format_):
+    """Compiled parser must return the same parts as FractionalSecondsFormatter"""
+    parse_fixed_width = compile_fixed_width_format(format_)
+    assert parse_fixed_width is not None
+    assert parse_fixed_width(input_) == _formatter.parse(input_, format_, now())
+
+
+@pytest.mark.parametrize("format_", variable_width_formats)
+def test_variable_width_formats_are_not_compiled(format_):
+    assert compile_fixed_width_format(format_) is None
+
+
+@pytest.mark.parametrize("input_, format_", fallback_test_cases)
+def test_fixed_width_parser_falls_back(input_, format_):
+    assert compile_fixed_width_format(format_)(input_) is None
+
+
+def test_fixed_width_parser_invalid_values():
+    parse_fixed_width = compile_fixed_width_format("YYYY-MM-DD hh:mm:ss")
+    with pytest.raises(ValueError):
+        parse_fixed_width("2021-12-23 13:12:12")
+    with pytest.raises(ValueError):
+        _formatter.parse("2021-12-23 13:12:12", "YYYY-MM-DD hh:mm:ss", now())
+
+
+def test_compiled_formats_are_cached():
+    format_ = "YYYY-MM-DD HH:mm:ss"
+    assert compile_fixed_width_format(format_) is compile_fixed_width_format(format_)
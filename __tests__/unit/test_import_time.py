@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_DEPENDENCIES = ("arrow", "dateparser", "dateutil", "pendulum", "pydash", "numpy")
+
+public_module_test_cases = [
+    # module, dependencies allowed to load on import
+    ("task_script_utils.is_number", ()),
+    ("task_script_utils.check_file_type", ()),
+    ("task_script_utils.column_profiler", ()),
+    ("task_script_utils.convert_datetime_to_ts_format", ()),
+    ("task_script_utils.datetime_parser", ()),
+    ("task_script_utils.datetime_parser.datetime_config", ()),
+    ("task_script_utils.datetime_parser.parser_exceptions", ()),
+    ("task_script_utils.datetime_parser.parser", ("dateutil", "pendulum")),
+]
+
+
+def import_time(module: str) -> dict:
+    """Import `module` in a fresh interpreter with `-X importtime` and
+    return a dict mapping every imported module to its cumulative time in us.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            timings[name.strip()] = int(cumulative)
+    return timings
+
+
+@pytest.mark.parametrize("module, allowed", public_module_test_cases)
+def test_import_time(module, allowed, record_property):
+    """Heavy dependencies must only be loaded once they are used"""
+    timings = import_time(module)
+    record_property("import_time_us", timings[module])
+
+    loaded = {name.split(".")[0] for name in timings}
+    unexpected = [dep for dep in HEAVY_DEPENDENCIES if dep in loaded]
+    assert set(unexpected) <= set(allowed)
+
+
+def test_lazy_attributes():
+    from task_script_utils import datetime_parser
+
+    assert callable(datetime_parser.parse)
+    assert datetime_parser.DatetimeConfig().day_first is None
+    with pytest.raises(AttributeError):
+        datetime_parser.not_an_attribute  # pylint: disable=W0104
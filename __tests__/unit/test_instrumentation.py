@@ -0,0 +1,182 @@
+import pytest
+
+from task_script_utils.datetime_parser import DatetimeConfig, parse, parse_many
+from task_script_utils.datetime_parser import instrumentation
+from task_script_utils.datetime_parser.instrumentation import (
+    BatchEvent,
+    FormatEvent,
+    ParseEvent,
+    instrument,
+)
+from task_script_utils.datetime_parser.parser_exceptions import (
+    AmbiguousFoldError,
+    DatetimeParserError,
+)
+
+FORMATS = ("DD/MM/YYYY HH:mm", "YYYY-MM-DD HH:mm:ss")
+
+parse_event_test_cases = [
+    # datetime_str, formats, stage, stages that ran
+    ("2021-12-23 12:12:12", FORMATS, "formats", ["formats", "fold"]),
+    ("2021-12-23T12:12:12", (), "short", ["short", "fold"]),
+    ("2021-12-23T12:12:12", FORMATS, "short", ["formats", "short", "fold"]),
+    ("January 13th 2021 12:13:14 PM", (), "long", ["short", "long", "fold"]),
+]
+
+
+@pytest.mark.parametrize("datetime_str, formats, stage, stages", parse_event_test_cases)
+def test_parse_event(datetime_str, formats, stage, stages):
+    events = []
+    with instrument(events.append):
+        parse(datetime_str, formats)
+
+    (event,) = events
+    assert isinstance(event, ParseEvent)
+    assert event.datetime_str == datetime_str
+    assert event.stage == stage
+    assert event.error is None
+    assert list(event.stage_ns) == stages
+    assert all(ns >= 0 for ns in event.stage_ns.values())
+    assert event.total_ns >= sum(event.stage_ns.values())
+
+
+def test_format_attempts():
+    events = []
+    with instrument(events.append):
+        parse("2021-12-23 12:12:12", FORMATS)
+        parse("23/12/2021 12:12", FORMATS)
+        parse("2021-12-23T12:12:12", FORMATS)
+        parse(
+            "2021-12-23 12:12:12",
+            FORMATS,
+            DatetimeConfig(require_unambiguous_formats=True),
+        )
+        parse("January 13th 2021 12:13:14 PM")
+        parse("2021-12-23T12:12:12")
+    # The short stage tries one format built from the matched tokens
+    assert [event.attempts for event in events[:4]] == [2, 1, 3, 2]
+    assert events[4].attempts >= 1
+    assert events[5].attempts == 1
+
+
+def test_failed_parse_event():
+    events = []
+    with instrument(events.append) as summary:
+        with pytest.raises(DatetimeParserError):
+            parse("not a datetime")
+        with pytest.raises(AmbiguousFoldError):
+            parse("2021-11-07 01:30:00 America/Chicago")
+
+    assert [event.error for event in events] == [
+        "InvalidDateError",
+        "AmbiguousFoldError",
+    ]
+    assert [event.stage for event in events] == [None, None]
+    assert summary.to_dict()["errors"] == {
+        "InvalidDateError": 1,
+        "AmbiguousFoldError": 1,
+    }
+
+
+def test_summary():
+    with instrument() as summary:
+        parse("2021-12-23 12:12:12", FORMATS)
+        parse("2021-12-23T12:12:12")
+        parse("2021-12-23T12:12:13")
+
+    summary = summary.to_dict()
+    assert summary["count"] == 3
+    assert summary["stages"] == {"formats": 1, "short": 2}
+    assert summary["errors"] == {}
+    assert summary["attempts"] == 4
+    assert set(summary["stage_ns"]) == {"formats", "short", "fold"}
+    assert summary["total_ns"] > 0
+    assert summary["formatted"] == 0
+
+
+def test_format_events():
+    parsed = parse("2021-12-23 12:12:12 America/Chicago")
+    events = []
+    with instrument(events.append) as summary:
+        parsed.tsformat()
+        parsed.isoformat()
+
+    assert [event.method for event in events] == ["tsformat", "isoformat"]
+    assert all(isinstance(event, FormatEvent) for event in events)
+    summary = summary.to_dict()
+    assert summary["count"] == 0
+    assert summary["formatted"] == 2
+    assert summary["stage_ns"]["formatting"] == sum(e.total_ns for e in events)
+
+
+def test_parse_does_not_emit_format_events():
+    events = []
+    with instrument(events.append):
+        parse("2021-11-07 01:30:00 America/Chicago", config=DatetimeConfig(fold=0))
+        config = DatetimeConfig(require_unambiguous_formats=True)
+        parse(
+            "2021-12-23 12:12:12",
+            ("YYYY-MM-DD HH:mm:ss", "YYYY-MM-DD H:mm:ss"),
+            config,
+        )
+    assert [type(event) for event in events] == [ParseEvent, ParseEvent]
+
+
+@pytest.mark.parametrize("workers, executor", [(1, "process"), (2, "thread")])
+def test_batch_event(workers, executor):
+    events = []
+    values = ["2021-12-23T12:12:12", "not a datetime", "2021-12-23 12:12:12"]
+    with instrument(events.append):
+        parse_many(values, workers=workers, executor=executor, errors="coerce")
+
+    parse_events = [event for event in events if isinstance(event, ParseEvent)]
+    assert len(parse_events) == len(values)
+    (batch_event,) = [event for event in events if isinstance(event, BatchEvent)]
+    assert batch_event.count == 3
+    assert batch_event.failures == 1
+    assert batch_event.workers == workers
+    assert batch_event.error is None
+
+
+def test_batch_event_error():
+    events = []
+    with instrument(events.append):
+        with pytest.raises(DatetimeParserError):
+            parse_many(["not a datetime"])
+    assert events[-1].error == "InvalidDateError"
+
+
+def test_process_workers_only_emit_batch_events():
+    events = []
+    with instrument(events.append):
+        parse_many(["2021-12-23T12:12:12"] * 4, workers=2)
+    assert [type(event) for event in events] == [BatchEvent]
+
+    # Values that fail in the workers are parsed again in the parent
+    events = []
+    with instrument(events.append):
+        parse_many(["2021-12-23T12:12:12", "ERROR"], workers=2, errors="coerce")
+    assert [type(event) for event in events] == [ParseEvent, BatchEvent]
+    assert events[0].datetime_str == "ERROR"
+
+
+@pytest.mark.parametrize("workers, executor", [(1, "process"), (2, "thread")])
+def test_parse_many_emits_parse_events(workers, executor):
+    events = []
+    values = ["2021-12-23T12:12:12"] * 4
+    with instrument(events.append):
+        parse_many(values, workers=workers, executor=executor)
+    assert [type(event) for event in events] == [ParseEvent] * 4 + [BatchEvent]
+
+
+def test_hooks_enable_instrumentation():
+    assert not instrumentation.ENABLED
+    with instrument():
+        assert instrumentation.ENABLED
+        with instrument():
+            assert instrumentation.ENABLED
+        assert instrumentation.ENABLED
+    assert not instrumentation.ENABLED
+
+    with pytest.raises(ValueError):
+        instrumentation.remove_hook(print)
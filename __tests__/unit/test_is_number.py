@@ -1,4 +1,6 @@
-from task_script_utils.is_number import isnumber
+import numpy as np
+
+from task_script_utils.is_number import isnumber, isnumber_many, to_numeric
 
 
 def test_is_number():
@@ -8,3 +10,73 @@ def test_is_number():
 
     assert not isnumber(True)
     assert not isnumber("cheese")
+
+
+edge_cases = [
+    " 1.5 ",
+    "1.5\n",
+    "+.5",
+    "5.",
+    "1_000",
+    "1e5",
+    "1.e5",
+    "NaN",
+    "-inf",
+    "Infinity",
+    "１２",
+    "",
+    " ",
+    ".",
+    "1e",
+    "0x10",
+    "1__0",
+    "_1",
+    "1_",
+    "+-1",
+    "infinit",
+    "nan(1)",
+    "1 1",
+    "cheese",
+    True,
+    False,
+    b"1",
+    3,
+    2.5,
+]
+
+
+def test_to_numeric_matches_isnumber():
+    mask, numbers = to_numeric(edge_cases)
+    assert mask.tolist() == [isnumber(value) for value in edge_cases]
+    for value, is_number, number in zip(edge_cases, mask, numbers):
+        if is_number and value != "NaN":
+            assert number == float(value)
+        else:
+            assert np.isnan(number)
+
+
+def test_to_numeric_chunks():
+    values = [str(index) for index in range(3000)]
+    values[2500] = "x"
+    mask, numbers = to_numeric(values)
+    assert mask.sum() == 2999 and not mask[2500]
+    assert numbers[2999] == 2999.0 and np.isnan(numbers[2500])
+
+
+def test_to_numeric_arrays():
+    mask, numbers = to_numeric(np.array([" 1", "nan", "x"]))
+    assert mask.tolist() == [True, True, False]
+    assert numbers[0] == 1.0
+    mask, numbers = to_numeric(np.arange(3))
+    assert mask.all() and numbers.dtype == np.float64
+    mask, numbers = to_numeric(np.array([True, False]))
+    assert not mask.any() and np.isnan(numbers).all()
+
+
+def test_isnumber_many():
+    assert isnumber_many(["1", None, True, "inf"]).tolist() == [
+        True,
+        False,
+        False,
+        True,
+    ]
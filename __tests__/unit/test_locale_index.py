@@ -0,0 +1,35 @@
+import pytest
+from task_script_utils.datetime_parser.locale_index import (
+    LocaleName,
+    get_locale_index,
+)
+
+
+def test_english_index():
+    index = get_locale_index(("en",))
+    assert index.match_month("May") == LocaleName("en", "MMMM", 5)
+    assert index.match_month("Dec") == LocaleName("en", "MMM", 12)
+    assert index.match_day("Sunday") == LocaleName("en", "dddd", 0)
+    assert index.match_day("Sun") == LocaleName("en", "ddd", 0)
+    assert index.match_day("Su") == LocaleName("en", "dd", 0)
+    assert index.match_month("may") is None
+    assert index.match_month("Mai") is None
+
+
+def test_multi_locale_index():
+    index = get_locale_index(("en", "de", "fr"))
+    assert index.match_month("April") == LocaleName("en", "MMMM", 4)
+    assert index.match_month("April", locale="de") == LocaleName("de", "MMMM", 4)
+    assert index.match_month("Mai") == LocaleName("de", "MMMM", 5)
+    assert index.match_month("mai") == LocaleName("fr", "MMMM", 5)
+    assert index.match_day("Montag") == LocaleName("de", "dddd", 1)
+    assert index.match_month("Mai", locale="fr") is None
+
+
+def test_locale_index_is_cached():
+    assert get_locale_index(("en", "de")) is get_locale_index(("en", "de"))
+
+
+def test_unknown_locale():
+    with pytest.raises(ValueError):
+        get_locale_index(("xx",))
@@ -36,3 +36,35 @@ def test_long_datetime_info(input_, expected):
         result = None
 
     assert result == expected
+
+
+multi_locale_long_datetime_test_cases = {
+    "Sonntag, Mai 26 2013 12:12:12": "2013-05-26T12:12:12",
+    "So., Dez. 22 2013 12:12:12": "2013-12-22T12:12:12",
+    "dimanche, mai 26 2013 12:12:12.5 +02:00": "2013-05-26T12:12:12.5+02:00",
+    "décembre 22 2013 12:12:12": "2013-12-22T12:12:12",
+    "Sunday, May 26th 2013 12:12:12 AM Asia/Kolkata": "2013-05-26T00:12:12+05:30",
+    # Weekday and month from different locales
+    "Sonntag, May 26 2013 12:12:12": None,
+}
+
+
+@pytest.mark.parametrize(
+    "input_, expected", multi_locale_long_datetime_test_cases.items()
+)
+def test_long_datetime_info_with_locales(input_, expected):
+    """Test LongDatetimeInfo with DatetimeConfig.locales"""
+    config = DatetimeConfig(locales=("en", "de", "fr"))
+    try:
+        result = LongDateTimeInfo(input_, config).datetime
+        if result is not None:
+            result = result.isoformat()
+    except DatetimeParserError:
+        result = None
+
+    assert result == expected
+
+
+def test_long_datetime_info_default_locale():
+    with pytest.raises(DatetimeParserError):
+        LongDateTimeInfo("Sonntag, Mai 26 2013 12:12:12", DatetimeConfig())
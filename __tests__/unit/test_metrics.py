@@ -0,0 +1,137 @@
+import pytest
+
+from task_script_utils.datetime_parser import parse, parse_many
+from task_script_utils.datetime_parser.instrumentation import ParseEvent
+from task_script_utils.datetime_parser.metrics import (
+    REGISTRY,
+    MetricsRegistry,
+)
+from task_script_utils.datetime_parser.parser_exceptions import DatetimeParserError
+
+FORMATS = ("YYYY-MM-DD HH:mm:ss",)
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry()
+    registry.enable()
+    yield registry
+    registry.disable()
+
+
+def parse_event(total_ns, error=None, datetime_str="2021-12-23T12:12:12"):
+    return ParseEvent(
+        datetime_str=datetime_str,
+        stage=None if error else "short",
+        attempts=0,
+        stage_ns={},
+        total_ns=total_ns,
+        error=error,
+    )
+
+
+def test_snapshot(registry):
+    parse("2021-12-23 12:12:12", FORMATS)
+    parse("2021-12-23T12:12:12")
+    parse("Wednesday, January 13th 2021 12:13:14 PM")
+    for value in ["12/12/12 12:12", "13/13/13 13:13", "not a datetime"]:
+        with pytest.raises(DatetimeParserError):
+            parse(value)
+    parse_many(["2021-12-23T12:12:12", "not a datetime"], errors="coerce")
+
+    snapshot = registry.snapshot()
+    assert snapshot["parses"] == 8
+    assert snapshot["resolutions"] == {
+        "formats": 1,
+        "short": 2,
+        "long": 1,
+        "failure": 4,
+    }
+    assert sum(snapshot["failures"].values()) == 4
+    assert snapshot["top_failing_shapes"]["aaa a aaaaaaaa"] == 2
+    assert snapshot["top_failing_shapes"]["99/99/99 99:99"] == 2
+    assert snapshot["latency"]["buckets"]["+Inf"] == 8
+    assert snapshot["latency"]["mean_seconds"] > 0
+    assert 0 < snapshot["latency"]["p50_seconds"] <= snapshot["latency"]["p99_seconds"]
+    assert snapshot["batches"] == 1
+    assert snapshot["batch_values"] == 2
+    assert set(snapshot["caches"]) == {
+        "fixed_width_formats",
+        "timezones",
+        "fixed_timezones",
+        "locale_indexes",
+    }
+
+
+def test_latency_percentiles():
+    registry = MetricsRegistry()
+    for _ in range(90):
+        registry(parse_event(75_000))
+    for _ in range(10):
+        registry(parse_event(7_500_000))
+
+    latency = registry.snapshot()["latency"]
+    assert latency["buckets"]["5e-05"] == 0
+    assert latency["buckets"]["0.0001"] == 90
+    assert latency["buckets"]["0.01"] == 100
+    assert 0.00005 < latency["p50_seconds"] <= 0.0001
+    assert 0.005 < latency["p99_seconds"] <= 0.01
+    assert latency["mean_seconds"] == pytest.approx(0.0008175)
+
+
+def test_empty_snapshot():
+    snapshot = MetricsRegistry().snapshot()
+    assert snapshot["parses"] == 0
+    assert snapshot["latency"]["mean_seconds"] is None
+    assert snapshot["latency"]["p50_seconds"] is None
+
+
+def test_reset():
+    registry = MetricsRegistry()
+    registry(parse_event(1000, error="InvalidDateError"))
+    registry.reset()
+    assert registry.snapshot()["failures"] == {}
+
+
+def test_prometheus_text(tmp_path):
+    registry = MetricsRegistry()
+    registry(parse_event(1000))
+    registry(parse_event(2000, "InvalidDateError", 'quoted "value"\\'))
+
+    path = tmp_path / "datetime_parser.prom"
+    registry.write_prometheus(str(path))
+    text = path.read_text(encoding="utf-8")
+
+    assert "# TYPE ts_datetime_parser_parses_total counter" in text
+    assert 'ts_datetime_parser_parses_total{path="short"} 1' in text
+    assert 'ts_datetime_parser_parses_total{path="failure"} 1' in text
+    assert 'ts_datetime_parser_failures_total{error="InvalidDateError"} 1' in text
+    assert (
+        'ts_datetime_parser_failing_shape_total{shape="aaaaaa \\"aaaaa\\"\\\\"} 1'
+        in text
+    )
+    assert "# TYPE ts_datetime_parser_parse_duration_seconds histogram" in text
+    assert 'ts_datetime_parser_parse_duration_seconds_bucket{le="+Inf"} 2' in text
+    assert "ts_datetime_parser_parse_duration_seconds_count 2" in text
+    assert 'ts_datetime_parser_cache_hits_total{cache="timezones"}' in text
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.parametrize("value", [None, 123])
+def test_non_str_values_keep_the_parser_error(registry, value):
+    with pytest.raises(TypeError):
+        parse(value)
+    snapshot = registry.snapshot()
+    assert snapshot["failures"] == {"TypeError": 1}
+    assert snapshot["top_failing_shapes"] == {type(value).__name__: 1}
+
+
+def test_process_wide_registry():
+    REGISTRY.reset()
+    REGISTRY.enable()
+    try:
+        parse("2021-12-23T12:12:12")
+    finally:
+        REGISTRY.disable()
+    parse("2021-12-23T12:12:12")
+    assert REGISTRY.snapshot()["parses"] == 1
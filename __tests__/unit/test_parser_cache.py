@@ -0,0 +1,165 @@
+import json
+
+import pytest
+
+from task_script_utils.datetime_parser import (
+    DatetimeConfig,
+    load_parser_cache,
+    parse,
+    save_parser_cache,
+)
+from task_script_utils.datetime_parser import tz_registry
+from task_script_utils.datetime_parser.datetime_info import LongDateTimeInfo
+from task_script_utils.datetime_parser.parser_cache import (
+    HIT_BATCH_SIZE,
+    PARSER_CACHE,
+    ParserCache,
+    config_fingerprint,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_parser_cache():
+    PARSER_CACHE.clear()
+    yield
+    PARSER_CACHE.clear()
+
+
+def test_order_long_formats():
+    cache = ParserCache()
+    formats = ("A", "B", "C", "D")
+    assert cache.order_long_formats(formats) == formats
+
+    cache.record_long_format_hit("C")
+    cache.record_long_format_hit("B")
+    cache.record_long_format_hit("C")
+    cache.flush()
+    assert cache.order_long_formats(formats) == ("C", "B", "A", "D")
+
+
+def test_order_long_formats_by_shape():
+    cache = ParserCache()
+    formats = ("A", "B", "C", "D")
+    cache.record_long_format_hit("C", 5, shape="Aaa 99")
+    cache.record_long_format_hit("B", shape="Aaaa 99")
+    assert cache.shape_formats == {"Aaa 99": "C", "Aaaa 99": "B"}
+    assert cache.order_long_formats(formats, "Aaaa 99") == ("B", "C", "A", "D")
+    assert cache.order_long_formats(formats, "Aaaaa 99") == ("C", "B", "A", "D")
+    assert cache.order_long_formats(("A", "B"), "Aaa 99") == ("B", "A")
+
+
+def test_long_format_hits_are_batched():
+    cache = ParserCache()
+    cache.record_long_format_hit("A", shape="Aaa")
+    assert cache.long_format_hits == {"A": 1}
+    for _ in range(HIT_BATCH_SIZE - 1):
+        cache.record_long_format_hit("A", shape="Aaa")
+    assert cache.long_format_hits == {"A": 1}
+    cache.record_long_format_hit("A", shape="Aaa")
+    assert cache.long_format_hits == {"A": HIT_BATCH_SIZE + 1}
+    cache.record_long_format_hit("A", shape="Aaa")
+    assert cache.to_dict()["long_format_hits"] == {"A": HIT_BATCH_SIZE + 2}
+
+
+def test_known_formats_are_not_recorded_again():
+    formats = ["YYYY-MM-DD HH:mm:ss"]
+    PARSER_CACHE.record_formats(formats)
+    PARSER_CACHE.formats.clear()
+    PARSER_CACHE.record_formats(formats)
+    assert not PARSER_CACHE.formats
+    PARSER_CACHE.record_formats(list(formats))
+    assert PARSER_CACHE.formats == {"YYYY-MM-DD HH:mm:ss": True}
+
+
+def test_long_format_hits_do_not_change_parsed_datetime():
+    datetime_str = "Wednesday, January 13th 2021 12:13:14 PM"
+    config = DatetimeConfig()
+    first = LongDateTimeInfo(datetime_str, config)
+    assert PARSER_CACHE.long_format_hits == {first.datetime_format: 1}
+
+    second = LongDateTimeInfo(datetime_str, config)
+    assert second.datetime_format == first.datetime_format
+    assert second.datetime.isoformat() == first.datetime.isoformat()
+    PARSER_CACHE.flush()
+    assert PARSER_CACHE.long_format_hits == {first.datetime_format: 2}
+    assert PARSER_CACHE.shape_formats == {
+        "Aaaaaaaaa, Aaaaaaa 99aa 9999 99:99:99 AA": first.datetime_format
+    }
+
+
+def test_parse_records_formats_and_timezones():
+    tz_registry.clear_cache()
+    formats = ["YYYY-MM-DD HH:mm:ss", "MMMM Do YYYY hh:mm A z"]
+    parse("January 13th 2021 12:13 PM Asia/Tokyo", formats)
+    assert PARSER_CACHE.formats == {
+        "YYYY-MM-DD HH:mm:ss": True,
+        "MMMM Do YYYY hh:mm A z": False,
+    }
+    assert list(PARSER_CACHE.timezones) == ["Asia/Tokyo"]
+
+
+def test_save_and_load_parser_cache(tmp_path):
+    path = str(tmp_path / "parser_cache.json")
+    config = DatetimeConfig(day_first=True)
+    PARSER_CACHE.record_long_format_hit(
+        "dddd, MMMM Do YYYY hh:mm:ss A", 3, "Aaaaaa, Aaaa 9aa 9999 99:99:99 AA"
+    )
+    PARSER_CACHE.record_formats(["YYYY-MM-DD HH:mm:ss"])
+    PARSER_CACHE.record_timezone("Asia/Kolkata")
+    PARSER_CACHE.record_locales(("en", "de"))
+    state = PARSER_CACHE.to_dict()
+    save_parser_cache(path, config)
+
+    PARSER_CACHE.clear()
+    assert load_parser_cache(path, config)
+    loaded_state = PARSER_CACHE.to_dict()
+    # Loading the cached timezones may also load UTC
+    assert set(state.pop("timezones")) <= set(loaded_state.pop("timezones"))
+    assert loaded_state == state
+
+    # Entries are stored per config
+    PARSER_CACHE.clear()
+    assert not load_parser_cache(path, DatetimeConfig())
+    assert PARSER_CACHE.to_dict() == ParserCache().to_dict()
+
+    save_parser_cache(path, DatetimeConfig())
+    with open(path, encoding="utf-8") as cache_file:
+        entries = json.load(cache_file)["entries"]
+    assert set(entries) == {
+        config_fingerprint(config),
+        config_fingerprint(DatetimeConfig()),
+    }
+
+
+ignored_cache_file_test_cases = [
+    None,
+    "not json",
+    "[]",
+    json.dumps({"version": -1, "pendulum_version": "", "entries": {}}),
+]
+
+
+@pytest.mark.parametrize("content", ignored_cache_file_test_cases)
+def test_load_parser_cache_ignores_missing_stale_and_corrupt_files(tmp_path, content):
+    path = tmp_path / "parser_cache.json"
+    if content is not None:
+        path.write_text(content, encoding="utf-8")
+    assert not load_parser_cache(str(path))
+
+    # A stale or corrupt file is replaced on save
+    save_parser_cache(str(path))
+    assert load_parser_cache(str(path))
+
+
+def test_load_parser_cache_ignores_malformed_entries(tmp_path):
+    path = str(tmp_path / "parser_cache.json")
+    save_parser_cache(path)
+    with open(path, encoding="utf-8") as cache_file:
+        content = json.load(cache_file)
+    for entry in content["entries"].values():
+        entry["long_format_hits"] = ["not", "a", "dict"]
+    with open(path, "w", encoding="utf-8") as cache_file:
+        json.dump(content, cache_file)
+
+    assert not load_parser_cache(path)
+    assert not PARSER_CACHE.long_format_hits
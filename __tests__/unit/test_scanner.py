@@ -0,0 +1,78 @@
+import mmap
+
+import pytest
+
+from task_script_utils.datetime_parser import DatetimeConfig
+from task_script_utils.datetime_parser.scanner import find_datetimes
+
+REPORT = (
+    "Instrument: HPLC-7 Run started 2021-12-23T12:12:12Z by operator\n"
+    "Sample 12 at 23/12/2021 01:02:03 PM America/Chicago, temp 23.5\n"
+    "Calibrated on Wednesday, January 13th 2021 12:13:14 PM ERROR code 5\n"
+    "ver 1.2.3 10:20 and 3.14.15 not dates; id 2021-12-23-001\n"
+    "Fin: 13 janvier 2021 12:13:14 et janvier 13 2021 12:13:14.5 +00:00\n"
+).encode("utf-8")
+CONFIG = DatetimeConfig(locales=("fr", "en"))
+EXPECTED = [
+    ("2021-12-23T12:12:12Z", "2021-12-23T12:12:12Z"),
+    ("23/12/2021 01:02:03 PM America/Chicago", "2021-12-23T19:02:03Z"),
+    ("Wednesday, January 13th 2021 12:13:14 PM", "2021-01-13T12:13:14"),
+    ("janvier 13 2021 12:13:14.5 +00:00", "2021-01-13T12:13:14.5Z"),
+]
+
+
+def _results(matches):
+    return [(match.text, match.datetime.tsformat()) for match in matches]
+
+
+def test_find_datetimes_in_file(tmp_path):
+    path = tmp_path / "report.txt"
+    path.write_bytes(REPORT)
+    matches = list(find_datetimes(path, CONFIG))
+    assert _results(matches) == EXPECTED
+    for match in matches:
+        assert REPORT[match.offset :].startswith(match.text.encode("utf-8"))
+
+
+def test_find_datetimes_in_buffers(tmp_path):
+    assert _results(find_datetimes(REPORT, CONFIG)) == EXPECTED
+    assert _results(find_datetimes(memoryview(REPORT), CONFIG)) == EXPECTED
+    assert _results(find_datetimes(bytearray(REPORT), CONFIG)) == EXPECTED
+    path = tmp_path / "report.txt"
+    path.write_bytes(REPORT)
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            assert _results(find_datetimes(buffer, CONFIG)) == EXPECTED
+
+
+@pytest.mark.parametrize(
+    "content", [b"at 2021-12-23 12:12:12 +99:99.", b"at 2021-12-17 10:00:00 UTC."]
+)
+def test_datetimes_with_invalid_timezones_are_skipped(content):
+    assert not list(find_datetimes(content, CONFIG))
+
+
+def test_timezones_of_the_config():
+    config = DatetimeConfig(tz_dict={"UTC": "+00:00"})
+    matches = list(find_datetimes(b"at 2021-12-17 10:00:00 UTC.", config))
+    assert _results(matches) == [("2021-12-17 10:00:00 UTC", "2021-12-17T10:00:00Z")]
+    assert matches[0].offset == 3
+
+
+def test_words_after_datetimes_are_not_timezones():
+    matches = find_datetimes(b"2021-12-23 12:12:12 ERROR disk full", CONFIG)
+    assert _results(matches) == [("2021-12-23 12:12:12", "2021-12-23T12:12:12")]
+
+
+def test_formats_are_used():
+    matches = find_datetimes(b"t=12-23-21 12:12:12", formats=("MM-DD-YY HH:mm:ss",))
+    assert _results(matches) == [("12-23-21 12:12:12", "2021-12-23T12:12:12")]
+
+
+@pytest.mark.parametrize(
+    "content", [b"", b"no datetimes here\n", b"2021-12-23 and 12:12:12\n"]
+)
+def test_files_without_datetimes(tmp_path, content):
+    path = tmp_path / "report.txt"
+    path.write_bytes(content)
+    assert not list(find_datetimes(str(path)))
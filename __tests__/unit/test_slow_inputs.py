@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from task_script_utils.datetime_parser import parse
+from task_script_utils.datetime_parser.instrumentation import BatchEvent, ParseEvent
+from task_script_utils.datetime_parser.parser_exceptions import DatetimeParserError
+from task_script_utils.datetime_parser.slow_inputs import SlowInputRecorder
+
+
+def parse_event(datetime_str, total_ns, stage="short", attempts=0):
+    return ParseEvent(
+        datetime_str=datetime_str,
+        stage=stage,
+        attempts=attempts,
+        stage_ns={},
+        total_ns=total_ns,
+        error=None,
+    )
+
+
+def test_keeps_slowest_shapes():
+    recorder = SlowInputRecorder(top_k=2)
+    recorder(parse_event("2021-12-23", 10))
+    recorder(parse_event("Jan 13 2021", 30, stage="long", attempts=7))
+    recorder(parse_event("12:13", 20))
+    recorder(parse_event("12:13", 5))
+    recorder(BatchEvent(1, 0, 1, "process", 1000, None))
+
+    slowest = recorder.slowest()
+    assert [slow_input.shape for slow_input in slowest] == ["Aaa 99 9999", "99:99"]
+    assert slowest[0].example == "Jan 13 2021"
+    assert slowest[0].stage == "long"
+    assert slowest[0].attempts == 7
+    assert [slow_input.total_ns for slow_input in slowest] == [30, 20]
+
+
+def test_keeps_slowest_example_of_a_shape():
+    recorder = SlowInputRecorder(top_k=2)
+    recorder(parse_event("2021-12-23", 10))
+    recorder(parse_event("2021-12-24", 40))
+    recorder(parse_event("2021-12-25", 20))
+    recorder(parse_event("12:13", 15))
+    recorder(parse_event("Jan 13 2021", 12))
+
+    slowest = recorder.slowest()
+    assert [slow_input.example for slow_input in slowest] == ["2021-12-24", "12:13"]
+
+
+def test_records_parse_calls(tmp_path):
+    recorder = SlowInputRecorder(top_k=3)
+    recorder.enable()
+    try:
+        parse("2021-12-23T12:12:12")
+        parse("Wednesday, January 13th 2021 12:13:14 PM")
+        with pytest.raises(DatetimeParserError):
+            parse("not a datetime")
+    finally:
+        recorder.disable()
+
+    path = tmp_path / "slow_inputs.json"
+    recorder.dump(str(path))
+    dumped = json.loads(path.read_text(encoding="utf-8"))
+    assert dumped["top_k"] == 3
+    inputs = {slow_input["example"]: slow_input for slow_input in dumped["inputs"]}
+    assert inputs["Wednesday, January 13th 2021 12:13:14 PM"]["stage"] == "long"
+    assert inputs["not a datetime"]["error"] == "InvalidDateError"
+    assert inputs["not a datetime"]["shape"] == "aaa a aaaaaaaa"
+
+    recorder.clear()
+    assert recorder.slowest() == []
+
+
+@pytest.mark.parametrize("value", [None, 123])
+def test_non_str_values_keep_the_parser_error(value):
+    recorder = SlowInputRecorder()
+    recorder.enable()
+    try:
+        with pytest.raises(TypeError):
+            parse(value)
+    finally:
+        recorder.disable()
+    (slow_input,) = recorder.slowest()
+    assert slow_input.shape == type(value).__name__
+    assert slow_input.example == repr(value)
+    assert slow_input.error == "TypeError"
+
+
+def test_invalid_top_k():
+    with pytest.raises(ValueError):
+        SlowInputRecorder(top_k=0)
@@ -0,0 +1,129 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from task_script_utils.convert_datetime_to_ts_format import (
+    _thread_date_data_parsers,
+    convert_datetime_to_ts_format,
+)
+from task_script_utils.datetime_parser import (
+    DatetimeConfig,
+    load_parser_cache,
+    parse,
+    parse_many,
+    save_parser_cache,
+)
+from task_script_utils.datetime_parser import tz_registry
+from task_script_utils.datetime_parser.parser_cache import PARSER_CACHE, ParserCache
+from task_script_utils.datetime_parser.parser_exceptions import DatetimeParserError
+from task_script_utils.datetime_parser.utils.fixed_width_formats import (
+    compile_fixed_width_format,
+)
+
+THREADS = 8
+CONFIG = DatetimeConfig(fold=0, tz_dict={"IST": "+05:30"})
+VALUES = [
+    "2021-11-07 01:30:00 America/Chicago",
+    "2021-01-01T10:00:00.123456789+05:30",
+    "2021-01-01 10:00:00 IST",
+    "13/01/2021 12:13 PM",
+    "Wednesday, January 13th 2021 12:13:14 PM",
+    "Jan 13 2021 12:13:14.5 Asia/Tokyo",
+    "2021-12-23 12:12:12",
+]
+FORMATS = ("YYYY-MM-DD HH:mm:ss.SSSSSS Z", "DD/MM/YYYY HH:mm z")
+FORMATTED_VALUES = [
+    "2021-01-01 10:00:00.123456 +05:30",
+    "01/02/2021 10:00 Europe/Paris",
+]
+
+
+def run_in_threads(func, *args):
+    """Start `func` in THREADS threads at the same time and return the results"""
+    barrier = threading.Barrier(THREADS)
+
+    def run():
+        barrier.wait()
+        return func(*args)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        futures = [executor.submit(run) for _ in range(THREADS)]
+        return [future.result() for future in futures]
+
+
+def isoformats(values, formats=()):
+    return [parse(value, formats, CONFIG).isoformat() for value in values]
+
+
+def test_parse_from_threads_with_cold_caches():
+    expected = isoformats(VALUES * 5)
+    expected_with_formats = isoformats(FORMATTED_VALUES * 5, FORMATS)
+
+    tz_registry.clear_cache()
+    compile_fixed_width_format.cache_clear()
+    PARSER_CACHE.clear()
+
+    assert run_in_threads(isoformats, VALUES * 5) == [expected] * THREADS
+    assert (
+        run_in_threads(isoformats, FORMATTED_VALUES * 5, FORMATS)
+        == [expected_with_formats] * THREADS
+    )
+
+
+def test_parser_cache_from_threads(tmp_path):
+    cache = ParserCache()
+    formats = [f"format {index}" for index in range(100)]
+
+    def record():
+        for format_ in formats:
+            cache.record_long_format_hit(format_)
+            cache.order_long_formats(formats)
+            cache.to_dict()
+
+    run_in_threads(record)
+    assert cache.long_format_hits == {format_: THREADS for format_ in formats}
+
+    path = str(tmp_path / "parser_cache.json")
+
+    def save_and_load():
+        parse(VALUES[4], config=CONFIG)
+        save_parser_cache(path, CONFIG)
+        return load_parser_cache(path, CONFIG)
+
+    assert all(run_in_threads(save_and_load))
+
+
+def test_dateparser_parsers_are_not_shared_between_threads():
+    def convert():
+        converted = convert_datetime_to_ts_format(
+            "2019-07-17 11:21:00", locales=["en-GB"]
+        )
+        return converted, id(next(iter(_thread_date_data_parsers().values())))
+
+    results = run_in_threads(convert)
+    assert {converted for converted, _ in results} == {"2019-07-17T11:21:00.000"}
+    assert len({parser_id for _, parser_id in results}) == THREADS
+
+
+def test_parse_many_with_threads():
+    values = VALUES * 10
+    parsed = parse_many(values, config=CONFIG, workers=4, executor="thread")
+    assert [value.isoformat() for value in parsed] == isoformats(values)
+
+
+def test_parse_many_with_threads_errors():
+    values = [*VALUES, "not a datetime", None]
+    with pytest.raises(DatetimeParserError):
+        parse_many(values, config=CONFIG, workers=4, executor="thread")
+
+    parsed = parse_many(
+        values, config=CONFIG, workers=4, executor="thread", errors="coerce"
+    )
+    assert [value.isoformat() for value in parsed[: len(VALUES)]] == isoformats(VALUES)
+    assert parsed[len(VALUES) :] == [None, None]
+
+
+def test_parse_many_invalid_executor():
+    with pytest.raises(ValueError):
+        parse_many(VALUES, workers=2, executor="fiber")
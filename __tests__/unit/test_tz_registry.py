@@ -0,0 +1,49 @@
+import pendulum
+import pytest
+from task_script_utils.datetime_parser import tz_registry
+from task_script_utils.datetime_parser.tz_list import _all_abbreviated_tz_list
+
+
+def test_iana_timezones_match_pendulum():
+    assert tz_registry.IANA_TIMEZONES == set(pendulum.timezones)
+    assert tz_registry.is_iana_timezone("America/Chicago")
+    assert not tz_registry.is_iana_timezone("america/chicago")
+    assert not tz_registry.is_iana_timezone("IST")
+
+
+def test_abbreviated_timezones():
+    assert tz_registry.ABBREVIATED_TIMEZONES >= set(_all_abbreviated_tz_list)
+    assert tz_registry.is_abbreviated_timezone("ist")
+    assert tz_registry.is_abbreviated_timezone("CST")
+    assert not tz_registry.is_abbreviated_timezone("ZST")
+
+
+@pytest.mark.parametrize(
+    "offset, expected",
+    [("+05:30", 19800), ("-0530", -19800), ("+05", 18000), ("-00:33", -1980)],
+)
+def test_parse_offset(offset, expected):
+    assert tz_registry.parse_offset(offset) == expected
+
+
+def test_parse_offset_invalid():
+    with pytest.raises(ValueError):
+        tz_registry.parse_offset("Z")
+
+
+def test_timezones_are_cached():
+    tz_registry.clear_cache()
+    chicago = tz_registry.get_timezone("America/Chicago")
+    assert chicago is tz_registry.get_timezone("America/Chicago")
+    assert chicago.name == "America/Chicago"
+    assert tz_registry.get_timezone("UTC") is pendulum.UTC
+    assert tz_registry.get_fixed_timezone(19800) is tz_registry.get_fixed_timezone(
+        19800
+    )
+    assert tz_registry.get_fixed_timezone(19800).offset == 19800
+    assert tz_registry.get_timezone.cache_info().hits == 1
+
+
+def test_unknown_timezone():
+    with pytest.raises(ValueError):
+        tz_registry.get_timezone("Not/A_Timezone")
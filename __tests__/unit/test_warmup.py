@@ -0,0 +1,46 @@
+from task_script_utils.datetime_parser import (
+    DatetimeConfig,
+    instrumentation,
+    parse,
+    warm_up,
+)
+from task_script_utils.datetime_parser.parser_cache import PARSER_CACHE
+from task_script_utils.datetime_parser.utils.fixed_width_formats import (
+    compile_fixed_width_format,
+)
+
+
+def test_warm_up_reports_every_step():
+    timings = warm_up()
+    assert list(timings) == ["imports", "locales", "timezones", "formats", "config"]
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+def test_warm_up_with_config_formats_and_timezones():
+    formats = ["YYYY-MM-DD HH:mm:ss", "MMMM Do YYYY hh:mm A", "DD-MM-YYYY zz"]
+    config = DatetimeConfig(day_first=True, tz_dict={"IST": "+05:30"}, fold=0)
+    warm_up(config, formats, timezones=["Asia/Kolkata", "America/Chicago"])
+
+    assert compile_fixed_width_format.cache_info().currsize > 0
+    parsed = parse("2021-12-23 12:12:12", formats, config)
+    assert parsed.isoformat() == "2021-12-23T12:12:12"
+
+
+def test_warm_up_ignores_unsupported_formats():
+    warm_up(formats=["YYYY-MM-DD HH:mm:ss.SSSSSSSSS", "Qo YYYY"])
+
+
+def test_warm_up_has_no_side_effects():
+    events = []
+    PARSER_CACHE.clear()
+    instrumentation.add_hook(events.append)
+    try:
+        warm_up()
+    finally:
+        instrumentation.remove_hook(events.append)
+    assert not events
+    assert not PARSER_CACHE.to_dict()["long_format_hits"]
+
+    parse("Wednesday, January 13th 2021 12:13:14 PM")
+    assert PARSER_CACHE.to_dict()["long_format_hits"]
+    PARSER_CACHE.clear()
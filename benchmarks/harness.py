@@ -0,0 +1,160 @@
+# Shared helpers of the benchmark runners: timing, JSON baselines and the
+# comparison of results against a baseline with regression tolerances.
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+from time import perf_counter_ns
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+BASELINE_VERSION = 1
+
+
+class Comparison(NamedTuple):
+    name: str
+    value: float
+    baseline: Optional[float]
+    tolerance: float
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.baseline:
+            return None
+        return self.value / self.baseline
+
+    @property
+    def regressed(self) -> bool:
+        return self.ratio is not None and self.ratio > 1 + self.tolerance
+
+
+def time_call(func: Callable[[], object], number: int, repeat: int) -> float:
+    """Return the best time of `repeat` rounds of `number` calls of `func`, in
+    nanoseconds per call.
+    """
+    best = None
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        for _ in range(number):
+            func()
+        elapsed = (perf_counter_ns() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def load_baseline(path: str) -> dict:
+    """Return the baseline stored in `path`, or an empty baseline when the
+    file doesn't exist.
+    """
+    if not os.path.exists(path):
+        return {"version": BASELINE_VERSION, "results": {}, "tolerances": {}}
+    with open(path, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version in {path}")
+    baseline.setdefault("tolerances", {})
+    return baseline
+
+
+def save_baseline(path: str, results: Dict[str, float], previous: dict):
+    """Write `results` to `path`, keeping the per benchmark tolerances of the
+    previous baseline. The file is replaced atomically.
+    """
+    baseline = {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {name: round(value, 1) for name, value in results.items()},
+        "tolerances": previous.get("tolerances", {}),
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+            json.dump(baseline, temp_file, indent=2, sort_keys=True)
+            temp_file.write("\n")
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def compare(
+    results: Dict[str, float], baseline: dict, tolerance: float
+) -> List[Comparison]:
+    """Compare `results` to `baseline`. A benchmark regressed when its value is
+    more than `1 + tolerance` times its baseline value. The baseline's
+    "tolerances" override `tolerance` per benchmark.
+    """
+    tolerances = baseline.get("tolerances", {})
+    return [
+        Comparison(
+            name=name,
+            value=value,
+            baseline=baseline["results"].get(name),
+            tolerance=tolerances.get(name, tolerance),
+        )
+        for name, value in results.items()
+    ]
+
+
+def argument_parser(description: str, baseline_name: str, tolerance: float):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--baseline",
+        default=os.path.join(BASELINE_DIR, baseline_name),
+        help="JSON baseline to compare against (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=tolerance,
+        help="Allowed relative regression, eg. 0.5 for 50%% (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-k",
+        dest="keyword",
+        default="",
+        help="Only run benchmarks whose name contains this string",
+    )
+    return parser
+
+
+def report(
+    results: Dict[str, float], args: argparse.Namespace, unit: str, scale: float = 1
+) -> int:
+    """Print `results` next to the baseline and save or compare them.
+    Return the exit status, 1 when a benchmark regressed.
+    """
+    baseline = load_baseline(args.baseline)
+    if args.save_baseline:
+        save_baseline(args.baseline, results, baseline)
+        print(f"Saved {len(results)} results to {args.baseline}")
+        return 0
+
+    comparisons = compare(results, baseline, args.tolerance)
+    width = max((len(name) for name in results), default=0)
+    regressions = 0
+    for comparison in comparisons:
+        value = f"{comparison.value / scale:12.1f} {unit}"
+        if comparison.ratio is None:
+            print(f"{comparison.name:{width}} {value}   (no baseline)")
+            continue
+        status = "REGRESSED" if comparison.regressed else "ok"
+        regressions += comparison.regressed
+        print(
+            f"{comparison.name:{width}} {value} {comparison.ratio:6.2f}x "
+            f"of baseline (tolerance {comparison.tolerance:.0%})  {status}"
+        )
+    if regressions:
+        print(f"{regressions} benchmark(s) regressed", file=sys.stderr)
+        return 1
+    return 0
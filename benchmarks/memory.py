@@ -0,0 +1,212 @@
+# Memory benchmarks of parsing columns and holding their results, compared
+# against a JSON baseline. Peak and retained bytes are measured with
+# tracemalloc, peak RSS by sampling /proc/self/statm in a second run.
+# Retained bytes of streams are the growth over a run with twice the rows.
+# Memory of `parse_many` worker processes is not included.
+#
+#   python -m benchmarks.memory                  compare with the baseline in
+#                                                benchmarks/baselines/memory.json
+#   python -m benchmarks.memory --save-baseline  record a new baseline
+#   python -m benchmarks.memory --rows 10000 -k parse_many
+import asyncio
+import gc
+import os
+import threading
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from task_script_utils.datetime_parser import (
+    aiter_parse,
+    parse,
+    parse_many,
+    warm_up,
+)
+from task_script_utils.datetime_parser.batch import RESULT_FIELDS, encode_ts_datetime
+from task_script_utils.datetime_parser.corpus import CORPUS_CONFIG, generate_corpus
+
+from .harness import argument_parser, report
+
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_ROWS = 2000
+WARM_UP_ROWS = 200
+SEED = 0
+# Seconds between two RSS samples
+RSS_INTERVAL = 0.002
+
+
+class Scenario(NamedTuple):
+    name: str
+    # Takes the number of rows, returns the retained results
+    func: Callable[[int], object]
+    # Streams keep no results, their retained bytes are measured as the growth
+    # between `rows` and twice as many rows
+    streaming: bool = False
+
+
+def _values(rows: int) -> List[str]:
+    return [entry.datetime_str for entry in generate_corpus(rows, SEED)]
+
+
+def _record_array(parsed):
+    import numpy  # pylint: disable=C0415
+
+    return numpy.array(
+        [encode_ts_datetime(value) for value in parsed],
+        dtype=list(RESULT_FIELDS),
+    )
+
+
+def _stream(rows: int) -> int:
+    """Parse a corpus that is never materialized, without keeping results"""
+
+    async def consume():
+        count = 0
+        values = (entry.datetime_str for entry in generate_corpus(rows, SEED))
+        async for _ in aiter_parse(values, config=CORPUS_CONFIG):
+            count += 1
+        return count
+
+    return asyncio.run(consume())
+
+
+def scenarios(values: List[str]) -> List[Scenario]:
+    def parse_loop(_):
+        return [parse(value, config=CORPUS_CONFIG) for value in values]
+
+    return [
+        Scenario("parse_loop/ts_datetimes", parse_loop),
+        Scenario(
+            "parse_loop/tsformat_strings",
+            lambda _: [
+                parse(value, config=CORPUS_CONFIG).tsformat() for value in values
+            ],
+        ),
+        Scenario(
+            "parse_loop/record_array",
+            lambda _: _record_array(
+                parse(value, config=CORPUS_CONFIG) for value in values
+            ),
+        ),
+        Scenario(
+            "parse_many/thread",
+            lambda _: parse_many(
+                values, config=CORPUS_CONFIG, workers=2, executor="thread"
+            ),
+        ),
+        Scenario(
+            "parse_many/process",
+            lambda _: parse_many(values, config=CORPUS_CONFIG, workers=2),
+        ),
+        Scenario("aiter_parse/stream", _stream, streaming=True),
+    ]
+
+
+def _rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class _RssSampler(threading.Thread):
+    """Samples the RSS of the process until stopped, keeping the peak"""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.peak = _rss_bytes()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(RSS_INTERVAL):
+            self.peak = max(self.peak, _rss_bytes())
+
+    def stop(self) -> int:
+        self._stop_event.set()
+        self.join()
+        return max(self.peak, _rss_bytes())
+
+
+def measure_tracemalloc(scenario: Scenario, rows: int) -> Dict[str, int]:
+    """Return the peak and retained bytes allocated by the scenario"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = scenario.func(rows)
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"peak_bytes": peak - before, "retained_bytes": retained - before}
+
+
+def measure_rss(scenario: Scenario, rows: int) -> Optional[int]:
+    """Return how much the peak RSS exceeds the RSS before the scenario"""
+    if _rss_bytes() is None:
+        return None
+    gc.collect()
+    sampler = _RssSampler()
+    before = sampler.peak
+    sampler.start()
+    try:
+        result = scenario.func(rows)
+    finally:
+        peak = sampler.stop()
+    del result
+    return peak - before
+
+
+def run(rows: int = DEFAULT_ROWS, keyword: str = "") -> Dict[str, float]:
+    """Measure the scenarios whose name contains `keyword` with `rows` rows.
+    Return bytes per million rows of each measurement.
+    """
+    warm_up(CORPUS_CONFIG)
+    values = _values(rows)
+    selected = [scenario for scenario in scenarios(values) if keyword in scenario.name]
+    # Load the parser caches and the timezones of the corpus before measuring,
+    # so that they aren't counted as memory of the first scenario
+    for value in values:
+        parse(value, config=CORPUS_CONFIG)
+    for scenario in scenarios(_values(WARM_UP_ROWS)):
+        if keyword in scenario.name:
+            scenario.func(WARM_UP_ROWS)
+
+    per_million = 1_000_000 / rows
+    results = {}
+    for scenario in selected:
+        measured = measure_tracemalloc(scenario, rows)
+        if scenario.streaming:
+            # The bytes retained after a stream are the parser caches and
+            # don't scale with the rows, unlike their growth
+            retained = measure_tracemalloc(scenario, 2 * rows)["retained_bytes"]
+            measured["retained_bytes"] = retained - measured["retained_bytes"]
+        for name, value in measured.items():
+            results[f"{scenario.name}/{name}"] = value * per_million
+        rss = measure_rss(scenario, rows)
+        if rss is not None:
+            results[f"{scenario.name}/rss_peak_bytes"] = rss * per_million
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argument_parser(
+        "Measure the memory of parsing columns",
+        "memory.json",
+        tolerance=DEFAULT_TOLERANCE,
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=DEFAULT_ROWS,
+        help="Rows of each scenario, results are scaled to a million rows",
+    )
+    args = parser.parse_args(argv)
+    return report(
+        run(args.rows, args.keyword), args, unit="MB/1M rows", scale=1_000_000
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
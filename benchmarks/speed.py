@@ -0,0 +1,166 @@
+# Speed benchmarks of every parse path, compared against a JSON baseline.
+#
+#   python -m benchmarks.speed                  compare with the baseline in
+#                                                benchmarks/baselines/speed.json
+#   python -m benchmarks.speed --save-baseline  record a new baseline
+#   python -m benchmarks.speed -k formats --tolerance 0.25
+from functools import partial
+from typing import Callable, Dict, List, NamedTuple
+
+from task_script_utils.convert_datetime_to_ts_format import (
+    convert_datetime_to_ts_format,
+)
+from task_script_utils.datetime_parser import DatetimeConfig, parse, warm_up
+from task_script_utils.is_number import isnumber
+
+from .harness import argument_parser, report, time_call
+
+DEFAULT_TOLERANCE = 0.5
+
+
+class Scenario(NamedTuple):
+    name: str
+    func: Callable[[], object]
+    # Calls per timed round
+    number: int
+
+
+# A short date that parses with each day_first/year_first combination
+SHORT_DATES = {
+    (None, None): "13/11/2010 10:20:30",
+    (None, True): "12/11/10 10:20:30",
+    (None, False): "13/11/10 10:20:30",
+    (True, None): "12/11/10 10:20:30",
+    (True, True): "12/11/10 10:20:30",
+    (True, False): "12/11/10 10:20:30",
+    (False, None): "13/11/10 10:20:30",
+    (False, True): "12/11/10 10:20:30",
+    (False, False): "12/11/10 10:20:30",
+}
+
+# Formats that don't match "2021-12-23 12:12:12"
+MISSING_FORMATS = [
+    f"DD{separator}MM{separator}YYYY {time}"
+    for separator in "/.-"
+    for time in ("HH:mm", "HH:mm:ss", "hh:mm A", "hh:mm:ss A", "HH:mm:ss.SSS")
+]
+MATCHING_FORMAT = "YYYY-MM-DD HH:mm:ss"
+
+
+def _flag_name(flag) -> str:
+    return {None: "none", True: "true", False: "false"}[flag]
+
+
+def scenarios() -> List[Scenario]:
+    result = [
+        Scenario("parse/iso", partial(parse, "2021-12-23T12:12:12"), 200),
+        Scenario(
+            "parse/iso_fraction_offset",
+            partial(parse, "2021-12-23T12:12:12.123456789+05:30"),
+            200,
+        ),
+    ]
+    for (day_first, year_first), value in SHORT_DATES.items():
+        config = DatetimeConfig(day_first=day_first, year_first=year_first)
+        name = (
+            f"parse/short/day_first={_flag_name(day_first)}"
+            f",year_first={_flag_name(year_first)}"
+        )
+        result.append(Scenario(name, partial(parse, value, config=config), 200))
+
+    result += [
+        Scenario(
+            "parse/long",
+            partial(parse, "Wednesday, January 13th 2021 12:13:14 PM"),
+            20,
+        ),
+        Scenario(
+            "parse/long_two_digit_year_meridiem",
+            partial(parse, "Jan 13 21 12:13:14.5 PM Asia/Tokyo"),
+            20,
+        ),
+    ]
+
+    for length in (1, 5, 15):
+        formats = [MATCHING_FORMAT, *MISSING_FORMATS[: length - 1]]
+        value = "2021-12-23 12:12:12"
+        result.append(
+            Scenario(
+                f"parse/formats/{length}/first", partial(parse, value, formats), 200
+            )
+        )
+        if length > 1:
+            result.append(
+                Scenario(
+                    f"parse/formats/{length}/last",
+                    partial(parse, value, formats[::-1]),
+                    200,
+                )
+            )
+    unambiguous = DatetimeConfig(require_unambiguous_formats=True)
+    result.append(
+        Scenario(
+            "parse/formats/require_unambiguous",
+            partial(
+                parse,
+                "2021-12-23 12:12:12",
+                ["YYYY-DD-MM HH:mm:ss", MATCHING_FORMAT],
+                unambiguous,
+            ),
+            50,
+        )
+    )
+
+    tz_dict = DatetimeConfig(tz_dict={"IST": "+05:30", "EST": "-05:00"})
+    result += [
+        Scenario(
+            "parse/tz_dict_abbreviation",
+            partial(parse, "2021-01-01 10:00:00 IST", config=tz_dict),
+            200,
+        ),
+        Scenario(
+            "parse/iana_fold",
+            partial(
+                parse,
+                "2021-11-07 01:30:00 America/Chicago",
+                config=DatetimeConfig(fold=0),
+            ),
+            200,
+        ),
+        Scenario(
+            "convert_datetime_to_ts_format",
+            partial(convert_datetime_to_ts_format, "2019-07-17 11:21:00"),
+            50,
+        ),
+        Scenario("isnumber/number", partial(isnumber, "1.5e10"), 10000),
+        Scenario("isnumber/text", partial(isnumber, "Not a number"), 10000),
+    ]
+    return result
+
+
+def run(keyword: str = "", repeat: int = 5) -> Dict[str, float]:
+    """Time the scenarios whose name contains `keyword`.
+    Return the best nanoseconds per call of each.
+    """
+    warm_up()
+    results = {}
+    for scenario in scenarios():
+        if keyword not in scenario.name:
+            continue
+        # First call loads the caches of the path
+        scenario.func()
+        results[scenario.name] = time_call(scenario.func, scenario.number, repeat)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argument_parser(
+        "Benchmark parse paths", "speed.json", tolerance=DEFAULT_TOLERANCE
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed rounds")
+    args = parser.parse_args(argv)
+    return report(run(args.keyword, args.repeat), args, unit="µs/call", scale=1000)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -26,7 +26,7 @@ setup(
     },
     keywords=[],
     install_requires=requirements,
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     include_package_data=True,
     long_description=readme,
     long_description_content_type="text/markdown",
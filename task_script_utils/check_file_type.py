@@ -1,5 +1,7 @@
+import os
 import sys
 import typing
+from concurrent.futures import ThreadPoolExecutor
 
 
 def check_file_type(filename: str, expected_type: typing.Union[str, list]):
@@ -12,7 +14,7 @@ def check_file_type(filename: str, expected_type: typing.Union[str, list]):
     """
     # get the extension from filename
 
-    extension = filename.rstrip().split(".")[-1].lower()
+    extension = _extension(filename)
     try:
         if type(expected_type) == str:
             # lower case both the extension and expected_type, do a string match
@@ -26,3 +28,234 @@ def check_file_type(filename: str, expected_type: typing.Union[str, list]):
             # pylint: disable=C0301
             f"The pipeline is expecting the file type to be {expected_type}, but the provided file has a file type of {extension}."  # noqa E501
         )
+
+
+# Bytes read from the start of each file to sniff its content
+HEADER_SIZE = 4096
+DEFAULT_WORKERS = 16
+
+# Content types sniffed from the header of a file
+TEXT = "txt"
+CSV = "csv"
+TSV = "tsv"
+JSON = "json"
+XML = "xml"
+HTML = "html"
+PDF = "pdf"
+ZIP = "zip"
+XLSX = "xlsx"
+DOCX = "docx"
+PPTX = "pptx"
+OLE = "ole"
+HDF5 = "hdf5"
+NETCDF = "netcdf"
+PARQUET = "parquet"
+SQLITE = "sqlite"
+GZIP = "gzip"
+PNG = "png"
+JPEG = "jpeg"
+GIF = "gif"
+TIFF = "tiff"
+BINARY = "binary"
+EMPTY = "empty"
+
+_TEXT_TYPES = (TEXT, CSV, TSV, JSON, XML, HTML)
+_MAGIC_NUMBERS = (
+    (b"%PDF-", PDF),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", OLE),
+    (b"\x89HDF\r\n\x1a\n", HDF5),
+    (b"CDF\x01", NETCDF),
+    (b"CDF\x02", NETCDF),
+    (b"PAR1", PARQUET),
+    (b"SQLite format 3\x00", SQLITE),
+    (b"\x1f\x8b", GZIP),
+    (b"\x89PNG\r\n\x1a\n", PNG),
+    (b"\xff\xd8\xff", JPEG),
+    (b"GIF87a", GIF),
+    (b"GIF89a", GIF),
+    (b"II*\x00", TIFF),
+    (b"MM\x00*", TIFF),
+)
+# Offsets of the HDF5 signature after a user block
+_HDF5_OFFSETS = (512, 1024, 2048)
+# Directories of the Office Open XML documents in their ZIP archive
+_OOXML_DIRECTORIES = ((b"xl/", XLSX), (b"word/", DOCX), (b"ppt/", PPTX))
+_ZIP_TYPES = (ZIP, XLSX, DOCX, PPTX)
+
+# Content types that files with these extensions can have. The content of
+# files with other extensions isn't checked.
+EXTENSION_CONTENT_TYPES = {
+    "csv": (CSV, TSV, TEXT),
+    "tsv": (TSV, CSV, TEXT),
+    "tab": (TSV, CSV, TEXT),
+    "txt": _TEXT_TYPES,
+    "log": _TEXT_TYPES,
+    "dat": _TEXT_TYPES + (BINARY,),
+    "json": (JSON,),
+    "xml": (XML,),
+    "html": (HTML, XML),
+    "htm": (HTML, XML),
+    "pdf": (PDF,),
+    "zip": _ZIP_TYPES,
+    "xlsx": (XLSX, ZIP),
+    "xlsm": (XLSX, ZIP),
+    "docx": (DOCX, ZIP),
+    "pptx": (PPTX, ZIP),
+    "xls": (OLE,),
+    "doc": (OLE,),
+    "ppt": (OLE,),
+    "h5": (HDF5,),
+    "hdf5": (HDF5,),
+    "hdf": (HDF5,),
+    "he5": (HDF5,),
+    "nc": (NETCDF, HDF5),
+    "parquet": (PARQUET,),
+    "sqlite": (SQLITE,),
+    "db": (SQLITE,),
+    "gz": (GZIP,),
+    "png": (PNG,),
+    "jpg": (JPEG,),
+    "jpeg": (JPEG,),
+    "gif": (GIF,),
+    "tif": (TIFF,),
+    "tiff": (TIFF,),
+}
+
+
+class FileTypeCheck(typing.NamedTuple):
+    path: str
+    # Lowercase extension of the path
+    extension: str
+    # Content type sniffed from the header, None when the file can't be read
+    content_type: typing.Optional[str]
+    valid: bool
+    # Why the file is not valid
+    error: typing.Optional[str] = None
+
+
+def _extension(filename: str) -> str:
+    return filename.rstrip().split(".")[-1].lower()
+
+
+def _expected_types(expected_type: typing.Union[str, list]) -> typing.List[str]:
+    if isinstance(expected_type, str):
+        return [expected_type.lower()]
+    if isinstance(expected_type, list):
+        return [file_type.lower() for file_type in expected_type]
+    raise ValueError(f"expected string or list but received {expected_type}")
+
+
+def _sniff_text(text: str) -> str:
+    stripped = text.lstrip()
+    if stripped.startswith("<"):
+        start = stripped[:100].lower()
+        return HTML if start.startswith(("<!doctype html", "<html")) else XML
+    if stripped.startswith(("{", "[")):
+        return JSON
+    # The last line may be cut by the end of the header
+    lines = [line for line in stripped.splitlines()[:-1] if line.strip()]
+    lines = lines or stripped.splitlines()[:1]
+    for delimiter, content_type in (("\t", TSV), (",", CSV)):
+        counts = {line.count(delimiter) for line in lines[:20]}
+        if len(counts) == 1 and counts != {0}:
+            return content_type
+    return TEXT
+
+
+def sniff_header(header: bytes) -> str:
+    """Return the content type of a file from its first bytes.
+
+    Args:
+        header (bytes): The first bytes of the file, HEADER_SIZE bytes are enough
+
+    Returns:
+        (str): One of the content type constants of this module, BINARY when
+        the content is unknown and EMPTY for no bytes
+    """
+    if not header:
+        return EMPTY
+    for magic, content_type in _MAGIC_NUMBERS:
+        if header.startswith(magic):
+            return content_type
+    if header.startswith((b"PK\x03\x04", b"PK\x05\x06")):
+        for directory, content_type in _OOXML_DIRECTORIES:
+            if directory in header:
+                return content_type
+        return ZIP
+    if any(header.startswith(b"\x89HDF\r\n\x1a\n", offset) for offset in _HDF5_OFFSETS):
+        return HDF5
+
+    if header.startswith((b"\xff\xfe", b"\xfe\xff")):
+        text = header.decode("utf-16", errors="ignore")
+    elif b"\x00" in header:
+        return BINARY
+    else:
+        # A multibyte character may be cut by the end of the header, and
+        # text files in single byte encodings are still text
+        text = header.decode("utf-8", errors="replace").lstrip("\ufeff")
+        unprintable = sum(not (char.isprintable() or char.isspace()) for char in text)
+        if unprintable > len(text) // 10:
+            return BINARY
+    return _sniff_text(text)
+
+
+def _read_header(path: str, size: int) -> bytes:
+    descriptor = os.open(path, os.O_RDONLY)
+    try:
+        if hasattr(os, "pread"):
+            return os.pread(descriptor, size, 0)
+        return os.read(descriptor, size)
+    finally:
+        os.close(descriptor)
+
+
+def _check_one(path: str, expected: typing.List[str], header_size: int):
+    extension = _extension(path)
+    try:
+        content_type = sniff_header(_read_header(path, header_size))
+    except OSError as error:
+        return FileTypeCheck(path, extension, None, False, str(error))
+
+    if extension not in expected:
+        error = f"expected file type {expected}, but the file type is {extension}"
+    elif content_type == EMPTY:
+        error = "the file is empty"
+    elif content_type not in EXTENSION_CONTENT_TYPES.get(extension, (content_type,)):
+        error = f"the content of the {extension} file is {content_type}"
+    else:
+        return FileTypeCheck(path, extension, content_type, True)
+    return FileTypeCheck(path, extension, content_type, False, error)
+
+
+def check_file_types(
+    paths: typing.Iterable[str],
+    expected_type: typing.Union[str, list],
+    workers: int = DEFAULT_WORKERS,
+    header_size: int = HEADER_SIZE,
+) -> typing.List[FileTypeCheck]:
+    """Check the type of many files, by extension and by content. Only the
+    first `header_size` bytes of each file are read, in a thread pool.
+    Unlike `check_file_type`, files that don't match are reported instead of
+    exiting.
+
+    Args:
+        paths (Iterable[str]): Paths of the files
+        expected_type (t.Union[str, list]): either a string with the expected
+        filetype or a list of strings with expected file types
+        workers (int): Number of threads reading the files
+        header_size (int): Bytes read from the start of each file
+
+    Raises:
+        ValueError: When expected_type is not a string or a list
+
+    Returns:
+        (List[FileTypeCheck]): The check of each path, in the order of `paths`
+    """
+    expected = _expected_types(expected_type)
+    paths = list(paths)
+    if workers <= 1 or len(paths) <= 1:
+        return [_check_one(path, expected, header_size) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        return list(
+            executor.map(lambda path: _check_one(path, expected, header_size), paths)
+        )
@@ -0,0 +1,348 @@
+# Single pass typing of the columns of unknown tables. The first non-empty
+# cells of a column are sampled to classify it as numeric, datetime or string,
+# then the rest of the column is converted to a typed NumPy array while the
+# classification is confirmed, so every cell is converted once. Numeric
+# columns are converted with `to_numeric`.
+from functools import lru_cache
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+from .datetime_parser.datetime_config import DEFAULT_DATETIME_CONFIG, DatetimeConfig
+from .is_number import _to_float, to_numeric
+
+NUMERIC = "numeric"
+DATETIME = "datetime"
+STRING = "string"
+
+DEFAULT_SAMPLE_SIZE = 100
+# Sampling stops early once this many cells all have the same type
+DEFAULT_MIN_SAMPLE = 20
+# Fraction of the non-empty cells that must convert for a typed column
+DEFAULT_CONFIDENCE = 0.95
+
+# Fixed width layouts tried as the format of datetime columns
+_DATE_LAYOUTS = (
+    "YYYY-MM-DD",
+    "YYYY/MM/DD",
+    "YYYYMMDD",
+    "MM/DD/YYYY",
+    "DD/MM/YYYY",
+    "MM-DD-YYYY",
+    "DD-MM-YYYY",
+    "MM.DD.YYYY",
+    "DD.MM.YYYY",
+)
+_TIME_LAYOUTS = (
+    "HH:mm:ss",
+    "HH:mm:ss.SSS",
+    "HH:mm:ss.SSSSSS",
+    "HH:mm",
+    "hh:mm:ss A",
+    "hh:mm A",
+)
+_OFFSET_LAYOUTS = ("", "Z", " Z", "ZZ")
+# Layouts of digit-only datetimes by length. These cells are also numbers,
+# so they are tried as datetimes first.
+_COMPACT_LAYOUTS = {8: "YYYYMMDD", 14: "YYYYMMDDHHmmss"}
+
+# datetime64[ns] can't hold years outside of this range
+_MIN_YEAR = 1678
+_MAX_YEAR = 2261
+
+
+class ColumnProfile(NamedTuple):
+    name: str
+    # NUMERIC, DATETIME or STRING
+    kind: str
+    # float64 with NaN, datetime64[ns] with NaT (timezone aware values in UTC)
+    # or the original values as objects
+    values: object
+    # Inferred format of a datetime column, None when the cells don't share
+    # one of the fixed width layouts
+    format: Optional[str]
+    # Non-empty cells
+    count: int
+    # Non-empty cells of a typed column that could not be converted
+    invalid: int
+    # Cells classified before the type of the column was decided
+    sampled: int
+
+
+def candidate_formats() -> List[str]:
+    """Return the fixed width datetime formats a column can be inferred to have"""
+    formats = [*_DATE_LAYOUTS, _COMPACT_LAYOUTS[14]]
+    for date_layout in _DATE_LAYOUTS:
+        for separator in ("T", " "):
+            for time_layout in _TIME_LAYOUTS:
+                for offset in _OFFSET_LAYOUTS:
+                    formats.append(f"{date_layout}{separator}{time_layout}{offset}")
+    return formats
+
+
+@lru_cache(maxsize=1)
+def _formats_by_shape() -> Dict[str, List[str]]:
+    # pylint: disable=C0415
+    import pendulum
+    from .datetime_parser.instrumentation import input_shape
+
+    sample = pendulum.datetime(2021, 12, 23, 12, 12, 12, 123456)
+    formats_by_shape = {}
+    for fmt in candidate_formats():
+        formats_by_shape.setdefault(input_shape(sample.format(fmt)), []).append(fmt)
+    return formats_by_shape
+
+
+def _is_empty(value) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _with_compact_layout(value, formats: Sequence[str]) -> Sequence[str]:
+    """Return `formats` with the compact layout of `value` first, if it is a
+    string of 8 or 14 digits, eg. "20211223"
+    """
+    if isinstance(value, str):
+        digits = value.strip()
+        if digits.isascii() and digits.isdigit() and len(digits) in _COMPACT_LAYOUTS:
+            return (_COMPACT_LAYOUTS[len(digits)], *formats)
+    return formats
+
+
+def _datetime64_str(ts_datetime) -> Optional[str]:
+    """Return the `tsformat()` of a TSDatetime as a datetime64[ns] string,
+    or None when it's out of the range of datetime64[ns].
+    """
+    tsformat = ts_datetime.tsformat().rstrip("Z")
+    if not _MIN_YEAR <= int(tsformat[:4]) <= _MAX_YEAR:
+        return None
+    # Nanoseconds are the smallest unit
+    seconds, _, subseconds = tsformat.partition(".")
+    return f"{seconds}.{subseconds[:9]}" if subseconds else seconds
+
+
+def _datetime_converter(formats, config):
+    from .datetime_parser.parser import parse  # pylint: disable=C0415
+
+    def convert(value) -> Optional[str]:
+        try:
+            return _datetime64_str(
+                parse(value, _with_compact_layout(value, formats), config)
+            )
+        except Exception:  # pylint: disable=W0703
+            return None
+
+    return convert
+
+
+class _Sample:
+    """Classifies the first cells of a column, keeping their converted values"""
+
+    def __init__(self, formats, config):
+        self.formats = tuple(formats)
+        self.config = config
+        self.numbers = {}
+        self.datetimes = {}
+        self.others = 0
+        # Candidate formats matching every datetime of the sample, None until
+        # the first datetime
+        self.candidates = None
+
+    @property
+    def count(self) -> int:
+        return len(self.numbers) + len(self.datetimes) + self.others
+
+    def add(self, index: int, value):
+        formats = _with_compact_layout(value, self.formats)
+        ts_datetime = None
+        if formats is not self.formats:
+            ts_datetime = self._parse(value, formats)
+        if ts_datetime is None:
+            number = _to_float(value)
+            if number is not None:
+                self.numbers[index] = number
+                return
+            ts_datetime = self._parse(value, formats)
+        if ts_datetime is None:
+            self.others += 1
+        else:
+            self.datetimes[index] = ts_datetime
+            self._filter_candidates(value, ts_datetime)
+
+    def _parse(self, value, formats):
+        from .datetime_parser.parser import parse  # pylint: disable=C0415
+
+        try:
+            return parse(value, formats, self.config)
+        except Exception:  # pylint: disable=W0703
+            return None
+
+    def _filter_candidates(self, value, ts_datetime):
+        """Keep the candidate formats parsing `value` as the parser does"""
+        # pylint: disable=C0415
+        from .datetime_parser.instrumentation import input_shape
+        from .datetime_parser.utils.manipulation import replace_z_with_offset
+        from .datetime_parser.utils.parsing import _parse_with_formats
+
+        if self.candidates is None:
+            shape = input_shape(replace_z_with_offset(value))
+            self.candidates = list(_formats_by_shape().get(shape, ()))
+        expected = ts_datetime.tsformat()
+        kept = []
+        for fmt in self.candidates:
+            try:
+                parsed, _ = _parse_with_formats(value, (fmt,), self.config)
+            except Exception:  # pylint: disable=W0703
+                parsed = None
+            if parsed is not None:
+                parsed.change_fold(self.config.fold)
+                if parsed.tsformat() == expected:
+                    kept.append(fmt)
+        self.candidates = kept
+
+    def kind(self, confidence: float) -> str:
+        count = self.count
+        if count and len(self.numbers) >= confidence * count:
+            return NUMERIC
+        if count and len(self.datetimes) >= confidence * count:
+            return DATETIME
+        return STRING
+
+    def is_decided(self, min_sample, sample_size, confidence) -> bool:
+        """Whether more cells can't change the type of the column"""
+        count = self.count
+        if count >= min_sample and count in (len(self.numbers), len(self.datetimes)):
+            return True
+        # Neither type can reach the confidence within the sample
+        needed = confidence * sample_size
+        remaining = sample_size - count
+        return max(len(self.numbers), len(self.datetimes)) + remaining < needed
+
+
+def profile_column(
+    values: Sequence,
+    name: str = "",
+    formats: Sequence[str] = (),
+    config: DatetimeConfig = DEFAULT_DATETIME_CONFIG,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    min_sample: int = DEFAULT_MIN_SAMPLE,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> ColumnProfile:
+    """Classify a column as numeric, datetime or string and convert its cells.
+
+    Numbers follow the rules of `isnumber`. Datetimes are parsed with `parse()`;
+    when the sampled datetimes share one fixed width format, it is tried first
+    for the rest of the column. Empty cells and cells that don't convert are
+    NaN or NaT. A typed column with more than `1 - confidence` of its cells
+    failing to convert is returned as a string column.
+
+    Args:
+        values (Sequence): Cells of the column, eg. strings read from a CSV file
+        name (str, optional): Name of the column
+        formats (Sequence[str], optional): Datetime formats passed to `parse()`
+        config (DatetimeConfig, optional): Datetime Configuration
+        sample_size (int, optional): Maximum non-empty cells sampled
+        min_sample (int, optional): Sampled cells after which sampling stops
+        when they all have the same type
+        confidence (float, optional): Fraction of the cells that must convert
+
+    Returns:
+        ColumnProfile
+    """
+    # pylint: disable=C0415
+    import numpy as np
+
+    sample = _Sample(formats, config)
+    index = 0
+    while index < len(values) and sample.count < sample_size:
+        if not _is_empty(values[index]):
+            sample.add(index, values[index])
+            if sample.is_decided(min_sample, sample_size, confidence):
+                index += 1
+                break
+        index += 1
+    sampled = sample.count
+    kind = sample.kind(confidence)
+
+    def string_profile(count):
+        array = np.empty(len(values), dtype=object)
+        array[:] = list(values)
+        return ColumnProfile(name, STRING, array, None, count, 0, sampled)
+
+    if kind == STRING:
+        return string_profile(sampled + sum(not _is_empty(v) for v in values[index:]))
+
+    if kind == NUMERIC:
+        rest = values[index:]
+        mask, numbers = to_numeric(rest)
+        array = np.full(len(values), np.nan)
+        array[index:] = numbers
+        for position, number in sample.numbers.items():
+            array[position] = number
+        # Sampled compact dates, eg. 20211223, of a numeric column
+        compact_numbers = 0
+        for position in sample.datetimes:
+            number = _to_float(values[position])
+            if number is not None:
+                array[position] = number
+                compact_numbers += 1
+        rest_count = sum(not _is_empty(value) for value in rest)
+        count = sampled + rest_count
+        invalid = (
+            sampled
+            - len(sample.numbers)
+            - compact_numbers
+            + rest_count
+            - int(mask.sum())
+        )
+        if invalid > (1 - confidence) * count:
+            return string_profile(count)
+        return ColumnProfile(name, NUMERIC, array, None, count, invalid, sampled)
+
+    count = sampled
+    invalid = sampled - len(sample.datetimes)
+    converted = [None] * len(values)
+    for position, ts_datetime in sample.datetimes.items():
+        converted[position] = _datetime64_str(ts_datetime)
+    fmt = sample.candidates[0] if len(sample.candidates or ()) == 1 else None
+    convert = _datetime_converter((fmt, *formats) if fmt else formats, config)
+
+    # Beyond this many failures the column can't reach the confidence
+    max_invalid = (1 - confidence) * (len(values) - index + sampled)
+    for position in range(index, len(values)):
+        value = values[position]
+        if _is_empty(value):
+            continue
+        count += 1
+        result = convert(value)
+        if result is None:
+            invalid += 1
+            if invalid > max_invalid:
+                return string_profile(
+                    count + sum(not _is_empty(v) for v in values[position + 1 :])
+                )
+        else:
+            converted[position] = result
+    if invalid > (1 - confidence) * count:
+        return string_profile(count)
+    array = np.array(converted, dtype="datetime64[ns]")
+    return ColumnProfile(name, DATETIME, array, fmt, count, invalid, sampled)
+
+
+def profile_columns(
+    columns: Mapping[str, Sequence],
+    formats: Sequence[str] = (),
+    config: DatetimeConfig = DEFAULT_DATETIME_CONFIG,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    min_sample: int = DEFAULT_MIN_SAMPLE,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> Dict[str, ColumnProfile]:
+    """Profile each column of a table with `profile_column`.
+    Rows read with `csv.reader` can be passed as `dict(zip(header, zip(*rows)))`.
+
+    Returns:
+        Dict[str, ColumnProfile]: Profile of each column, by name
+    """
+    return {
+        name: profile_column(
+            values, name, formats, config, sample_size, min_sample, confidence
+        )
+        for name, values in columns.items()
+    }
@@ -1,12 +1,34 @@
-from typing import Union
+import json
+import threading
+from datetime import tzinfo as dt_tzinfo
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Union
 import warnings
-import dateparser
-import arrow
-from dateutil import tz
+from task_script_utils.datetime_parser.datetime_config import DatetimeConfig
+from task_script_utils.datetime_parser.parser_exceptions import DatetimeParserError
 
+# dateparser, arrow and dateutil are imported when they are first needed,
+# so that importing this module stays cheap.
+if TYPE_CHECKING:
+    from dateparser.date import DateDataParser
+    from dateutil import tz
 
+TS_DATETIME_FORMAT = "YYYY-MM-DDTHH:mm:ss.SSSZ"
+
+# Configured dateparser parsers, kept warm between calls.
+# Each thread has its own parsers, so that threads don't contend for the
+# lock of a shared `DateDataParser`.
+_date_data_parsers = threading.local()
+
+
+# pylint: disable=R0913
 def convert_datetime_to_ts_format(
-    datetime, datetime_format: str = "", timezone: Union[tz.tzoffset, str] = ""
+    datetime,
+    datetime_format: str = "",
+    timezone: Union["tz.tzoffset", str] = "",
+    languages: Optional[Sequence[str]] = None,
+    locales: Optional[Sequence[str]] = None,
+    dateparser_settings: Optional[dict] = None,
+    datetime_config: Optional[DatetimeConfig] = None,
 ):
     """Convert datetime to TetraScience standard: ISO-8601 in milliseconds in UTC if
     timezone is available
@@ -21,6 +43,18 @@ def convert_datetime_to_ts_format(
         overwrite the timezone extracted from the raw datetime. It can be either
         string (i.e. "GMT-5") or a timezone type recognized by the arrow.get function.
 
+        languages - dateparser language codes (i.e. ["en"]) used when there is no
+        datetime_format. Restricting languages skips dateparser's language detection.
+
+        locales - dateparser locale codes (i.e. ["en-GB"]) used when there is no
+        datetime_format.
+
+        dateparser_settings - dateparser settings used when there is no
+        datetime_format, see https://dateparser.readthedocs.io/en/latest/settings.html
+
+        datetime_config - if given, `task_script_utils.datetime_parser.parse` is
+        tried with this config before dateparser, and dateparser is only used if
+        it can't parse the datetime.
 
     Output:
         Datetime string in ISO-8601 with millisecond precision. If timezone is defined,
@@ -32,10 +66,15 @@ def convert_datetime_to_ts_format(
     """
 
     if datetime_format:
+        import arrow  # pylint: disable=C0415
+
         parsed_time = arrow.get(datetime, datetime_format)
         parser_name = "arrow"
     else:
-        parsed_time = dateparser.parse(datetime)
+        date_data_parser = _get_date_data_parser(
+            languages, locales, dateparser_settings
+        )
+        parsed_time = _parse_without_format(datetime, date_data_parser, datetime_config)
         parser_name = "dateparser"
 
     if parsed_time is None:
@@ -45,31 +84,165 @@ def convert_datetime_to_ts_format(
         )
 
     timezone_to_use = parsed_time.tzinfo
-
     if timezone:
-        try:
-            timezone_to_use = tz.gettz(timezone)
-        except TypeError:
-            warnings.warn(
+        timezone_to_use = _resolve_timezone(timezone)
+
+    return _format_as_ts_datetime(parsed_time, timezone_to_use)
+
+
+# pylint: disable=R0913
+def convert_datetimes_to_ts_format(
+    datetimes: Iterable,
+    datetime_format: str = "",
+    timezone: Union["tz.tzoffset", str] = "",
+    languages: Optional[Sequence[str]] = None,
+    locales: Optional[Sequence[str]] = None,
+    dateparser_settings: Optional[dict] = None,
+    datetime_config: Optional[DatetimeConfig] = None,
+) -> List[str]:
+    """Batch counterpart of `convert_datetime_to_ts_format`.
+    The arrow or dateparser parser is built and `timezone` is resolved
+    once for all values, instead of once per value.
+
+    Inputs:
+        datetimes - iterable of raw datetimes
+
+        datetime_format - raw datetime format build using arrow tokens
+        link: must follow https://arrow.readthedocs.io/en/stable/#format
+
+        timezone, languages, locales, dateparser_settings, datetime_config -
+        see `convert_datetime_to_ts_format`
+
+    Output:
+        List of datetime strings in the same order as `datetimes`. Each string is
+        identical to the output of `convert_datetime_to_ts_format` for that value.
+    """
+    # pylint: disable=C0415
+    import arrow
+    from arrow.parser import DateTimeParser
+
+    timezone_override = _resolve_timezone(timezone) if timezone else None
+    arrow_parser = DateTimeParser(cache_size=1) if datetime_format else None
+    date_data_parser = _get_date_data_parser(languages, locales, dateparser_settings)
+
+    ts_datetimes = []
+    for datetime in datetimes:
+        if arrow_parser is not None:
+            parsed_time = arrow.Arrow.fromdatetime(
+                arrow_parser.parse(datetime, datetime_format)
+            )
+            parser_name = "arrow"
+        else:
+            parsed_time = _parse_without_format(
+                datetime, date_data_parser, datetime_config
+            )
+            parser_name = "dateparser"
+
+        if parsed_time is None:
+            raise ValueError(
                 # pylint: disable=C0301
-                "The provided timezone can't be parsed by dateutil tz, going to use the plain value"  # noqa: E501
+                f"Could not parse input datetime string {datetime} using {parser_name} and the following input formats: {datetime_format}"  # noqa: E501
             )
-            timezone_to_use = timezone
 
-    datetime_iso_local = ""
-    utc_indicator = ""
+        timezone_to_use = timezone_override if timezone else parsed_time.tzinfo
+        ts_datetimes.append(_format_as_ts_datetime(parsed_time, timezone_to_use))
 
-    if timezone_to_use:
-        datetime_iso_local = arrow.get(str(parsed_time), tzinfo=timezone_to_use)
-        utc_indicator = "Z"
+    return ts_datetimes
 
+
+def _get_date_data_parser(
+    languages: Optional[Sequence[str]],
+    locales: Optional[Sequence[str]],
+    settings: Optional[dict],
+) -> Optional["DateDataParser"]:
+    """Return a cached dateparser `DateDataParser` for the given options,
+    or None if no option is set and `dateparser.parse` defaults apply.
+    """
+    if not (languages or locales or settings):
+        return None
+
+    key = (
+        tuple(languages or ()),
+        tuple(locales or ()),
+        json.dumps(settings or {}, sort_keys=True, default=str),
+    )
+    parsers = _thread_date_data_parsers()
+    if key not in parsers:
+        from dateparser.date import DateDataParser  # pylint: disable=C0415
+
+        parsers[key] = DateDataParser(
+            languages=list(languages) if languages else None,
+            locales=list(locales) if locales else None,
+            settings=settings,
+        )
+    return parsers[key]
+
+
+def _thread_date_data_parsers() -> dict:
+    """Return the configured dateparser parsers of the current thread"""
+    if not hasattr(_date_data_parsers, "parsers"):
+        _date_data_parsers.parsers = {}
+    return _date_data_parsers.parsers
+
+
+def _parse_without_format(
+    datetime,
+    date_data_parser: Optional["DateDataParser"],
+    datetime_config: Optional[DatetimeConfig],
+):
+    if datetime_config is not None:
+        from task_script_utils.datetime_parser import parse  # pylint: disable=C0415
+
+        try:
+            return parse(datetime, config=datetime_config).datetime
+        except (DatetimeParserError, ValueError):
+            pass
+
+    if date_data_parser is None:
+        import dateparser  # pylint: disable=C0415
+
+        return dateparser.parse(datetime)
+    return date_data_parser.get_date_data(datetime)["date_obj"]
+
+
+def _resolve_timezone(timezone: Union["tz.tzoffset", str]):
+    from dateutil import tz  # pylint: disable=C0415
+
+    try:
+        return tz.gettz(timezone)
+    except TypeError:
+        warnings.warn(
+            # pylint: disable=C0301
+            "The provided timezone can't be parsed by dateutil tz, going to use the plain value"  # noqa: E501
+        )
+        return timezone
+
+
+def _format_as_ts_datetime(parsed_time, timezone_to_use) -> str:
+    """Interpret the wall clock time of `parsed_time` in `timezone_to_use`
+    and format it as a TetraScience datetime string in UTC.
+    """
+    # pylint: disable=C0415
+    import arrow
+    from dateutil import tz
+
+    utc_indicator = "Z" if timezone_to_use else ""
+    if not timezone_to_use:
+        timezone_to_use = tz.gettz("GMT")
+
+    if isinstance(timezone_to_use, dt_tzinfo):
+        if isinstance(parsed_time, arrow.Arrow):
+            parsed_time = parsed_time.datetime
+        # Same as re-parsing `str(parsed_time)` with `tzinfo=timezone_to_use`,
+        # without formatting and parsing an intermediate string
+        datetime_iso_local = arrow.Arrow.fromdatetime(
+            parsed_time.replace(fold=0), tzinfo=timezone_to_use
+        )
     else:
-        datetime_iso_local = arrow.get(str(parsed_time), tzinfo=tz.gettz("GMT"))
+        datetime_iso_local = arrow.get(str(parsed_time), tzinfo=timezone_to_use)
 
-    ts_datetime = (
+    return (
         datetime_iso_local.to("GMT")
-        .format("YYYY-MM-DDTHH:mm:ss.SSSZ")
+        .format(TS_DATETIME_FORMAT)
         .replace("+0000", utc_indicator)
     )
-
-    return ts_datetime
@@ -1,2 +1,30 @@
-from .parser import parse  # noqa F401
-from .datetime_config import DatetimeConfig  # noqa F401
+# `parse` and `DatetimeConfig` are loaded on first access (PEP 562), so that
+# importing a single submodule, e.g. `parser_exceptions`, doesn't load pendulum.
+_LAZY_ATTRIBUTES = {
+    "parse": ".parser",
+    "DatetimeConfig": ".datetime_config",
+    "parse_many": ".batch",
+    "parse_many_async": ".async_batch",
+    "aiter_parse": ".async_batch",
+    "warm_up": ".warmup",
+    "load_parser_cache": ".parser_cache",
+    "save_parser_cache": ".parser_cache",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # pylint: disable=C0415
+    from importlib import import_module
+
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,190 @@
+# asyncio counterparts of `parse_many`. Values are parsed in chunks on an
+# executor, so the event loop keeps running other tasks (eg. file I/O)
+# between and while chunks are parsed.
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .batch import parse_many
+from .datetime_config import DatetimeConfig
+from .ts_datetime import TSDatetime
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+def _parse_chunk(
+    values: List[str],
+    formats: Sequence[str],
+    config: Optional[DatetimeConfig],
+    errors: str,
+) -> List[Optional[TSDatetime]]:
+    return parse_many(values, formats, config, errors=errors)
+
+
+class _ChunkParser:
+    """Runs `_parse_chunk` on an executor. Executors created from "thread" or
+    "process" are owned by the parser and shut down by `close`.
+    """
+
+    def __init__(
+        self,
+        executor: Union[None, str, Executor],
+        workers: Optional[int],
+        formats: Sequence[str],
+        config: Optional[DatetimeConfig],
+        errors: str,
+    ):
+        if errors not in ("raise", "coerce"):
+            raise ValueError(f"errors must be 'raise' or 'coerce', got {errors!r}")
+        if isinstance(executor, str):
+            if executor not in _EXECUTORS:
+                raise ValueError(
+                    f"executor must be one of {tuple(_EXECUTORS)}, got {executor!r}"
+                )
+            executor = _EXECUTORS[executor](max_workers=workers)
+            self._owns_executor = True
+        else:
+            self._owns_executor = False
+
+        self.executor = executor
+        self.formats = tuple(formats)
+        self.config = config
+        self.errors = errors
+
+    def parse(self, chunk: List[str]) -> "asyncio.Future":
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(
+            self.executor, _parse_chunk, chunk, self.formats, self.config, self.errors
+        )
+
+    def close(self):
+        if self._owns_executor:
+            # Chunks that didn't start yet are cancelled by their asyncio future
+            self.executor.shutdown(wait=False)
+
+
+def _chunks(values: Sequence[str], chunk_size: int) -> List[List[str]]:
+    values = list(values)
+    return [
+        values[start : start + chunk_size]
+        for start in range(0, len(values), chunk_size)
+    ]
+
+
+async def _achunks(
+    values: Union[Iterable[str], AsyncIterable[str]], chunk_size: int
+) -> AsyncIterator[List[str]]:
+    chunk = []
+    if hasattr(values, "__aiter__"):
+        async for value in values:
+            chunk.append(value)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for value in values:
+            chunk.append(value)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _check_chunk_size(chunk_size: int):
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size!r}")
+
+
+async def parse_many_async(
+    values: Sequence[str],
+    formats: Sequence[str] = (),
+    config: Optional[DatetimeConfig] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Union[None, str, Executor] = None,
+    workers: Optional[int] = None,
+    errors: str = "raise",
+) -> List[Optional[TSDatetime]]:
+    """Parse a column of datetime strings without blocking the event loop.
+    The column is split in chunks of `chunk_size` values, which are parsed
+    concurrently on `executor`. Cancelling the calling task, or a chunk
+    failing with errors="raise", cancels the chunks that haven't started yet.
+
+    Args:
+        values (Sequence[str]): Raw datetime strings
+        formats (Sequence[str], optional): List of possible datetime
+        formats. Defaults to empty tuple.
+        config (DatetimeConfig, optional): Datetime Configuration.
+        Defaults to DEFAULT_DATETIME_CONFIG.
+        chunk_size (int, optional): Number of values per chunk.
+        Defaults to DEFAULT_CHUNK_SIZE.
+        executor (Union[None, str, Executor], optional): An Executor, "thread" or
+        "process" to create one for this call, or None for the default executor
+        of the event loop. Defaults to None.
+        workers (int, optional): Number of workers of an executor created for
+        this call. Defaults to None.
+        errors (str, optional): "raise" or "coerce", see `parse_many`.
+        Defaults to "raise".
+
+    Raises:
+        ValueError: When `chunk_size`, `executor` or `errors` is not valid
+        DatetimeParserError: When a value can't be parsed and errors="raise",
+        for the first such value in the order of `values`
+
+    Returns:
+        List[Optional[TSDatetime]]: Parsed datetimes in the order of `values`
+    """
+    _check_chunk_size(chunk_size)
+    parser = _ChunkParser(executor, workers, formats, config, errors)
+    futures = []
+    try:
+        futures = [parser.parse(chunk) for chunk in _chunks(values, chunk_size)]
+        # Chunks are awaited in order, so that the error of the earliest
+        # failing chunk is raised, whichever chunk fails first
+        chunks = [await future for future in futures]
+    finally:
+        for future in futures:
+            if not future.cancel() and not future.cancelled():
+                # Retrieve the errors of other failed chunks, so that asyncio
+                # doesn't log them as never retrieved
+                future.exception()
+        parser.close()
+    return [parsed for chunk in chunks for parsed in chunk]
+
+
+async def aiter_parse(
+    values: Union[Iterable[str], AsyncIterable[str]],
+    formats: Sequence[str] = (),
+    config: Optional[DatetimeConfig] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Union[None, str, Executor] = None,
+    workers: Optional[int] = None,
+    errors: str = "raise",
+) -> AsyncIterator[Optional[TSDatetime]]:
+    """Parse a stream of datetime strings without blocking the event loop,
+    yielding parsed datetimes in order. `values` can be an iterable or an
+    async iterable, eg. rows read from a file. Values are parsed one chunk
+    at a time, the event loop runs other tasks while a chunk is parsed.
+    See `parse_many_async` for the arguments.
+
+    Yields:
+        Optional[TSDatetime]: Parsed datetimes in the order of `values`
+    """
+    _check_chunk_size(chunk_size)
+    parser = _ChunkParser(executor, workers, formats, config, errors)
+    try:
+        async for chunk in _achunks(values, chunk_size):
+            for parsed in await parser.parse(chunk):
+                yield parsed
+    finally:
+        parser.close()
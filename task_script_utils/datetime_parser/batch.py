@@ -0,0 +1,489 @@
+# Batch parsing of datetime columns in worker processes.
+# Input strings are packed into one shared memory block (offsets followed by
+# UTF-8 bytes) and workers write each result as a fixed size numeric record
+# into a preallocated shared result array, so neither the column nor the
+# parsed datetimes are pickled between processes. The parent only decodes
+# the result records into `TSDatetime` objects.
+# `multiprocessing.shared_memory` is not available on Python 3.7, where
+# chunks of strings and result records are pickled instead.
+# With the thread executor, chunks are parsed by a thread pool of the calling
+# process and no transport is needed.
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from . import instrumentation
+from .datetime_config import DEFAULT_DATETIME_CONFIG, DatetimeConfig
+from .ts_datetime import TSDatetime
+
+# Status code of each result record
+PARSED = 0
+FAILED = 1
+# Parsed, but the result can't be encoded as a record, eg. more than
+# 18 digits of fractional seconds. These values are parsed again by the parent.
+NOT_ENCODED = 2
+
+# Numeric record of a parsed TSDatetime.
+# `seconds` counts wall clock seconds since 1970-01-01, `tz` is -1 for naive
+# datetimes, 0 for fixed offsets and 1 + the index in `_timezone_names()`
+# for IANA timezones. `subsecond_digits` is -1 when there are no subseconds.
+RESULT_FIELDS = (
+    ("status", "i1"),
+    ("fold", "i1"),
+    ("subsecond_digits", "i1"),
+    ("tz", "i4"),
+    ("offset", "i4"),
+    ("microsecond", "i4"),
+    ("seconds", "i8"),
+    ("subseconds", "i8"),
+)
+_EMPTY_RECORD = (FAILED, 0, -1, -1, 0, 0, 0, 0)
+_MAX_SUBSECOND_DIGITS = 18
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_ERRORS = ("raise", "coerce")
+_EXECUTORS = ("process", "thread")
+
+
+@lru_cache(maxsize=1)
+def _timezone_names() -> Tuple[str, ...]:
+    # pylint: disable=C0415
+    import pendulum
+
+    return tuple(sorted(pendulum.timezones))
+
+
+@lru_cache(maxsize=1)
+def _timezone_ids() -> dict:
+    return {name: index + 1 for index, name in enumerate(_timezone_names())}
+
+
+def encode_ts_datetime(ts_datetime: TSDatetime) -> Optional[tuple]:
+    """Encode a TSDatetime as a result record, in the order of `RESULT_FIELDS`.
+    Returns None if it can't be encoded.
+    """
+    # pylint: disable=C0415,W0212
+    from pendulum.tz.timezone import FixedTimezone, Timezone
+
+    datetime_ = ts_datetime._datetime
+    tzinfo = datetime_.tzinfo
+    if tzinfo is None:
+        tz_id, offset = -1, 0
+    elif isinstance(tzinfo, FixedTimezone):
+        tz_id, offset = 0, int(tzinfo.offset)
+    elif isinstance(tzinfo, Timezone) and tzinfo.name in _timezone_ids():
+        tz_id, offset = _timezone_ids()[tzinfo.name], 0
+    else:
+        return None
+
+    subseconds = ts_datetime._subseconds
+    if subseconds is None:
+        subsecond_digits, subseconds_value = -1, 0
+    elif len(subseconds) > _MAX_SUBSECOND_DIGITS or not (
+        subseconds.isascii() and (subseconds.isdigit() or not subseconds)
+    ):
+        return None
+    else:
+        subsecond_digits, subseconds_value = len(subseconds), int(subseconds or 0)
+
+    days = datetime_.toordinal() - _EPOCH_ORDINAL
+    seconds = (
+        days * 86400 + datetime_.hour * 3600 + datetime_.minute * 60 + datetime_.second
+    )
+    return (
+        PARSED,
+        datetime_.fold,
+        subsecond_digits,
+        tz_id,
+        offset,
+        datetime_.microsecond,
+        seconds,
+        subseconds_value,
+    )
+
+
+def decode_ts_datetime(record: tuple) -> TSDatetime:
+    """Build the TSDatetime encoded in a result record"""
+    # pylint: disable=C0415
+    from pendulum import DateTime
+    from .tz_registry import get_fixed_timezone, get_timezone
+
+    (
+        _,
+        fold,
+        subsecond_digits,
+        tz_id,
+        offset,
+        microsecond,
+        seconds,
+        subseconds_value,
+    ) = record
+
+    if tz_id < 0:
+        tzinfo = None
+    elif tz_id == 0:
+        tzinfo = get_fixed_timezone(offset)
+    else:
+        tzinfo = get_timezone(_timezone_names()[tz_id - 1])
+
+    days, seconds = divmod(seconds, 86400)
+    hour, seconds = divmod(seconds, 3600)
+    minute, second = divmod(seconds, 60)
+    day = date.fromordinal(days + _EPOCH_ORDINAL)
+    datetime_ = DateTime(
+        day.year,
+        day.month,
+        day.day,
+        hour,
+        minute,
+        second,
+        microsecond,
+        tzinfo=tzinfo,
+        fold=fold,
+    )
+
+    if subsecond_digits < 0:
+        subseconds = None
+    elif subsecond_digits == 0:
+        subseconds = ""
+    else:
+        subseconds = str(subseconds_value).zfill(subsecond_digits)
+    return TSDatetime(datetime_=datetime_, subseconds=subseconds)
+
+
+# numpy datetime units formatting the subseconds of each number of digits
+_NUMPY_UNITS = {-1: "s", 3: "ms", 6: "us", 9: "ns"}
+# Seconds from 1970 that fit in datetime64[ns]
+_MAX_NANOSECOND_SECONDS = 9_200_000_000
+
+
+def _format_seconds(seconds, subseconds, subsecond_digits: int) -> List[str]:
+    """Format UTC seconds and subseconds with the same number of digits
+    as `tsformat()` does, without the "Z" suffix.
+    """
+    import numpy as np  # pylint: disable=C0415
+
+    stamps = seconds.astype("datetime64[s]")
+    unit = _NUMPY_UNITS.get(subsecond_digits)
+    if unit == "ns" and np.abs(seconds).max() >= _MAX_NANOSECOND_SECONDS:
+        unit = None
+    if unit is not None:
+        stamps = stamps.astype(f"datetime64[{unit}]")
+        stamps += subseconds.astype(f"timedelta64[{unit}]")
+        return np.datetime_as_string(stamps).tolist()
+
+    stamps = np.datetime_as_string(stamps).tolist()
+    return [
+        f"{stamp}.{str(value).zfill(subsecond_digits) if subsecond_digits else ''}"
+        for stamp, value in zip(stamps, subseconds.tolist())
+    ]
+
+
+def records_to_tsformat(records) -> List[Optional[str]]:
+    """Return the `tsformat()` of each result record, None for the records
+    that are not PARSED. Records of naive datetimes and fixed offsets are
+    formatted with numpy, records of IANA timezones are decoded first.
+
+    Args:
+        records: A numpy array with the fields of `RESULT_FIELDS`
+    """
+    import numpy as np  # pylint: disable=C0415
+
+    records = np.asarray(records, dtype=list(RESULT_FIELDS))
+    parsed = records["status"] == PARSED
+    tz_ids = records["tz"]
+    utc_seconds = records["seconds"] - np.where(tz_ids == 0, records["offset"], 0)
+    digits = records["subsecond_digits"]
+
+    tsformats = [None] * len(records)
+    # Naive datetimes and fixed offsets, by number of subsecond digits
+    for subsecond_digits in np.unique(digits[parsed & (tz_ids <= 0)]).tolist():
+        for tz_id, suffix in ((-1, ""), (0, "Z")):
+            rows = np.flatnonzero(
+                parsed & (tz_ids == tz_id) & (digits == subsecond_digits)
+            )
+            if not rows.size:
+                continue
+            stamps = _format_seconds(
+                utc_seconds[rows], records["subseconds"][rows], subsecond_digits
+            )
+            for row, stamp in zip(rows.tolist(), stamps):
+                tsformats[row] = f"{stamp}{suffix}"
+    for row in np.flatnonzero(parsed & (tz_ids > 0)).tolist():
+        tsformats[row] = decode_ts_datetime(records[row].tolist()).tsformat()
+    return tsformats
+
+
+def _parse_to_record(value: str, formats: Sequence[str], config: DatetimeConfig):
+    # Instrumentation hooks inherited by forked workers are not called
+    # pylint: disable=C0415
+    from .parser import _parse
+
+    try:
+        ts_datetime = _parse(value, formats, config)
+    # Any error is raised again when the parent parses the value
+    except Exception:  # pylint: disable=W0703
+        return _EMPTY_RECORD
+
+    record = encode_ts_datetime(ts_datetime)
+    if record is None:
+        return (NOT_ENCODED, *_EMPTY_RECORD[1:])
+    return record
+
+
+def _parse_shared_chunk(
+    input_name: str,
+    result_name: str,
+    count: int,
+    start: int,
+    stop: int,
+    formats: Sequence[str],
+    config: DatetimeConfig,
+):
+    """Parse the strings `start` to `stop` of a shared input block and write
+    their records to the shared result array. Runs in a worker process.
+    """
+    # pylint: disable=C0415
+    from multiprocessing import shared_memory
+
+    import numpy as np
+
+    input_block = shared_memory.SharedMemory(name=input_name)
+    result_block = shared_memory.SharedMemory(name=result_name)
+    try:
+        offsets = np.ndarray((count + 1,), dtype=np.int64, buffer=input_block.buf)
+        data = input_block.buf[offsets.nbytes :]
+        results = np.ndarray(
+            (count,), dtype=list(RESULT_FIELDS), buffer=result_block.buf
+        )
+        bounds = offsets[start : stop + 1].tolist()
+        for index in range(start, stop):
+            begin, end = bounds[index - start], bounds[index - start + 1]
+            value = str(data[begin:end], "utf-8", "surrogatepass")
+            results[index] = _parse_to_record(value, formats, config)
+        # Views must be released before the blocks are closed
+        del offsets, results
+        data.release()
+    finally:
+        input_block.close()
+        result_block.close()
+
+
+def _parse_pickled_chunk(
+    values: Sequence[str], formats: Sequence[str], config: DatetimeConfig
+) -> List[tuple]:
+    """Parse a chunk of strings into records. Runs in a worker process."""
+    return [_parse_to_record(value, formats, config) for value in values]
+
+
+def _chunk_bounds(count: int, workers: int) -> List[Tuple[int, int]]:
+    # Several chunks per worker, so that slow chunks are balanced
+    chunk_size = max(1, -(-count // (workers * 4)))
+    return [
+        (start, min(start + chunk_size, count)) for start in range(0, count, chunk_size)
+    ]
+
+
+def _pack_strings(values: Sequence[str]):
+    """Return the offsets array and concatenated UTF-8 bytes of `values`"""
+    import numpy as np  # pylint: disable=C0415
+
+    encoded = [value.encode("utf-8", "surrogatepass") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    return offsets, b"".join(encoded)
+
+
+def _parse_records_shared(values, formats, config, workers):
+    # pylint: disable=C0415
+    from multiprocessing import shared_memory
+
+    import numpy as np
+
+    count = len(values)
+    offsets, data = _pack_strings(values)
+    dtype = np.dtype(list(RESULT_FIELDS))
+    input_block = shared_memory.SharedMemory(
+        create=True, size=max(1, offsets.nbytes + len(data))
+    )
+    result_block = shared_memory.SharedMemory(
+        create=True, size=max(1, dtype.itemsize * count)
+    )
+    try:
+        input_block.buf[: offsets.nbytes] = offsets.tobytes()
+        input_block.buf[offsets.nbytes : offsets.nbytes + len(data)] = data
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _parse_shared_chunk,
+                    input_block.name,
+                    result_block.name,
+                    count,
+                    start,
+                    stop,
+                    formats,
+                    config,
+                )
+                for start, stop in _chunk_bounds(count, workers)
+            ]
+            for future in futures:
+                future.result()
+        results = np.ndarray((count,), dtype=dtype, buffer=result_block.buf)
+        records = results.tolist()
+        del results
+        return records
+    finally:
+        input_block.close()
+        input_block.unlink()
+        result_block.close()
+        result_block.unlink()
+
+
+def _parse_records_pickled(values, formats, config, workers):
+    records = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_parse_pickled_chunk, values[start:stop], formats, config)
+            for start, stop in _chunk_bounds(len(values), workers)
+        ]
+        for future in futures:
+            records.extend(future.result())
+    return records
+
+
+def _parse_chunk_in_thread(
+    values: Sequence[str], formats: Sequence[str], config: DatetimeConfig
+) -> list:
+    """Parse a chunk of strings, returning the raised error in place of the
+    values that can't be parsed.
+    """
+    # pylint: disable=C0415
+    from .parser import parse
+
+    parsed = []
+    for value in values:
+        try:
+            parsed.append(parse(value, formats, config))
+        except Exception as error:  # pylint: disable=W0703
+            parsed.append(error)
+    return parsed
+
+
+def _parse_in_threads(values, formats, config, workers) -> list:
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_parse_chunk_in_thread, values[start:stop], formats, config)
+            for start, stop in _chunk_bounds(len(values), workers)
+        ]
+        return [parsed for future in futures for parsed in future.result()]
+
+
+def _has_shared_memory() -> bool:
+    return importlib.util.find_spec("multiprocessing.shared_memory") is not None
+
+
+def parse_many(
+    values: Sequence[str],
+    formats: Sequence[str] = (),
+    config: Optional[DatetimeConfig] = None,
+    workers: int = 1,
+    errors: str = "raise",
+    executor: str = "process",
+) -> List[Optional[TSDatetime]]:
+    """Parse a column of datetime strings, optionally in worker processes
+    or threads. Every value is parsed exactly like `parse(value, formats, config)`
+    would.
+
+    Args:
+        values (Sequence[str]): Raw datetime strings
+        formats (Sequence[str], optional): List of possible datetime
+        formats. Defaults to empty tuple.
+        config (DatetimeConfig, optional): Datetime Configuration.
+        Defaults to DEFAULT_DATETIME_CONFIG.
+        workers (int, optional): Number of worker processes or threads. With 1,
+        values are parsed in the calling thread. Defaults to 1.
+        errors (str, optional): "raise" to raise the error of the first value
+        that can't be parsed, "coerce" to return None for it. Defaults to "raise".
+        executor (str, optional): "process" to parse in worker processes,
+        "thread" to parse in a thread pool. Threads only parse in parallel on
+        free-threaded Python builds. Defaults to "process".
+        With instrumentation enabled, values parsed in threads emit a
+        ParseEvent each, values parsed in worker processes don't, except the
+        ones that fail and are parsed again in the calling process. Every call
+        emits a BatchEvent.
+
+    Raises:
+        ValueError: When `workers`, `errors` or `executor` is not valid
+
+    Returns:
+        List[Optional[TSDatetime]]: Parsed datetimes in the order of `values`
+    """
+    if errors not in _ERRORS:
+        raise ValueError(f"errors must be one of {_ERRORS}, got {errors!r}")
+    if workers is None or workers < 1:
+        raise ValueError(f"workers must be a positive integer, got {workers!r}")
+    if executor not in _EXECUTORS:
+        raise ValueError(f"executor must be one of {_EXECUTORS}, got {executor!r}")
+
+    config = config or DEFAULT_DATETIME_CONFIG
+    formats = tuple(formats)
+    values = list(values)
+    if instrumentation.ENABLED:
+        return instrumentation.trace_batch(
+            _parse_many, values, formats, config, workers, errors, executor
+        )
+    return _parse_many(values, formats, config, workers, errors, executor)
+
+
+def _parse_many(
+    values: List[str],
+    formats: Tuple[str, ...],
+    config: DatetimeConfig,
+    workers: int,
+    errors: str,
+    executor: str,
+) -> List[Optional[TSDatetime]]:
+    # pylint: disable=C0415
+    from .parser import parse
+
+    def parse_in_parent(value):
+        if errors == "raise":
+            return parse(value, formats, config)
+        try:
+            return parse(value, formats, config)
+        except Exception:  # pylint: disable=W0703
+            return None
+
+    if workers == 1 or len(values) < 2:
+        return [parse_in_parent(value) for value in values]
+
+    if executor == "thread":
+        parsed = _parse_in_threads(values, formats, config, workers)
+        for index, value in enumerate(parsed):
+            if isinstance(value, Exception):
+                if errors == "raise":
+                    raise value
+                parsed[index] = None
+        return parsed
+
+    # Values that are not strings are left to the parent, so that they
+    # fail exactly like `parse()` does
+    foreign = {
+        index for index, value in enumerate(values) if not isinstance(value, str)
+    }
+    packed = ["" if index in foreign else value for index, value in enumerate(values)]
+
+    if _has_shared_memory():
+        records = _parse_records_shared(packed, formats, config, workers)
+    else:
+        records = _parse_records_pickled(packed, formats, config, workers)
+
+    parsed = []
+    for index, (value, record) in enumerate(zip(values, records)):
+        if record[0] == PARSED and index not in foreign:
+            parsed.append(decode_ts_datetime(record))
+        else:
+            parsed.append(parse_in_parent(value))
+    return parsed
@@ -0,0 +1,392 @@
+# Command-line converter of timestamp columns in CSV/TSV files, run with
+# `python -m task_script_utils.datetime_parser`. Rows are streamed in chunks,
+# so files of any size are converted in bounded memory.
+import argparse
+import csv
+import io
+import os
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from time import perf_counter
+from typing import List, Optional, Sequence, Tuple
+
+from .datetime_config import DatetimeConfig
+
+DEFAULT_CHUNK_SIZE = 5000
+TSV_EXTENSIONS = (".tsv", ".tab")
+ERROR_COLUMNS = ("row", "column", "value", "error")
+
+# tsformat() of a value, or None and the error message
+Converted = Tuple[Optional[str], Optional[str]]
+
+
+def convert_values(
+    values: Sequence[str], formats: Sequence[str], config: DatetimeConfig
+) -> List[Converted]:
+    """Parse values into `tsformat()` strings. Runs in worker processes."""
+    from .parser import parse  # pylint: disable=C0415
+
+    converted = []
+    for value in values:
+        try:
+            converted.append((parse(value, formats, config).tsformat(), None))
+        except Exception as error:  # pylint: disable=W0703
+            converted.append((None, f"{type(error).__name__}: {error}"))
+    return converted
+
+
+def _tz_entry(entry: str) -> Tuple[str, str]:
+    abbreviation, separator, offset = entry.partition("=")
+    if not separator or not abbreviation or not offset:
+        raise argparse.ArgumentTypeError(f"expected ABBREVIATION=OFFSET, got {entry!r}")
+    return abbreviation, offset
+
+
+def _argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m task_script_utils.datetime_parser",
+        description="Convert timestamp columns of a CSV or TSV file to tsformat()",
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-", help="Input file, - for stdin (default)"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="Output file, - for stdout (default)"
+    )
+    parser.add_argument(
+        "-c",
+        "--column",
+        dest="columns",
+        action="append",
+        required=True,
+        help="Column to convert, by header name or 0-based index. Repeatable",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        dest="formats",
+        action="append",
+        default=[],
+        help="Datetime format in pendulum tokens, tried in order. Repeatable",
+    )
+    parser.add_argument(
+        "--suffix",
+        help="Write the converted values to new columns named <column><suffix> "
+        "instead of replacing the values",
+    )
+    parser.add_argument(
+        "-d",
+        "--delimiter",
+        help="Field delimiter. Defaults to a tab for .tsv and .tab files, "
+        "a comma otherwise",
+    )
+    parser.add_argument(
+        "--tsv",
+        action="store_const",
+        const="\t",
+        dest="delimiter",
+        help="Tab delimited",
+    )
+    parser.add_argument(
+        "--no-header",
+        dest="header",
+        action="store_false",
+        help="The first row is data, columns are selected by index",
+    )
+    parser.add_argument("--encoding", default="utf-8")
+    parser.add_argument(
+        "--errors-file",
+        help="Write the values that can't be parsed to this CSV file, with their "
+        "row number, column and error",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Rows parsed at a time (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="Don't print the summary"
+    )
+
+    config = parser.add_argument_group("DatetimeConfig")
+    config.add_argument("--day-first", action="store_const", const=True)
+    config.add_argument(
+        "--no-day-first", action="store_const", const=False, dest="day_first"
+    )
+    config.add_argument("--year-first", action="store_const", const=True)
+    config.add_argument(
+        "--no-year-first", action="store_const", const=False, dest="year_first"
+    )
+    config.add_argument("--fold", type=int, choices=(0, 1))
+    config.add_argument(
+        "--tz",
+        type=_tz_entry,
+        action="append",
+        default=[],
+        metavar="ABBREVIATION=OFFSET",
+        help="Offset of an abbreviated timezone, eg. IST=+05:30. Repeatable",
+    )
+    config.add_argument("--require-unambiguous-formats", action="store_true")
+    config.add_argument(
+        "--locale",
+        dest="locales",
+        action="append",
+        help="pendulum locale of month and weekday names. Repeatable",
+    )
+    return parser
+
+
+def _config(args: argparse.Namespace) -> DatetimeConfig:
+    return DatetimeConfig(
+        day_first=args.day_first,
+        year_first=args.year_first,
+        tz_dict=dict(args.tz),
+        fold=args.fold,
+        require_unambiguous_formats=args.require_unambiguous_formats,
+        locales=args.locales or ("en",),
+    )
+
+
+def _same_file(input_path: str, path: Optional[str]) -> bool:
+    """Return True if `path` is an existing file that is also the input"""
+    if input_path == "-" or path is None or path == "-":
+        return False
+    try:
+        return os.path.samefile(input_path, path)
+    except OSError:
+        return False
+
+
+def _column_indexes(columns: Sequence[str], header: Optional[List[str]]) -> List[int]:
+    """Resolve column names and indexes.
+
+    Raises:
+        ValueError: When a column doesn't exist
+    """
+    indexes = []
+    for column in columns:
+        if header is not None and column in header:
+            indexes.append(header.index(column))
+        elif column.isdigit() and (header is None or int(column) < len(header)):
+            indexes.append(int(column))
+        else:
+            raise ValueError(f"Column not found: {column!r}")
+    return indexes
+
+
+@contextmanager
+def _open(path: Optional[str], mode: str, encoding: str):
+    """Open a file, or stdin or stdout for "-". Yield None for no path."""
+    if path is None:
+        yield None
+    elif path == "-":
+        stream = sys.stdin if mode == "r" else sys.stdout
+        wrapper = io.TextIOWrapper(stream.buffer, encoding=encoding, newline="")
+        try:
+            yield wrapper
+        finally:
+            wrapper.flush()
+            # Leave the standard stream open
+            wrapper.detach()
+    else:
+        with open(path, mode, encoding=encoding, newline="") as file:
+            yield file
+
+
+class _Converter:
+    """Converts the selected cells of chunks of rows, in this process or in a
+    pool of worker processes. With workers, up to two chunks per worker are
+    parsed ahead of the chunk being written.
+    """
+
+    def __init__(self, formats, config, workers):
+        self.formats = tuple(formats)
+        self.config = config
+        self.workers = workers
+        self._executor = None
+        self._ahead = 0
+        if workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+            self._ahead = 2 * workers
+        self._pending = deque()
+
+    def _submit(self, values) -> List[Future]:
+        if self._executor is None:
+            future = Future()
+            future.set_result(convert_values(values, self.formats, self.config))
+            return [future]
+        # Split each chunk between the workers
+        size = max(1, -(-len(values) // self.workers))
+        return [
+            self._executor.submit(
+                convert_values, values[start : start + size], self.formats, self.config
+            )
+            for start in range(0, len(values), size)
+        ]
+
+    def _next(self):
+        rows, cells, futures = self._pending.popleft()
+        return rows, cells, [item for future in futures for item in future.result()]
+
+    def convert(self, chunks):
+        """Yield `(rows, cells, converted)` for each `(rows, cells)` chunk, in order"""
+        for rows, cells in chunks:
+            values = [rows[row][column] for row, column in cells]
+            self._pending.append((rows, cells, self._submit(values)))
+            if len(self._pending) > self._ahead:
+                yield self._next()
+        while self._pending:
+            yield self._next()
+
+    def close(self):
+        for _, _, futures in self._pending:
+            for future in futures:
+                future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown()
+
+
+def _chunks(reader, indexes, chunk_size):
+    """Yield chunks of rows, with the (row, column) of each non-empty cell to
+    convert. Rows too short for a column are left as they are.
+    """
+    rows = []
+    for row in reader:
+        rows.append(row)
+        if len(rows) == chunk_size:
+            yield rows, _cells(rows, indexes)
+            rows = []
+    if rows:
+        yield rows, _cells(rows, indexes)
+
+
+def _cells(rows, indexes):
+    return [
+        (row_index, column)
+        for row_index, row in enumerate(rows)
+        for column in indexes
+        if column < len(row) and row[column].strip()
+    ]
+
+
+def _convert_rows(args, indexes, names, width, reader, writer, error_writer):
+    """Convert the rows of `reader` and write them to `writer`. New columns are
+    appended after the first `width` columns, or after all the fields of rows
+    longer than `width`. Return the number of rows, of converted values and
+    of failures.
+    """
+    rows_count = values_count = failures = 0
+    converter = _Converter(args.formats, _config(args), args.workers)
+    try:
+        chunks = _chunks(reader, indexes, args.chunk_size)
+        for rows, cells, converted in converter.convert(chunks):
+            outputs = {}
+            for (row_index, column), (value, error) in zip(cells, converted):
+                if error is None:
+                    outputs[row_index, column] = value
+                    continue
+                failures += 1
+                if error_writer is not None:
+                    error_writer.writerow(
+                        (
+                            rows_count + row_index + 1,
+                            names[indexes.index(column)],
+                            rows[row_index][column],
+                            error,
+                        )
+                    )
+
+            for row_index, row in enumerate(rows):
+                if args.suffix is None:
+                    for column in indexes:
+                        if (row_index, column) in outputs:
+                            row[column] = outputs[row_index, column]
+                else:
+                    row = [
+                        *row,
+                        *([""] * (width - len(row))),
+                        *(outputs.get((row_index, column), "") for column in indexes),
+                    ]
+                writer.writerow(row)
+            rows_count += len(rows)
+            values_count += len(cells)
+    finally:
+        converter.close()
+    return rows_count, values_count, failures
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = _argument_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    delimiter = args.delimiter
+    if delimiter is None:
+        delimiter = "\t" if args.input.lower().endswith(TSV_EXTENSIONS) else ","
+    for option, path in (
+        ("--output", args.output),
+        ("--errors-file", args.errors_file),
+    ):
+        if _same_file(args.input, path):
+            parser.error(f"{option} must not be the input file")
+
+    start = perf_counter()
+    with _open(args.input, "r", args.encoding) as input_file:
+        width = 0
+        if args.suffix is not None and input_file.seekable():
+            # New columns go after the widest row, so that they line up when
+            # rows have more fields than the header or than each other
+            reader = csv.reader(input_file, delimiter=delimiter)
+            width = max(map(len, reader), default=0)
+            input_file.seek(0)
+        reader = csv.reader(input_file, delimiter=delimiter)
+        header = next(reader, None) if args.header else None
+        try:
+            indexes = _column_indexes(args.columns, header)
+        except ValueError as error:
+            parser.error(str(error))
+        names = [header[index] if header else str(index) for index in indexes]
+        width = max(width, len(header) if header else 0)
+
+        with _open(args.output, "w", args.encoding) as output_file, _open(
+            args.errors_file, "w", "utf-8"
+        ) as errors_file:
+            writer = csv.writer(output_file, delimiter=delimiter)
+            if header is not None:
+                if args.suffix is not None:
+                    header = [
+                        *header,
+                        *([""] * (width - len(header))),
+                        *(f"{name}{args.suffix}" for name in names),
+                    ]
+                writer.writerow(header)
+            error_writer = None
+            if errors_file is not None:
+                error_writer = csv.writer(errors_file)
+                error_writer.writerow(ERROR_COLUMNS)
+
+            rows_count, values_count, failures = _convert_rows(
+                args, indexes, names, width, reader, writer, error_writer
+            )
+
+    seconds = perf_counter() - start
+    if not args.quiet:
+        throughput = values_count / seconds if seconds else 0
+        print(
+            f"{rows_count} rows, {values_count} values, {failures} failed "
+            f"in {seconds:.2f}s ({throughput:.0f} values/s)",
+            file=sys.stderr,
+        )
+    return 0
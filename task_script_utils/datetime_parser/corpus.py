@@ -0,0 +1,308 @@
+# Seeded generator of datetime strings paired with the `tsformat()` output
+# expected when they are parsed with `CORPUS_CONFIG`, for benchmarks and soak
+# tests. Entries are generated lazily, so corpora can be streamed to files far
+# bigger than memory.
+import csv
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Sequence
+
+from .datetime_config import DatetimeConfig
+
+# Abbreviations that aren't also IANA timezone names, eg. "CET" or "EST",
+# which take precedence over `tz_dict`
+CORPUS_TZ_DICT = {
+    "IST": "+05:30",
+    "PDT": "-07:00",
+    "BST": "+01:00",
+    "JST": "+09:00",
+}
+CORPUS_CONFIG = DatetimeConfig(
+    day_first=False, year_first=True, tz_dict=CORPUS_TZ_DICT, fold=0
+)
+CORPUS_TIMEZONES = (
+    "America/Chicago",
+    "America/New_York",
+    "America/Sao_Paulo",
+    "Europe/London",
+    "Europe/Paris",
+    "Asia/Kolkata",
+    "Asia/Tokyo",
+    "Australia/Sydney",
+)
+CORPUS_OFFSETS = ("+00:00", "+05:30", "-08:00", "+09:00", "-03:30", "+0545", "-0500")
+
+# Timezone kinds
+NAIVE = "naive"
+UTC_Z = "Z"
+OFFSET = "offset"
+IANA = "iana"
+ABBREVIATION = "abbreviation"
+TZ_KINDS = (NAIVE, UTC_Z, OFFSET, IANA, ABBREVIATION)
+
+MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+WEEKDAYS = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+
+class Layout(NamedTuple):
+    """A layout of datetime strings. `template` is formatted with the fields
+    of `_fields()`; `{tz}` is replaced by a space and the timezone, or by
+    nothing for naive datetimes.
+    """
+
+    template: str
+    # Whether the seconds take 1 to 9 fractional digits
+    fraction: bool
+    tz_kinds: Sequence[str]
+    # Range of generated years
+    years: range = range(1970, 2070)
+
+
+LAYOUTS: Dict[str, Layout] = {
+    "iso": Layout("{YYYY}-{MM}-{DD}T{HH}:{mm}:{ss}{frac}{tz}", True, TZ_KINDS),
+    "iso_attached_offset": Layout(
+        "{YYYY}-{MM}-{DD}T{HH}:{mm}:{ss}{frac}{attached_tz}",
+        True,
+        (UTC_Z, OFFSET),
+    ),
+    "us_slash": Layout("{MM}/{DD}/{YYYY} {HH}:{mm}:{ss}{frac}{tz}", True, TZ_KINDS),
+    "us_dot_minutes": Layout("{MM}.{DD}.{YYYY} {HH}:{mm}", False, (NAIVE,)),
+    "two_digit_year_meridiem": Layout(
+        "{YY}-{MM}-{DD} {hh}:{mm}:{ss} {A}{tz}",
+        False,
+        TZ_KINDS,
+        range(2000, 2100),
+    ),
+    "two_digit_year_slash": Layout(
+        "{YY}/{MM}/{DD} {HH}:{mm}:{ss}{frac}", True, (NAIVE,), range(2000, 2100)
+    ),
+    "long_weekday_ordinal": Layout(
+        "{dddd}, {MMMM} {Do} {YYYY} {hh}:{mm}:{ss} {A}{tz}", False, TZ_KINDS
+    ),
+    "long_abbreviated": Layout(
+        "{ddd} {MMM} {D} {YYYY} {HH}:{mm}:{ss}{frac}{tz}", True, TZ_KINDS
+    ),
+    "long_ordinal_comma": Layout(
+        "{MMM} {Do}, {YYYY} {h}:{mm}:{ss} {A}{tz}", False, TZ_KINDS
+    ),
+    "long_month_name": Layout(
+        "{MMMM} {D} {YYYY} {HH}:{mm}:{ss}{frac}{tz}", True, TZ_KINDS
+    ),
+}
+
+
+class CorpusEntry(NamedTuple):
+    datetime_str: str
+    # `tsformat()` of `datetime_str` parsed with CORPUS_CONFIG
+    expected: str
+    layout: str
+
+
+def _ordinal(day: int) -> str:
+    if day in (11, 12, 13):
+        return f"{day}th"
+    return f"{day}{ {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th') }"
+
+
+def _fields(local: datetime) -> Dict[str, str]:
+    hour_12 = local.hour % 12 or 12
+    return {
+        "YYYY": f"{local.year:04d}",
+        "YY": f"{local.year % 100:02d}",
+        "MM": f"{local.month:02d}",
+        "MMMM": MONTHS[local.month - 1],
+        "MMM": MONTHS[local.month - 1][:3],
+        "DD": f"{local.day:02d}",
+        "D": str(local.day),
+        "Do": _ordinal(local.day),
+        "dddd": WEEKDAYS[local.weekday()],
+        "ddd": WEEKDAYS[local.weekday()][:3],
+        "HH": f"{local.hour:02d}",
+        "hh": f"{hour_12:02d}",
+        "h": str(hour_12),
+        "A": "AM" if local.hour < 12 else "PM",
+        "mm": f"{local.minute:02d}",
+        "ss": f"{local.second:02d}",
+    }
+
+
+def _offset_minutes(offset: str) -> int:
+    sign = -1 if offset[0] == "-" else 1
+    digits = offset[1:].replace(":", "")
+    return sign * (int(digits[:2]) * 60 + int(digits[2:]))
+
+
+class _Generator:
+    def __init__(self, seed: int, layouts: Sequence[str]):
+        self._random = random.Random(seed)
+        self._layouts = list(layouts)
+        self._timezones = {}
+
+    def _timezone(self, name: str):
+        if name not in self._timezones:
+            import pendulum  # pylint: disable=C0415
+
+            self._timezones[name] = pendulum.timezone(name)
+        return self._timezones[name]
+
+    def _local_datetime(self, layout: Layout) -> datetime:
+        rand = self._random
+        year = rand.choice(layout.years)
+        month = rand.randint(1, 12)
+        day = rand.randint(1, 31 if month != 2 else 28)
+        while True:
+            try:
+                return datetime(
+                    year,
+                    month,
+                    day,
+                    rand.randrange(24),
+                    rand.randrange(60),
+                    0 if "{ss}" not in layout.template else rand.randrange(60),
+                )
+            except ValueError:
+                # Day 31 of a 30 day month
+                day -= 1
+
+    def _to_utc(
+        self, local: datetime, tz_kind: str, tz_name: str
+    ) -> Optional[datetime]:
+        """Return the naive UTC datetime of `local` in the timezone, or None when
+        `local` doesn't exist in it.
+        """
+        if tz_kind == UTC_Z:
+            return local
+        if tz_kind == OFFSET:
+            return local - timedelta(minutes=_offset_minutes(tz_name))
+        if tz_kind == ABBREVIATION:
+            return local - timedelta(minutes=_offset_minutes(CORPUS_TZ_DICT[tz_name]))
+
+        import pendulum  # pylint: disable=C0415
+
+        timezone = self._timezone(tz_name)
+        fields = (local.year, local.month, local.day, local.hour, local.minute)
+        # Wall times skipped by a DST transition are shifted by `convert`
+        converted = timezone.convert(pendulum.naive(*fields, local.second))
+        if (converted.hour, converted.minute) != (local.hour, local.minute):
+            return None
+        aware = pendulum.DateTime(
+            *fields, local.second, tzinfo=timezone, fold=CORPUS_CONFIG.fold
+        )
+        utc = aware.in_timezone("UTC")
+        return datetime(*utc.timetuple()[:6])
+
+    def entry(self) -> CorpusEntry:
+        rand = self._random
+        name = rand.choice(self._layouts)
+        layout = LAYOUTS[name]
+        tz_kind = rand.choice(layout.tz_kinds)
+        tz_name = {
+            NAIVE: ("",),
+            UTC_Z: ("Z",),
+            OFFSET: CORPUS_OFFSETS,
+            IANA: CORPUS_TIMEZONES,
+            ABBREVIATION: sorted(CORPUS_TZ_DICT),
+        }[tz_kind]
+        tz_name = rand.choice(tz_name)
+
+        while True:
+            local = self._local_datetime(layout)
+            utc = local if tz_kind == NAIVE else self._to_utc(local, tz_kind, tz_name)
+            if utc is not None:
+                break
+
+        subseconds = ""
+        if layout.fraction and rand.random() < 0.5:
+            digits = rand.randint(1, 9)
+            subseconds = "".join(rand.choice("0123456789") for _ in range(digits))
+
+        datetime_str = layout.template.format(
+            **_fields(local),
+            frac=f".{subseconds}" if subseconds else "",
+            tz=f" {tz_name}" if tz_name else "",
+            attached_tz=tz_name,
+        )
+        expected = utc.strftime("%Y-%m-%dT%H:%M:%S").rjust(19, "0")
+        if subseconds:
+            expected += f".{subseconds}"
+        if tz_kind != NAIVE:
+            expected += "Z"
+        return CorpusEntry(datetime_str, expected, name)
+
+
+def generate_corpus(
+    count: Optional[int] = None,
+    seed: int = 0,
+    layouts: Optional[Iterable[str]] = None,
+) -> Iterator[CorpusEntry]:
+    """Generate corpus entries. The same `seed` and `layouts` always generate
+    the same entries.
+
+    Args:
+        count (Optional[int]): Number of entries, endless if None
+        seed (int): Seed of the random generator
+        layouts (Optional[Iterable[str]]): Names of LAYOUTS to use, all by default
+
+    Raises:
+        ValueError: When a layout is unknown
+
+    Yields:
+        CorpusEntry
+    """
+    layouts = sorted(LAYOUTS) if layouts is None else list(layouts)
+    unknown = set(layouts) - set(LAYOUTS)
+    if unknown or not layouts:
+        raise ValueError(f"Unknown layouts: {sorted(unknown)}")
+
+    generator = _Generator(seed, layouts)
+    index = 0
+    while count is None or index < count:
+        yield generator.entry()
+        index += 1
+
+
+def write_corpus(
+    path: str,
+    count: int,
+    seed: int = 0,
+    layouts: Optional[Iterable[str]] = None,
+) -> int:
+    """Write `count` entries to `path` as tab separated datetime string,
+    expected tsformat and layout rows, one entry at a time.
+    Return the number of written entries.
+    """
+    written = 0
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file, delimiter="\t")
+        for entry in generate_corpus(count, seed, layouts):
+            writer.writerow(entry)
+            written += 1
+    return written
+
+
+def read_corpus(path: str) -> Iterator[CorpusEntry]:
+    """Yield the entries of a file written by `write_corpus`, one at a time"""
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        for row in csv.reader(file, delimiter="\t"):
+            yield CorpusEntry(*row)
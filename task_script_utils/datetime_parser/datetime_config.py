@@ -1,5 +1,4 @@
-from typing import Optional
-from .utils.manipulation import map_offset_to_seconds
+from typing import Optional, Sequence
 
 
 # pylint: disable=R0903
@@ -19,6 +18,7 @@ class DatetimeConfig:
         tz_dict: dict = {},
         fold: Optional[int] = None,
         require_unambiguous_formats: bool = False,
+        locales: Sequence[str] = ("en",),
     ):
         """DatetimeConfig constructor.
 
@@ -44,13 +44,28 @@ class DatetimeConfig:
 
             require_unambiguous_formats (bool, optional): Whether require datetime
             formats to be unambiguous. Defaults to `False`.
+
+            locales (Sequence[str], optional): pendulum locales used to match month
+            and weekday names in long datetime strings, in order of priority,
+            e.g. ("en", "de", "fr"). Defaults to ("en",).
         """
         self.day_first = day_first
         self.year_first = year_first
         self.tz_dict = tz_dict
-        self.tz_dict_seconds = map_offset_to_seconds(tz_dict)
         self.fold = fold
         self.require_unambiguous_formats = require_unambiguous_formats
+        self.locales = tuple(locales)
+
+    @property
+    def tz_dict_seconds(self) -> dict:
+        """`tz_dict` with offsets converted to seconds,
+        eg. {"ist": "+05:30"} ---> {"IST": 19800.0}
+        """
+        # Imported here, so that importing DatetimeConfig doesn't load pendulum
+        # pylint: disable=C0415
+        from .utils.manipulation import map_offset_to_seconds
+
+        return map_offset_to_seconds(self.tz_dict)
 
     def __str__(self):
         return (
@@ -58,7 +73,8 @@ class DatetimeConfig:
             f"year_first={self.year_first}, "
             f"fold={self.fold}, "
             f"tz_dict={self.tz_dict}, "
-            f"require_unambiguous_formats={self.require_unambiguous_formats}"
+            f"require_unambiguous_formats={self.require_unambiguous_formats}, "
+            f"locales={self.locales}"
         )
 
 
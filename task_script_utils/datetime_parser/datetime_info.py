@@ -1,18 +1,18 @@
 import re
 import json
 from datetime import datetime as dt
+from functools import lru_cache
 from itertools import product
 from typing import Optional, Tuple
 
 import pendulum
-from pendulum.locales.en import locale
-
-# pylint: disable=C0401
-from pydash.arrays import flatten
 
 from .datetime_config import DatetimeConfig
-from .tz_list import _all_abbreviated_tz_list
+from .instrumentation import input_shape
+from .locale_index import get_locale_index
+from .parser_cache import PARSER_CACHE
 from .ts_datetime import TSDatetime
+from .tz_registry import is_abbreviated_timezone, is_iana_timezone
 from .utils.parsing import _parse_with_formats
 from .parser_exceptions import (
     DatetimeParserError,
@@ -127,7 +127,8 @@ class DateTimeInfo:
             str/None: A datetime string
         """
         if self.parsed_datetime:
-            return self.parsed_datetime.isoformat()
+            # pylint: disable=W0212
+            return self.parsed_datetime._isoformat()
 
         if (
             self.day
@@ -244,6 +245,9 @@ class LongDateTimeInfo(DateTimeInfo):
     - `_match_day_token`
     - `_match_fractional_seconds`
 
+    Month and weekday names are looked up in the locales of
+    `DatetimeConfig.locales`.
+
     The idea is to detect which pendulum token should be used for
     building date format. The matchers detect the required tokens
     and `_build_long_date_format` return the resulting pendulum format
@@ -262,6 +266,9 @@ class LongDateTimeInfo(DateTimeInfo):
         self.token_day: Optional[str] = None
         self.token_month: Optional[str] = None
         self.has_fractional_seconds: Optional[str] = None
+        self.locale: Optional[str] = None
+        self._locale_index = get_locale_index(config.locales)
+        self.long_datetime_formats: Tuple[str, ...] = ()
 
         self._parse_long_date_formats()
 
@@ -276,36 +283,33 @@ class LongDateTimeInfo(DateTimeInfo):
         if self.token_day is None:
             self.token_day = "DD"
 
-        long_datetime_formats = self._build_long_datetime_formats_list()
+        # Every long datetime format that matches produces the same datetime,
+        # so the format matched by inputs of the same shape and formats that
+        # matched before are tried first
+        shape = input_shape(self.date_time_raw)
+        self.long_datetime_formats = PARSER_CACHE.order_long_formats(
+            self._build_long_datetime_formats_list(), shape
+        )
         parsed_datetime, matched_format = _parse_with_formats(
             datetime_str=self.date_time_raw,
             config=self.config,
-            formats=long_datetime_formats,
+            formats=self.long_datetime_formats,
+            locale=self.locale,
         )
         if parsed_datetime:
+            PARSER_CACHE.record_long_format_hit(matched_format, shape=shape)
             self.datetime = parsed_datetime
             self.parsed_datetime_format = matched_format
 
     def _match_day_of_week_token(self, token: str) -> bool:
-        days = locale.locale["translations"]["days"]
-        token_map = {
-            "dddd": days["wide"].values(),
-            "ddd": days["abbreviated"].values(),
-            "dd": days["short"].values(),
-        }
-        token = self._get_token(token, token_map)
+        token = self._get_token(token, self._locale_index.match_day)
         if token is not None:
             self.token_day_of_week = token
             return True
         return False
 
     def _match_month_token(self, date_time_token: str) -> bool:
-        months = locale.locale["translations"]["months"]
-        token_map = {
-            "MMMM": months["wide"].values(),
-            "MMM": months["abbreviated"].values(),
-        }
-        token = self._get_token(date_time_token, token_map)
+        token = self._get_token(date_time_token, self._locale_index.match_month)
         if token is not None:
             self.token_month = token
             return True
@@ -333,14 +337,17 @@ class LongDateTimeInfo(DateTimeInfo):
             return True
         return False
 
-    @staticmethod
-    def _get_token(token, token_map: dict):
-        for key_, values in token_map.items():
-            if token in values:
-                return key_
-            if token.replace(",", "") in values:
-                return f"{key_},"
-        return None
+    def _get_token(self, token: str, match_name) -> Optional[str]:
+        """Look up a month or weekday name in the locale index and return
+        its pendulum token, followed by a comma if `token` has one.
+        Once a name is matched, other names must be from the same locale.
+        """
+        name = token.replace(",", "")
+        match = match_name(name, self.locale)
+        if match is None:
+            return None
+        self.locale = match.locale
+        return match.token if name == token else f"{match.token},"
 
     def _build_long_date_format(self):
         """Use DatetimeInfo to build and return date format for
@@ -369,39 +376,7 @@ class LongDateTimeInfo(DateTimeInfo):
         return date_fmt
 
     def _build_time_formats(self):
-        pendulum_time_tokens = [
-            ["h", "hh", "H", "HH"],
-            ["m", "mm"],
-            ["s", "ss"],
-        ]
-
-        def map_am_pm(time_format):
-            return time_format if time_format.startswith("H") else time_format + " A"
-
-        time_formats = [":".join(tokens) for tokens in product(*pendulum_time_tokens)]
-        if self.fractional_seconds:
-            token = "SSSSSS"
-            time_formats = map(lambda x: [x, f"{x}.{token}"], time_formats)
-
-        time_formats = flatten(time_formats)
-        time_formats = map(map_am_pm, time_formats)
-        time_formats = map(
-            lambda x: [
-                x,
-                x + " Z",
-                x + " z",
-                x + " ZZ",
-                x + " Z z",
-                x + " ZZ z",
-                x + " z ZZ",
-                x + " zz",
-                x + " Z zz",
-                x + " ZZ zz",
-            ],
-            time_formats,
-        )
-        time_formats = flatten(time_formats)
-        return tuple(time_formats)
+        return _build_time_formats(bool(self.fractional_seconds))
 
     def _build_long_datetime_formats_list(self) -> Tuple[str]:
         """Returns a list of long datetime formats built
@@ -448,7 +423,7 @@ class ShortDateTimeInfo(DateTimeInfo):
         Returns:
             bool: Return True if iana_tz is matched else return False
         """
-        if token in pendulum.timezones:
+        if is_iana_timezone(token):
             self.iana_tz = token
             return True
         return False
@@ -663,7 +638,7 @@ class ShortDateTimeInfo(DateTimeInfo):
         Returns:
             bool: If abbreviated_tz is matched, return True.
         """
-        if token.upper() in _all_abbreviated_tz_list:
+        if is_abbreviated_timezone(token):
             self.abbreviated_tz = token.upper()
             return True
         return False
@@ -885,3 +860,47 @@ class ShortDateTimeInfo(DateTimeInfo):
                 raise InvalidTimeError(
                     f"Hour is {self.hour} but meridiem is {self.am_or_pm}"
                 )
+
+
+@lru_cache(maxsize=2)
+def _build_time_formats(has_fractional_seconds: bool) -> Tuple[str, ...]:
+    """Build the exhaustive list of time formats for long datetime strings.
+    The list only depends on whether fractional seconds are present,
+    so it is built once for each case.
+    """
+    # pylint: disable=C0401,C0415
+    from pydash.arrays import flatten
+
+    pendulum_time_tokens = [
+        ["h", "hh", "H", "HH"],
+        ["m", "mm"],
+        ["s", "ss"],
+    ]
+
+    def map_am_pm(time_format):
+        return time_format if time_format.startswith("H") else time_format + " A"
+
+    time_formats = [":".join(tokens) for tokens in product(*pendulum_time_tokens)]
+    if has_fractional_seconds:
+        token = "SSSSSS"
+        time_formats = map(lambda x: [x, f"{x}.{token}"], time_formats)
+
+    time_formats = flatten(time_formats)
+    time_formats = map(map_am_pm, time_formats)
+    time_formats = map(
+        lambda x: [
+            x,
+            x + " Z",
+            x + " z",
+            x + " ZZ",
+            x + " Z z",
+            x + " ZZ z",
+            x + " z ZZ",
+            x + " zz",
+            x + " Z zz",
+            x + " ZZ zz",
+        ],
+        time_formats,
+    )
+    time_formats = flatten(time_formats)
+    return tuple(time_formats)
@@ -0,0 +1,266 @@
+# Differential testing of the parser's accelerated paths against its reference
+# path. The reference path is `parse()` with compiled fixed width formats and
+# learned long format ordering disabled. Every accelerated path must give the
+# same `tsformat()`, `isoformat()` and exception type for every value.
+# Batch paths coerce errors to None; the values they coerced are parsed again
+# by the same path with instrumentation, whose ParseEvents name the errors.
+import asyncio
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from . import parser_cache
+from .datetime_config import DEFAULT_DATETIME_CONFIG, DatetimeConfig
+from .instrumentation import ParseEvent, instrument
+from .utils import fixed_width_formats
+from .warmup import warm_up
+
+REFERENCE = "reference"
+PARSE = "parse"
+PARSE_MANY_THREAD = "parse_many/thread"
+PARSE_MANY_PROCESS = "parse_many/process"
+AITER_PARSE = "aiter_parse"
+PATHS = (PARSE, PARSE_MANY_THREAD, PARSE_MANY_PROCESS, AITER_PARSE)
+
+# Error of values that a batch path returned as None, with errors="coerce",
+# when no ParseEvent named their exception type
+COERCED = "coerced"
+# Mismatches kept per path, the others are only counted
+MAX_MISMATCHES = 100
+
+
+class Outcome(NamedTuple):
+    tsformat: Optional[str]
+    isoformat: Optional[str]
+    # Name of the raised exception type, or COERCED
+    error: Optional[str]
+
+    def matches(self, reference: "Outcome") -> bool:
+        if self.error == COERCED:
+            return reference.error is not None
+        return self == reference
+
+
+class Mismatch(NamedTuple):
+    path: str
+    value: str
+    expected: Outcome
+    actual: Outcome
+
+
+class PathResult(NamedTuple):
+    path: str
+    count: int
+    seconds: float
+    mismatch_count: int
+    # The first MAX_MISMATCHES mismatches
+    mismatches: List[Mismatch]
+
+    @property
+    def throughput(self) -> float:
+        """Values parsed per second"""
+        return self.count / self.seconds if self.seconds else float("inf")
+
+
+class DifferentialReport(NamedTuple):
+    reference: PathResult
+    paths: Dict[str, PathResult]
+
+    @property
+    def ok(self) -> bool:
+        return not any(result.mismatch_count for result in self.paths.values())
+
+    def to_dict(self) -> dict:
+        return {
+            "ok": self.ok,
+            "count": self.reference.count,
+            "throughput": {
+                REFERENCE: self.reference.throughput,
+                **{path: result.throughput for path, result in self.paths.items()},
+            },
+            "mismatch_counts": {
+                path: result.mismatch_count for path, result in self.paths.items()
+            },
+            "mismatches": [
+                {
+                    "path": mismatch.path,
+                    "value": mismatch.value,
+                    "expected": mismatch.expected._asdict(),
+                    "actual": mismatch.actual._asdict(),
+                }
+                for result in self.paths.values()
+                for mismatch in result.mismatches
+            ],
+        }
+
+
+@contextmanager
+def reference_path():
+    """Disable compiled fixed width formats and the learned order of long
+    datetime formats within a `with` block. These are process-wide switches,
+    no other thread should parse while they are disabled.
+    """
+    fixed_width_enabled = fixed_width_formats.ENABLED
+    order_long_formats = parser_cache.ORDER_LONG_FORMATS
+    fixed_width_formats.ENABLED = False
+    parser_cache.ORDER_LONG_FORMATS = False
+    try:
+        yield
+    finally:
+        fixed_width_formats.ENABLED = fixed_width_enabled
+        parser_cache.ORDER_LONG_FORMATS = order_long_formats
+
+
+def _outcome(parsed) -> Outcome:
+    if parsed is None:
+        return Outcome(None, None, COERCED)
+    return Outcome(parsed.tsformat(), parsed.isoformat(), None)
+
+
+def _parse_each(values, formats, config) -> List[Outcome]:
+    from .parser import parse  # pylint: disable=C0415
+
+    outcomes = []
+    for value in values:
+        try:
+            parsed = parse(value, formats, config)
+        except Exception as error:  # pylint: disable=W0703
+            outcomes.append(Outcome(None, None, type(error).__name__))
+        else:
+            outcomes.append(_outcome(parsed))
+    return outcomes
+
+
+def _path_parsers(workers: int) -> Dict[str, Callable]:
+    # pylint: disable=C0415
+    from .async_batch import aiter_parse
+    from .batch import parse_many
+
+    def parse_many_with(executor):
+        def parse_values(values, formats, config):
+            parsed = parse_many(
+                values,
+                formats,
+                config,
+                workers=workers,
+                errors="coerce",
+                executor=executor,
+            )
+            return [_outcome(value) for value in parsed]
+
+        return parse_values
+
+    def parse_stream(values, formats, config):
+        async def consume():
+            return [
+                _outcome(value)
+                async for value in aiter_parse(values, formats, config, errors="coerce")
+            ]
+
+        return asyncio.run(consume())
+
+    return {
+        PARSE: _parse_each,
+        PARSE_MANY_THREAD: parse_many_with("thread"),
+        PARSE_MANY_PROCESS: parse_many_with("process"),
+        AITER_PARSE: parse_stream,
+    }
+
+
+def _error_names(parse_values, values, formats, config) -> Dict[str, str]:
+    """Parse `values` with a path and return the exception type name of each
+    value that failed, from the ParseEvents of the path
+    """
+    error_names = {}
+
+    def record(event):
+        if isinstance(event, ParseEvent) and event.error is not None:
+            error_names[event.datetime_str] = event.error
+
+    with instrument(record):
+        parse_values(values, formats, config)
+    return error_names
+
+
+def _name_coerced_errors(parse_values, values, outcomes, formats, config):
+    coerced = [
+        value for value, outcome in zip(values, outcomes) if outcome.error == COERCED
+    ]
+    if not coerced:
+        return outcomes
+    # Parsed again outside of the timed run, so that instrumentation doesn't
+    # slow down the path
+    error_names = _error_names(parse_values, coerced, formats, config)
+    return [
+        (
+            Outcome(None, None, error_names.get(value, COERCED))
+            if outcome.error == COERCED
+            else outcome
+        )
+        for value, outcome in zip(values, outcomes)
+    ]
+
+
+def _run_path(path, parse_values, values, formats, config, reference=None):
+    start = perf_counter()
+    outcomes = parse_values(values, formats, config)
+    seconds = perf_counter() - start
+    outcomes = _name_coerced_errors(parse_values, values, outcomes, formats, config)
+
+    mismatch_count = 0
+    mismatches = []
+    if reference is not None:
+        for value, expected, actual in zip(values, reference, outcomes):
+            if actual.matches(expected):
+                continue
+            mismatch_count += 1
+            if len(mismatches) < MAX_MISMATCHES:
+                mismatches.append(Mismatch(path, value, expected, actual))
+    result = PathResult(path, len(values), seconds, mismatch_count, mismatches)
+    return result, outcomes
+
+
+def run_differential(
+    values: Iterable[str],
+    formats: Sequence[str] = (),
+    config: DatetimeConfig = DEFAULT_DATETIME_CONFIG,
+    paths: Sequence[str] = PATHS,
+    workers: int = 2,
+) -> DifferentialReport:
+    """Parse `values` with the reference path and with each accelerated path,
+    and compare their `tsformat()`, `isoformat()` and exception types.
+    Batch paths coerce errors to None, so the values they coerced are parsed
+    again by the same path to name their exception types.
+
+    Args:
+        values (Iterable[str]): Datetime strings, eg. from `corpus.generate_corpus`
+        formats (Sequence[str], optional): Datetime formats passed to every path
+        config (DatetimeConfig, optional): Datetime Configuration
+        paths (Sequence[str], optional): Accelerated paths to compare, from PATHS
+        workers (int, optional): Workers of the `parse_many` paths
+
+    Raises:
+        ValueError: When a path is unknown
+
+    Returns:
+        DifferentialReport: Throughput and mismatches of each path
+    """
+    path_parsers = _path_parsers(workers)
+    unknown = [path for path in paths if path not in path_parsers]
+    if unknown:
+        raise ValueError(f"Unknown paths: {unknown}")
+
+    values = list(values)
+    # Load timezones, locales and formats so that the first path measured
+    # doesn't pay for them
+    warm_up(config, formats)
+    with reference_path():
+        reference, reference_outcomes = _run_path(
+            REFERENCE, _parse_each, values, formats, config
+        )
+    results = {}
+    for path in paths:
+        results[path], _ = _run_path(
+            path, path_parsers[path], values, formats, config, reference_outcomes
+        )
+    return DifferentialReport(reference, results)
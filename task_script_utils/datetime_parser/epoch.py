@@ -0,0 +1,187 @@
+# Conversion of columns of Unix epoch numbers into `batch` result records and
+# `tsformat()` strings. Numbers are split into integer and fractional parts
+# without going through float, and the seconds and subseconds are computed
+# with numpy integer arithmetic, so every digit of the input is kept.
+from decimal import Decimal, InvalidOperation
+from typing import List, Optional, Sequence
+
+from .batch import FAILED, PARSED, RESULT_FIELDS, records_to_tsformat
+from .parser_exceptions import DatetimeParserError
+
+SECONDS = "s"
+MILLISECONDS = "ms"
+MICROSECONDS = "us"
+NANOSECONDS = "ns"
+# Fractional digits of a second of each unit
+UNIT_DIGITS = {SECONDS: 0, MILLISECONDS: 3, MICROSECONDS: 6, NANOSECONDS: 9}
+# A magnitude below each bound is detected as the unit. Epoch seconds below
+# 1e11 reach the year 5138, the other units are scaled by 1000.
+_UNIT_BOUNDS = ((1e11, SECONDS), (1e14, MILLISECONDS), (1e17, MICROSECONDS))
+
+_MAX_SUBSECOND_DIGITS = 18
+# 0001-01-01T00:00:00 and 9999-12-31T23:59:59, the range of TSDatetime
+_MIN_SECONDS = -62135596800
+_MAX_SECONDS = 253402300799
+_ERRORS = ("raise", "coerce")
+
+
+def _split_decimal(value):
+    """Return the sign, integer part, fractional part and number of fractional
+    digits of a number, or None if it's not a finite number.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, float):
+        # The shortest repr keeps the digits the float was written with
+        value = repr(value)
+    try:
+        number = Decimal(value.strip() if isinstance(value, str) else value)
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+    if not number.is_finite():
+        return None
+    sign, digits, exponent = number.as_tuple()
+    integer = int("".join(map(str, digits)) or 0)
+    if exponent >= 0:
+        return sign, integer * 10**exponent, 0, 0
+    fraction_digits = -exponent
+    whole, fraction = divmod(integer, 10**fraction_digits)
+    return sign, whole, fraction, fraction_digits
+
+
+def _split_numbers(values):
+    """Return the negative flags, integer parts, fractional parts, numbers of
+    fractional digits and valid flags of a column of numbers, as numpy arrays.
+    """
+    import numpy as np  # pylint: disable=C0415
+
+    count = len(values)
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        integers = values.astype(np.int64)
+        zeros = np.zeros(count, dtype=np.int64)
+        return integers < 0, np.abs(integers), zeros, zeros, np.ones(count, bool)
+
+    values = values.tolist() if isinstance(values, np.ndarray) else list(values)
+    # Columns of integers or integer strings are converted with one cast
+    if set(map(type, values)) <= {int, str}:
+        try:
+            integers = np.array(values, dtype=np.int64)
+        except (ValueError, OverflowError):
+            pass
+        else:
+            zeros = np.zeros(count, dtype=np.int64)
+            return integers < 0, np.abs(integers), zeros, zeros, np.ones(count, bool)
+
+    negative = np.zeros(count, dtype=bool)
+    wholes = np.zeros(count, dtype=np.int64)
+    fractions = np.zeros(count, dtype=np.int64)
+    fraction_digits = np.zeros(count, dtype=np.int64)
+    valid = np.zeros(count, dtype=bool)
+    for index, value in enumerate(values):
+        parts = _split_decimal(value)
+        if parts is None:
+            continue
+        sign, whole, fraction, digits = parts
+        # Parts that don't fit in int64 aren't valid epochs
+        if whole >= 2**63 or digits > _MAX_SUBSECOND_DIGITS:
+            continue
+        negative[index] = sign == 1
+        wholes[index] = whole
+        fractions[index] = fraction
+        fraction_digits[index] = digits
+        valid[index] = True
+    return negative, wholes, fractions, fraction_digits, valid
+
+
+def _detect_unit(wholes, valid) -> str:
+    import numpy as np  # pylint: disable=C0415
+
+    if not valid.any():
+        return SECONDS
+    magnitude = np.median(wholes[valid])
+    for bound, unit in _UNIT_BOUNDS:
+        if magnitude < bound:
+            return unit
+    return NANOSECONDS
+
+
+def detect_epoch_unit(values: Sequence) -> str:
+    """Return the unit of a column of epoch numbers from the median magnitude
+    of its values: SECONDS, MILLISECONDS, MICROSECONDS or NANOSECONDS.
+    """
+    _, wholes, _, _, valid = _split_numbers(values)
+    return _detect_unit(wholes, valid)
+
+
+def epoch_records(values: Sequence, unit: Optional[str] = None, errors: str = "raise"):
+    """Convert a column of Unix epoch numbers into result records, as
+    `parse_many` workers encode parsed datetimes. Records are UTC datetimes;
+    the subseconds keep the digits of the unit and of the fractional part of
+    each value, eg. 1639745532.5 seconds or 1639745532500 milliseconds are
+    2021-12-17T12:52:12.5 and 2021-12-17T12:52:12.500 UTC.
+
+    Args:
+        values (Sequence): Integers, floats or numeric strings, as a list or a
+        numpy array
+        unit (Optional[str]): One of UNIT_DIGITS, detected from the magnitude
+        of the values when None
+        errors (str): "raise" to raise an error for the first value that
+        can't be converted, "coerce" to return a FAILED record for it
+
+    Raises:
+        ValueError: When `unit` or `errors` is not valid
+        DatetimeParserError: When a value can't be converted and errors="raise"
+
+    Returns:
+        numpy.ndarray: A record with the fields of `RESULT_FIELDS` per value
+    """
+    import numpy as np  # pylint: disable=C0415
+
+    if unit is not None and unit not in UNIT_DIGITS:
+        raise ValueError(f"unit must be one of {tuple(UNIT_DIGITS)}, got {unit!r}")
+    if errors not in _ERRORS:
+        raise ValueError(f"errors must be one of {_ERRORS}, got {errors!r}")
+
+    negative, wholes, fractions, fraction_digits, valid = _split_numbers(values)
+    unit = unit or _detect_unit(wholes, valid)
+    unit_digits = UNIT_DIGITS[unit]
+    scale = 10**unit_digits
+
+    subsecond_digits = unit_digits + fraction_digits
+    valid &= subsecond_digits <= _MAX_SUBSECOND_DIGITS
+    fraction_digits[~valid] = 0
+    seconds, remainder = np.divmod(wholes, scale)
+    # Subseconds in units of 10**-subsecond_digits seconds
+    subseconds = remainder * 10**fraction_digits + fractions
+    # The subseconds of negative epochs count from the previous second
+    borrow = negative & (subseconds > 0)
+    seconds = np.where(negative, -seconds, seconds) - borrow
+    subseconds = np.where(
+        borrow,
+        10 ** subsecond_digits.clip(0, _MAX_SUBSECOND_DIGITS) - subseconds,
+        subseconds,
+    )
+    valid &= (seconds >= _MIN_SECONDS) & (seconds <= _MAX_SECONDS)
+
+    if errors == "raise" and not valid.all():
+        value = values[int(np.argmin(valid))]
+        raise DatetimeParserError(f"Could not convert epoch: {value!r}")
+
+    records = np.zeros(len(valid), dtype=list(RESULT_FIELDS))
+    records["status"] = np.where(valid, PARSED, FAILED)
+    records["subsecond_digits"] = np.where(subsecond_digits > 0, subsecond_digits, -1)
+    # Fixed UTC offset
+    records["tz"] = 0
+    records["seconds"] = np.where(valid, seconds, 0)
+    records["subseconds"] = np.where(valid, subseconds, 0)
+    return records
+
+
+def epoch_tsformats(
+    values: Sequence, unit: Optional[str] = None, errors: str = "raise"
+) -> List[Optional[str]]:
+    """Convert a column of Unix epoch numbers into `tsformat()` strings, None
+    for the values that can't be converted with errors="coerce".
+    See `epoch_records` for the arguments.
+    """
+    return records_to_tsformat(epoch_records(values, unit, errors))
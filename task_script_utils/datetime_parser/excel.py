@@ -0,0 +1,159 @@
+# Conversion of columns of Excel serial dates into `batch` result records and
+# `tsformat()` strings. Serials count days since the epoch of the workbook's
+# date system, with the time of day as the fraction of a day.
+from datetime import date
+from typing import List, Optional, Sequence
+
+from .batch import (
+    FAILED,
+    PARSED,
+    RESULT_FIELDS,
+    _timezone_ids,
+    decode_ts_datetime,
+    records_to_tsformat,
+)
+from .epoch import _MAX_SECONDS
+from .parser_exceptions import DatetimeParserError
+from .ts_datetime import TSDatetime
+
+EXCEL_1900 = "1900"
+EXCEL_1904 = "1904"
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+# Day 0 of each date system, in days since 1970-01-01. In the 1900 system,
+# serials from 61 count from 1899-12-30 because Excel treats 1900 as a leap
+# year: serial 60 is 1900-02-29, which doesn't exist.
+_EPOCHS = {
+    EXCEL_1900: date(1899, 12, 30).toordinal() - _EPOCH_ORDINAL,
+    EXCEL_1904: date(1904, 1, 1).toordinal() - _EPOCH_ORDINAL,
+}
+_LEAP_DAY_SERIAL = 60
+# Serial after 9999-12-31 in the 1900 system, the last date of Excel. Later
+# dates of the 1904 system are rejected by the range of TSDatetime.
+_MAX_SERIAL = 2958466
+_MICROSECONDS_PER_DAY = 86_400_000_000
+_ERRORS = ("raise", "coerce")
+
+
+def _timezone_fields(tz: Optional[str]):
+    """Return the `tz` and `offset` record fields of a timezone name or offset"""
+    # pylint: disable=C0415
+    from .tz_registry import is_iana_timezone, parse_offset
+
+    if tz is None:
+        return -1, 0
+    if is_iana_timezone(tz):
+        return _timezone_ids()[tz], 0
+    try:
+        return 0, parse_offset(tz)
+    except ValueError:
+        raise ValueError(
+            f"tz must be an IANA timezone or a utc offset, got {tz!r}"
+        ) from None
+
+
+def excel_records(
+    values: Sequence,
+    date_system: str = EXCEL_1900,
+    tz: Optional[str] = None,
+    fold: int = 0,
+    errors: str = "raise",
+):
+    """Convert a column of Excel serial dates into result records, as
+    `parse_many` workers encode parsed datetimes. The fraction of a day is
+    rounded to microseconds; datetimes with microseconds get 6 subsecond
+    digits, the others none.
+
+    Args:
+        values (Sequence): Serials as numbers or numeric strings, as a list or
+        a numpy array
+        date_system (str): EXCEL_1900 for workbooks of Excel for Windows,
+        EXCEL_1904 for workbooks using the 1904 date system
+        tz (Optional[str]): IANA timezone or utc offset of the wall clock
+        times, eg. "Europe/Paris" or "+05:30". Naive datetimes when None
+        fold (int): Fold of wall clock times repeated in `tz`
+        errors (str): "raise" to raise an error for the first value that
+        can't be converted, "coerce" to return a FAILED record for it
+
+    Raises:
+        ValueError: When `date_system`, `tz` or `errors` is not valid
+        DatetimeParserError: When a value can't be converted and errors="raise"
+
+    Returns:
+        numpy.ndarray: A record with the fields of `RESULT_FIELDS` per value
+    """
+    # pylint: disable=C0415
+    import numpy as np
+    from ..is_number import to_numeric
+
+    if date_system not in _EPOCHS:
+        raise ValueError(
+            f"date_system must be one of {tuple(_EPOCHS)}, got {date_system!r}"
+        )
+    if errors not in _ERRORS:
+        raise ValueError(f"errors must be one of {_ERRORS}, got {errors!r}")
+    tz_id, offset = _timezone_fields(tz)
+
+    valid, serials = to_numeric(values)
+    valid &= np.isfinite(serials) & (serials >= 0) & (serials < _MAX_SERIAL)
+    if date_system == EXCEL_1900:
+        leap_day = np.floor(serials) == _LEAP_DAY_SERIAL
+        valid &= ~leap_day
+        # Serials before the leap day count from 1899-12-31
+        serials = np.where(serials < _LEAP_DAY_SERIAL, serials + 1, serials)
+    serials = np.where(valid, serials, 0)
+
+    days = np.floor(serials).astype(np.int64)
+    microseconds = np.rint((serials - days) * _MICROSECONDS_PER_DAY).astype(np.int64)
+    # A fraction rounded up to a whole day
+    carry = microseconds // _MICROSECONDS_PER_DAY
+    days += carry
+    microseconds -= carry * _MICROSECONDS_PER_DAY
+    seconds = (days + _EPOCHS[date_system]) * 86400 + microseconds // 1_000_000
+    subseconds = microseconds % 1_000_000
+    valid &= seconds <= _MAX_SECONDS
+
+    if errors == "raise" and not valid.all():
+        value = values[int(np.argmin(valid))]
+        raise DatetimeParserError(f"Could not convert Excel serial: {value!r}")
+
+    records = np.zeros(len(valid), dtype=list(RESULT_FIELDS))
+    records["status"] = np.where(valid, PARSED, FAILED)
+    records["fold"] = fold
+    records["subsecond_digits"] = np.where(subseconds > 0, 6, -1)
+    records["tz"] = tz_id
+    records["offset"] = offset
+    records["seconds"] = np.where(valid, seconds, 0)
+    records["subseconds"] = np.where(valid, subseconds, 0)
+    return records
+
+
+def excel_tsformats(
+    values: Sequence,
+    date_system: str = EXCEL_1900,
+    tz: Optional[str] = None,
+    fold: int = 0,
+    errors: str = "raise",
+) -> List[Optional[str]]:
+    """Convert a column of Excel serial dates into `tsformat()` strings, None
+    for the values that can't be converted with errors="coerce".
+    See `excel_records` for the arguments.
+    """
+    return records_to_tsformat(excel_records(values, date_system, tz, fold, errors))
+
+
+def excel_datetimes(
+    values: Sequence,
+    date_system: str = EXCEL_1900,
+    tz: Optional[str] = None,
+    fold: int = 0,
+    errors: str = "raise",
+) -> List[Optional[TSDatetime]]:
+    """Convert a column of Excel serial dates into TSDatetime objects, None
+    for the values that can't be converted with errors="coerce".
+    See `excel_records` for the arguments.
+    """
+    return [
+        decode_ts_datetime(record) if record[0] == PARSED else None
+        for record in excel_records(values, date_system, tz, fold, errors).tolist()
+    ]
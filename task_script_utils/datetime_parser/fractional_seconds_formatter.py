@@ -1,6 +1,13 @@
 # pylint: skip-file
 from pendulum.formatting import Formatter
 
+from .tz_registry import (
+    get_fixed_timezone,
+    get_timezone,
+    is_iana_timezone,
+    parse_offset,
+)
+
 
 class FractionalSecondsFormatter(Formatter):
     """`FractionalSecondsFormatter` override microseconds token in _PARSE_TOKENS
@@ -8,6 +15,7 @@ class FractionalSecondsFormatter(Formatter):
     return dict with microsecond as string. This allow us to catch fractional
     seconds of any number of digits such as '000123000' with leading and trailing
     zeros intact as microseconds.
+    Timezone tokens are resolved through `tz_registry`.
     """
 
     _PARSE_TOKENS = {
@@ -48,3 +56,13 @@ class FractionalSecondsFormatter(Formatter):
         "Z": str,
         "z": str,
     }
+
+    def _get_parsed_value(self, token, value, parsed, now):
+        if token == "z":
+            if not is_iana_timezone(value):
+                raise ValueError("Invalid date")
+            parsed["tz"] = get_timezone(value)
+        elif token in ["ZZ", "Z"]:
+            parsed["tz"] = get_fixed_timezone(parse_offset(value))
+        else:
+            super()._get_parsed_value(token, value, parsed, now)
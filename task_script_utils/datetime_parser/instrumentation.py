@@ -0,0 +1,274 @@
+# Opt-in instrumentation of `parse()`, `parse_many()` and of formatting
+# parsed datetimes. While no hook is registered, `ENABLED` is False and the
+# parser only reads this flag once per call. Once a hook is registered, every
+# parse delivers a `ParseEvent`, every `parse_many` call a `BatchEvent` and
+# every `TSDatetime.tsformat()` or `isoformat()` call a `FormatEvent` to the
+# hooks.
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Callable, Dict, NamedTuple, Optional, Sequence, Tuple, Union
+
+# Stages of `parse()`, in the order they run
+FORMATS_STAGE = "formats"
+SHORT_STAGE = "short"
+LONG_STAGE = "long"
+FOLD_STAGE = "fold"
+STAGES = (FORMATS_STAGE, SHORT_STAGE, LONG_STAGE, FOLD_STAGE)
+# Formatting a parsed datetime, after `parse()` returned
+FORMATTING_STAGE = "formatting"
+
+ENABLED = False
+
+
+class ParseEvent(NamedTuple):
+    """Trace of one `parse()` call"""
+
+    datetime_str: str
+    # Stage that resolved the datetime, None when parsing failed
+    stage: Optional[str]
+    # Number of datetime formats tried in the formats, short and long stages
+    attempts: int
+    # Nanoseconds spent in each stage that ran
+    stage_ns: Dict[str, int]
+    total_ns: int
+    # Name of the raised exception type, None when parsing succeeded
+    error: Optional[str]
+
+
+class BatchEvent(NamedTuple):
+    """Trace of one `parse_many()` call"""
+
+    count: int
+    # Number of values that couldn't be parsed, with errors="coerce"
+    failures: int
+    workers: int
+    executor: str
+    total_ns: int
+    error: Optional[str]
+
+
+class FormatEvent(NamedTuple):
+    """Trace of one `TSDatetime.tsformat()` or `isoformat()` call"""
+
+    method: str
+    total_ns: int
+
+
+Event = Union[ParseEvent, BatchEvent, FormatEvent]
+
+_SHAPE_TABLE = {
+    **{ord(digit): "9" for digit in "0123456789"},
+    **{ord(letter): "a" for letter in "abcdefghijklmnopqrstuvwxyz"},
+    **{ord(letter): "A" for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+}
+
+
+def input_shape(datetime_str: str) -> str:
+    """Return the layout of a datetime string, with digits replaced by 9,
+    lowercase letters by a and uppercase letters by A.
+    eg. "Jan 13 2021 12:13 PM" -> "Aaa 99 9999 99:99 AA"
+    """
+    return datetime_str.translate(_SHAPE_TABLE)
+
+
+Hook = Callable[[Event], None]
+
+# Replaced, never mutated, so that `emit` can read it without a lock
+_hooks: Tuple[Hook, ...] = ()
+_hooks_lock = threading.Lock()
+
+
+def add_hook(hook: Hook):
+    """Register a callable that receives every ParseEvent and BatchEvent,
+    and enable instrumentation. Hooks are called in the parsing thread.
+    Values parsed in worker processes by `parse_many` don't emit ParseEvents.
+    """
+    global ENABLED, _hooks  # pylint: disable=W0603
+    with _hooks_lock:
+        _hooks = (*_hooks, hook)
+        ENABLED = True
+
+
+def remove_hook(hook: Hook):
+    """Unregister a hook. Instrumentation is disabled once no hook is left.
+
+    Raises:
+        ValueError: When `hook` is not registered
+    """
+    global ENABLED, _hooks  # pylint: disable=W0603
+    with _hooks_lock:
+        hooks = list(_hooks)
+        hooks.remove(hook)
+        _hooks = tuple(hooks)
+        ENABLED = bool(_hooks)
+
+
+def emit(event: Event):
+    for hook in _hooks:
+        hook(event)
+
+
+class ParseTrace:
+    """Collects the stage timings of one `parse()` call.
+    The parser calls `enter` at the start of each stage.
+    """
+
+    def __init__(self, datetime_str: str):
+        self.datetime_str = datetime_str
+        self.stage_ns: Dict[str, int] = {}
+        self.stage: Optional[str] = None
+        self.attempts = 0
+        self._current: Optional[str] = None
+        self._start = self._stage_start = perf_counter_ns()
+
+    def enter(self, stage: Optional[str]):
+        now = perf_counter_ns()
+        if self._current is not None:
+            self.stage_ns[self._current] = now - self._stage_start
+        self._current, self._stage_start = stage, now
+
+    def add_attempts(
+        self,
+        formats: Sequence[str],
+        matched_format: Optional[str],
+        exhaustive: bool = False,
+    ):
+        """Count the formats tried until `matched_format` matched. Every format
+        is tried when none matched or when `exhaustive` is True.
+        """
+        if matched_format is None or exhaustive:
+            self.attempts += len(formats)
+        else:
+            self.attempts += list(formats).index(matched_format) + 1
+
+    def finish(self, error: Optional[BaseException] = None) -> ParseEvent:
+        self.enter(None)
+        return ParseEvent(
+            datetime_str=self.datetime_str,
+            stage=None if error else self.stage,
+            attempts=self.attempts,
+            stage_ns=self.stage_ns,
+            total_ns=self._stage_start - self._start,
+            error=type(error).__name__ if error else None,
+        )
+
+
+def trace_parse(parse_func, datetime_raw_str, formats, config):
+    """Run `parse_func` with a ParseTrace and emit its ParseEvent"""
+    trace = ParseTrace(datetime_raw_str)
+    try:
+        parsed = parse_func(datetime_raw_str, formats, config, trace)
+    except BaseException as error:
+        emit(trace.finish(error))
+        raise
+    emit(trace.finish())
+    return parsed
+
+
+def trace_format(format_func, method: str) -> str:
+    """Run `format_func` and emit its FormatEvent"""
+    start = perf_counter_ns()
+    formatted = format_func()
+    emit(FormatEvent(method=method, total_ns=perf_counter_ns() - start))
+    return formatted
+
+
+def trace_batch(parse_many_func, values, formats, config, workers, errors, executor):
+    """Run `parse_many_func` and emit its BatchEvent"""
+    start = perf_counter_ns()
+    try:
+        parsed = parse_many_func(values, formats, config, workers, errors, executor)
+    except BaseException as error:
+        emit(
+            BatchEvent(
+                count=len(values),
+                failures=0,
+                workers=workers,
+                executor=executor,
+                total_ns=perf_counter_ns() - start,
+                error=type(error).__name__,
+            )
+        )
+        raise
+    emit(
+        BatchEvent(
+            count=len(parsed),
+            failures=sum(value is None for value in parsed),
+            workers=workers,
+            executor=executor,
+            total_ns=perf_counter_ns() - start,
+            error=None,
+        )
+    )
+    return parsed
+
+
+class ParseSummary:
+    """A hook that aggregates events: the number of values resolved by each
+    stage, failures by exception type, format attempts, time per stage and
+    the number of formatted datetimes. Formatting time is counted in
+    `stage_ns` under FORMATTING_STAGE.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.stages: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.attempts = 0
+        self.stage_ns: Counter = Counter()
+        self.total_ns = 0
+        self.batches = 0
+        self.batch_ns = 0
+        self.formatted = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Event):
+        with self._lock:
+            if isinstance(event, BatchEvent):
+                self.batches += 1
+                self.batch_ns += event.total_ns
+                return
+            if isinstance(event, FormatEvent):
+                self.formatted += 1
+                self.stage_ns[FORMATTING_STAGE] += event.total_ns
+                return
+            self.count += 1
+            if event.error:
+                self.errors[event.error] += 1
+            else:
+                self.stages[event.stage] += 1
+            self.attempts += event.attempts
+            self.stage_ns.update(event.stage_ns)
+            self.total_ns += event.total_ns
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "count": self.count,
+                "stages": dict(self.stages),
+                "errors": dict(self.errors),
+                "attempts": self.attempts,
+                "stage_ns": dict(self.stage_ns),
+                "total_ns": self.total_ns,
+                "batches": self.batches,
+                "batch_ns": self.batch_ns,
+                "formatted": self.formatted,
+            }
+
+
+@contextmanager
+def instrument(hook: Optional[Hook] = None):
+    """Enable instrumentation within a `with` block and yield a ParseSummary
+    of the events emitted in it. `hook` is also registered, if given.
+    """
+    summary = ParseSummary()
+    hooks = [summary] if hook is None else [summary, hook]
+    for hook_ in hooks:
+        add_hook(hook_)
+    try:
+        yield summary
+    finally:
+        for hook_ in hooks:
+            remove_hook(hook_)
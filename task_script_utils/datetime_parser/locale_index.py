@@ -0,0 +1,89 @@
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
+
+DEFAULT_LOCALES = ("en",)
+
+# pendulum token for each kind of name, in the order they are matched
+_DAY_TRANSLATIONS = (
+    ("dddd", "days.wide"),
+    ("ddd", "days.abbreviated"),
+    ("dd", "days.short"),
+)
+_MONTH_TRANSLATIONS = (
+    ("MMMM", "months.wide"),
+    ("MMM", "months.abbreviated"),
+)
+
+
+class LocaleName(NamedTuple):
+    """A month or weekday name matched in a locale"""
+
+    locale: str
+    token: str
+    value: int
+
+
+class LocaleIndex:
+    """Reverse index from month and weekday names of one or more
+    pendulum locales to their pendulum token and value.
+    eg. with locales ("en", "de"):
+    "Mai" -> (LocaleName(locale="de", token="MMMM", value=5),)
+    """
+
+    def __init__(self, locales: Sequence[str] = DEFAULT_LOCALES):
+        # pylint: disable=C0415
+        from pendulum.locales.locale import Locale
+
+        self.locales: Tuple[str, ...] = tuple(locales)
+        self.days: Dict[str, Tuple[LocaleName, ...]] = {}
+        self.months: Dict[str, Tuple[LocaleName, ...]] = {}
+        for locale_name in self.locales:
+            locale = Locale.load(locale_name)
+            self._add_names(self.days, locale, locale_name, _DAY_TRANSLATIONS)
+            self._add_names(self.months, locale, locale_name, _MONTH_TRANSLATIONS)
+
+    @staticmethod
+    def _add_names(index, locale, locale_name, translations):
+        for token, key in translations:
+            for value, name in locale.translation(key).items():
+                matches = index.get(name, ())
+                # A name can be both wide and abbreviated, eg. "May".
+                # Only the first token of each locale is kept.
+                if any(match.locale == locale_name for match in matches):
+                    continue
+                index[name] = (*matches, LocaleName(locale_name, token, value))
+
+    @staticmethod
+    def _match(index, token: str, locale: Optional[str]) -> Optional[LocaleName]:
+        for match in index.get(token, ()):
+            if locale is None or match.locale == locale:
+                return match
+        return None
+
+    def match_day(self, token: str, locale: Optional[str] = None):
+        """Return the first LocaleName for a weekday name, optionally
+        restricted to `locale`.
+        """
+        return self._match(self.days, token, locale)
+
+    def match_month(self, token: str, locale: Optional[str] = None):
+        """Return the first LocaleName for a month name, optionally
+        restricted to `locale`.
+        """
+        return self._match(self.months, token, locale)
+
+
+@lru_cache(maxsize=32)
+def get_locale_index(locales: Tuple[str, ...] = DEFAULT_LOCALES) -> LocaleIndex:
+    """Return the LocaleIndex for `locales`. Indexes are built on first use
+    and cached.
+
+    Raises:
+        ValueError: When a locale is not supported by pendulum
+    """
+    index = LocaleIndex(locales)
+    # pylint: disable=C0415
+    from .parser_cache import PARSER_CACHE
+
+    PARSER_CACHE.record_locales(index.locales)
+    return index
@@ -0,0 +1,312 @@
+# Process-wide metrics of the datetime parser, fed by `instrumentation` hooks.
+# Counters and the latency histogram are updated with a few dict and list
+# increments per parse; percentiles, cache statistics and the text exposition
+# are only computed on `snapshot()` and `write_prometheus()`.
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from . import instrumentation
+from .instrumentation import BatchEvent, Event, FormatEvent, input_shape
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    1.0,
+)
+PERCENTILES = (50, 90, 99)
+
+# Distinct input shapes of failed values that are counted.
+# Shapes first seen after this limit is reached are not counted.
+MAX_FAILING_SHAPES = 1024
+TOP_FAILING_SHAPES = 10
+
+FAILURE = "failure"
+METRIC_PREFIX = "ts_datetime_parser"
+
+
+def _cache_statistics() -> Dict[str, Tuple[int, int]]:
+    """Return the (hits, misses) of the parser's caches"""
+    # pylint: disable=C0415
+    from .locale_index import get_locale_index
+    from .tz_registry import get_fixed_timezone, get_timezone
+    from .utils.fixed_width_formats import compile_fixed_width_format
+
+    caches = {
+        "fixed_width_formats": compile_fixed_width_format,
+        "timezones": get_timezone,
+        "fixed_timezones": get_fixed_timezone,
+        "locale_indexes": get_locale_index,
+    }
+    statistics = {}
+    for name, cached_function in caches.items():
+        info = cached_function.cache_info()
+        statistics[name] = (info.hits, info.misses)
+    return statistics
+
+
+class MetricsRegistry:
+    """Counters and latency histogram of parsed values. A registry is an
+    `instrumentation` hook, `enable` registers it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        # pylint: disable=W0201
+        with self._lock:
+            self.resolutions: Counter = Counter()
+            self.failures: Counter = Counter()
+            self.failing_shapes: Counter = Counter()
+            self.attempts = 0
+            # One count per bucket of LATENCY_BUCKETS, plus one for +Inf
+            self.latency_counts: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+            self.latency_sum_ns = 0
+            self.batches = 0
+            self.batch_values = 0
+
+    def enable(self):
+        """Register this registry as an instrumentation hook"""
+        instrumentation.add_hook(self)
+
+    def disable(self):
+        """Unregister this registry
+
+        Raises:
+            ValueError: When the registry is not enabled
+        """
+        instrumentation.remove_hook(self)
+
+    def __call__(self, event: Event):
+        if isinstance(event, BatchEvent):
+            with self._lock:
+                self.batches += 1
+                self.batch_values += event.count
+            return
+        if isinstance(event, FormatEvent):
+            return
+
+        bucket = bisect_left(LATENCY_BUCKETS, event.total_ns / 1e9)
+        with self._lock:
+            self.latency_counts[bucket] += 1
+            self.latency_sum_ns += event.total_ns
+            self.attempts += event.attempts
+            if event.error is None:
+                self.resolutions[event.stage] += 1
+                return
+            self.resolutions[FAILURE] += 1
+            self.failures[event.error] += 1
+            datetime_str = event.datetime_str
+            # Values that aren't strings fail with the parser's own error,
+            # they are counted by type
+            if isinstance(datetime_str, str):
+                shape = input_shape(datetime_str)
+            else:
+                shape = type(datetime_str).__name__
+            if (
+                shape in self.failing_shapes
+                or len(self.failing_shapes) < MAX_FAILING_SHAPES
+            ):
+                self.failing_shapes[shape] += 1
+
+    @staticmethod
+    def _percentile(counts: Sequence[int], percentile: float) -> Optional[float]:
+        """Estimate a latency percentile in seconds from the histogram,
+        interpolating linearly within the bucket it falls in.
+        """
+        total = sum(counts)
+        if not total:
+            return None
+        rank = total * percentile / 100
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if count and cumulative + count >= rank:
+                lower = LATENCY_BUCKETS[index - 1] if index else 0.0
+                if index == len(LATENCY_BUCKETS):
+                    return lower
+                upper = LATENCY_BUCKETS[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return LATENCY_BUCKETS[-1]
+
+    def snapshot(self) -> dict:
+        """Return the current metrics as a dict"""
+        with self._lock:
+            resolutions = dict(self.resolutions)
+            failures = dict(self.failures)
+            failing_shapes = self.failing_shapes.most_common(TOP_FAILING_SHAPES)
+            latency_counts = list(self.latency_counts)
+            latency_sum_ns = self.latency_sum_ns
+            attempts = self.attempts
+            batches = self.batches
+            batch_values = self.batch_values
+
+        count = sum(latency_counts)
+        cumulative = 0
+        buckets = {}
+        for bound, bucket_count in zip((*LATENCY_BUCKETS, "+Inf"), latency_counts):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+
+        return {
+            "parses": count,
+            "resolutions": resolutions,
+            "failures": failures,
+            "top_failing_shapes": dict(failing_shapes),
+            "attempts": attempts,
+            "latency": {
+                "mean_seconds": latency_sum_ns / count / 1e9 if count else None,
+                "sum_seconds": latency_sum_ns / 1e9,
+                "buckets": buckets,
+                **{
+                    f"p{percentile}_seconds": self._percentile(
+                        latency_counts, percentile
+                    )
+                    for percentile in PERCENTILES
+                },
+            },
+            "caches": {
+                name: {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": hits / (hits + misses) if hits + misses else None,
+                }
+                for name, (hits, misses) in _cache_statistics().items()
+            },
+            "batches": batches,
+            "batch_values": batch_values,
+        }
+
+    def to_prometheus(self) -> str:
+        """Return the current metrics in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = []
+
+        def metric(name, metric_type, help_text, samples):
+            name = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(
+                    f'{key}="{_escape_label(str(label))}"'
+                    for key, label in labels.items()
+                )
+                label_text = f"{{{label_text}}}" if label_text else ""
+                lines.append(f"{name}{suffix}{label_text} {value}")
+
+        metric(
+            "parses_total",
+            "counter",
+            "Parsed values by resolution path",
+            [
+                ("", {"path": path}, count)
+                for path, count in snapshot["resolutions"].items()
+            ],
+        )
+        metric(
+            "failures_total",
+            "counter",
+            "Values that could not be parsed by exception type",
+            [
+                ("", {"error": error}, count)
+                for error, count in snapshot["failures"].items()
+            ],
+        )
+        metric(
+            "failing_shape_total",
+            "counter",
+            f"Failed values of the {TOP_FAILING_SHAPES} most failing input shapes",
+            [
+                ("", {"shape": shape}, count)
+                for shape, count in snapshot["top_failing_shapes"].items()
+            ],
+        )
+        metric(
+            "format_attempts_total",
+            "counter",
+            "Datetime formats tried",
+            [("", {}, snapshot["attempts"])],
+        )
+        latency = snapshot["latency"]
+        metric(
+            "parse_duration_seconds",
+            "histogram",
+            "Duration of parse() calls",
+            [
+                *(
+                    ("_bucket", {"le": bound}, count)
+                    for bound, count in latency["buckets"].items()
+                ),
+                ("_sum", {}, latency["sum_seconds"]),
+                ("_count", {}, snapshot["parses"]),
+            ],
+        )
+        metric(
+            "cache_hits_total",
+            "counter",
+            "Hits of the parser caches",
+            [
+                ("", {"cache": name}, cache["hits"])
+                for name, cache in snapshot["caches"].items()
+            ],
+        )
+        metric(
+            "cache_misses_total",
+            "counter",
+            "Misses of the parser caches",
+            [
+                ("", {"cache": name}, cache["misses"])
+                for name, cache in snapshot["caches"].items()
+            ],
+        )
+        metric(
+            "batches_total",
+            "counter",
+            "parse_many() calls",
+            [("", {}, snapshot["batches"])],
+        )
+        metric(
+            "batch_values_total",
+            "counter",
+            "Values passed to parse_many()",
+            [("", {}, snapshot["batch_values"])],
+        )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str):
+        """Write the current metrics in the Prometheus text exposition format
+        to `path`, eg. for the textfile collector of the node exporter.
+        The file is replaced atomically.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+                temp_file.write(self.to_prometheus())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+REGISTRY = MetricsRegistry()
@@ -1,4 +1,4 @@
-from typing import Sequence
+from typing import Optional, Sequence
 
 import pendulum
 from task_script_utils.datetime_parser.parser_exceptions import (
@@ -6,8 +6,10 @@ from task_script_utils.datetime_parser.parser_exceptions import (
 )
 from task_script_utils.datetime_parser.ts_datetime import TSDatetime
 
+from . import instrumentation
 from .datetime_config import DEFAULT_DATETIME_CONFIG, DatetimeConfig
 from .datetime_info import ShortDateTimeInfo, LongDateTimeInfo
+from .parser_cache import PARSER_CACHE
 from .utils.parsing import _parse_with_formats
 from .utils.manipulation import replace_z_with_offset
 
@@ -32,6 +34,17 @@ def parse(
     Returns:
         TSDatetime
     """
+    if instrumentation.ENABLED:
+        return instrumentation.trace_parse(_parse, datetime_raw_str, formats, config)
+    return _parse(datetime_raw_str, formats, config)
+
+
+def _parse(
+    datetime_raw_str: str,
+    formats: Sequence[str],
+    config: DatetimeConfig,
+    trace: Optional[instrumentation.ParseTrace] = None,
+) -> TSDatetime:
     parsed_datetime = None
     datetime_info = None
 
@@ -40,19 +53,42 @@ def parse(
     datetime_str = replace_z_with_offset(datetime_raw_str)
     # Parse Using formats list
     if formats:
-        parsed_datetime, _ = _parse_with_formats(
+        if trace is not None:
+            trace.enter(instrumentation.FORMATS_STAGE)
+        PARSER_CACHE.record_formats(formats)
+        parsed_datetime, matched_format = _parse_with_formats(
             datetime_str, config=config, formats=formats
         )
+        if trace is not None:
+            trace.stage = instrumentation.FORMATS_STAGE
+            trace.add_attempts(
+                formats, matched_format, config.require_unambiguous_formats
+            )
 
     # Otherwise use DateInfo Parser to parse short dates
     if not parsed_datetime:
+        if trace is not None:
+            trace.enter(instrumentation.SHORT_STAGE)
+            trace.stage = instrumentation.SHORT_STAGE
         datetime_info = ShortDateTimeInfo(datetime_str, config)
+        if trace is not None and datetime_info.datetime_stamp is not None:
+            # The short stage tries the one format built from matched tokens
+            trace.add_attempts((datetime_info.datetime_format,), None)
         parsed_datetime = datetime_info.datetime
 
     # Use long date formats
     if not parsed_datetime:
+        if trace is not None:
+            trace.enter(instrumentation.LONG_STAGE)
+            trace.stage = instrumentation.LONG_STAGE
         datetime_info = LongDateTimeInfo(datetime_str, config)
         parsed_datetime = datetime_info.datetime
+        if trace is not None:
+            trace.add_attempts(
+                datetime_info.long_datetime_formats,
+                datetime_info.parsed_datetime_format,
+                config.require_unambiguous_formats,
+            )
 
     if parsed_datetime is None:
         raise DatetimeParserError(f"Could not parse: {datetime_str}")
@@ -61,5 +97,7 @@ def parse(
         parsed_datetime = pendulum.instance(parsed_datetime)
         parsed_datetime = TSDatetime(datetime_=parsed_datetime)
 
+    if trace is not None:
+        trace.enter(instrumentation.FOLD_STAGE)
     parsed_datetime.change_fold(config.fold)
     return parsed_datetime
@@ -0,0 +1,339 @@
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from hashlib import sha1
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .datetime_config import DatetimeConfig
+
+CACHE_VERSION = 2
+
+# Upper bound on the number of entries of each kind, so that
+# generated formats can't grow the cache indefinitely
+MAX_ENTRIES = 4096
+
+# Long datetime format hits are buffered and merged in batches of this size,
+# so that parsing threads only take the lock once per batch
+HIT_BATCH_SIZE = 256
+
+# When False, long datetime formats are tried in their generated order,
+# eg. to compare both orders in differential tests
+ORDER_LONG_FORMATS = True
+
+
+def config_fingerprint(config: DatetimeConfig) -> str:
+    """Return a stable fingerprint of every field of a DatetimeConfig"""
+    fields = {
+        "day_first": config.day_first,
+        "year_first": config.year_first,
+        "tz_dict": config.tz_dict,
+        "fold": config.fold,
+        "require_unambiguous_formats": config.require_unambiguous_formats,
+        "locales": list(config.locales),
+    }
+    encoded = json.dumps(fields, sort_keys=True, default=str).encode("utf-8")
+    return sha1(encoded).hexdigest()
+
+
+def _pendulum_version() -> str:
+    # pylint: disable=C0415
+    import pendulum
+
+    return pendulum.__version__
+
+
+class ParserCache:
+    """ParserCache holds what the datetime parser learns while parsing:
+    - the long datetime format matched by each input shape (see
+      `instrumentation.input_shape`), and how often each long datetime format
+      matched, so that `LongDateTimeInfo` tries the format of the shape of
+      its input first, then formats in order of hits
+    - the datetime formats, IANA timezones and locales that were used, so
+      that they can be compiled and loaded up front on the next run
+
+    Every long datetime format that matches a datetime string produces the
+    same datetime, so the order in which they are tried doesn't change
+    the result of `parse()`. The order of user supplied formats is never changed.
+
+    ParserCache is thread-safe. Writes and snapshots hold a lock, lookups
+    don't, so parsing threads only contend while recording something new.
+    Hits of known shapes and formats are appended to a pending list without
+    the lock, and merged by `flush()` once `HIT_BATCH_SIZE` are pending or
+    when a snapshot is taken.
+    """
+
+    def __init__(self):
+        self.long_format_hits: Dict[str, int] = {}
+        self.shape_formats: Dict[str, str] = {}
+        self.formats: Dict[str, bool] = {}
+        self.timezones: Dict[str, None] = {}
+        self.locales: Dict[Tuple[str, ...], None] = {}
+        self._pending_hits: List[Tuple[str, Optional[str], int]] = []
+        # Last sequence of formats recorded, so that parsing a column with
+        # the same formats doesn't look them up on every call
+        self._last_formats: Optional[Sequence[str]] = None
+        self._lock = threading.Lock()
+        # `paused` is set by `not_recording` in the calling thread only
+        self._local = threading.local()
+
+    def clear(self):
+        with self._lock:
+            self._pending_hits.clear()
+            self._last_formats = None
+            self.long_format_hits.clear()
+            self.shape_formats.clear()
+            self.formats.clear()
+            self.timezones.clear()
+            self.locales.clear()
+
+    @staticmethod
+    def _add(entries: dict, key, value=None):
+        if key in entries or len(entries) < MAX_ENTRIES:
+            entries[key] = value
+
+    def _is_new(self, entries: dict, key) -> bool:
+        return key not in entries and len(entries) < MAX_ENTRIES
+
+    def record_long_format_hit(
+        self, format_: str, count: int = 1, shape: Optional[str] = None
+    ):
+        """Record that `format_` matched an input of `shape`. Hits that teach
+        a new format or shape are merged right away, the others in batches.
+        """
+        if getattr(self._local, "paused", False):
+            return
+        pending = self._pending_hits
+        pending.append((format_, shape, count))
+        if (
+            len(pending) >= HIT_BATCH_SIZE
+            or self._is_new(self.long_format_hits, format_)
+            or (shape is not None and self._is_new(self.shape_formats, shape))
+        ):
+            self.flush()
+
+    @contextmanager
+    def not_recording(self):
+        """Don't record long datetime format hits of the current thread, eg.
+        while parsing synthetic samples
+        """
+        paused = getattr(self._local, "paused", False)
+        self._local.paused = True
+        try:
+            yield
+        finally:
+            self._local.paused = paused
+
+    def flush(self):
+        """Merge the pending long datetime format hits"""
+        with self._lock:
+            pending = self._pending_hits
+            # Hits appended by other threads meanwhile stay pending
+            count = len(pending)
+            hits = pending[:count]
+            del pending[:count]
+            for format_, shape, format_count in hits:
+                self._add(
+                    self.long_format_hits,
+                    format_,
+                    self.long_format_hits.get(format_, 0) + format_count,
+                )
+                if shape is not None and shape not in self.shape_formats:
+                    self._add(self.shape_formats, shape, format_)
+
+    def order_long_formats(
+        self, formats: Sequence[str], shape: Optional[str] = None
+    ) -> Sequence[str]:
+        """Return `formats` with the format matched by `shape` first, then
+        previously matched formats, most matched first.
+        """
+        hits = self.long_format_hits
+        if not hits or not ORDER_LONG_FORMATS:
+            return formats
+        matched = [format_ for format_ in formats if format_ in hits]
+        if not matched:
+            return formats
+        matched.sort(key=lambda format_: -hits.get(format_, 0))
+        shape_format = self.shape_formats.get(shape) if shape is not None else None
+        if shape_format in matched:
+            matched.remove(shape_format)
+            matched.insert(0, shape_format)
+        unmatched = [format_ for format_ in formats if format_ not in hits]
+        return (*matched, *unmatched)
+
+    def record_formats(self, formats: Sequence[str]):
+        if formats is self._last_formats:
+            return
+        new_formats = [format_ for format_ in formats if format_ not in self.formats]
+        if not new_formats:
+            self._last_formats = formats
+            return
+
+        # pylint: disable=C0415
+        from .utils.fixed_width_formats import compile_fixed_width_format
+
+        fixed_width = [
+            compile_fixed_width_format(format_) is not None for format_ in new_formats
+        ]
+        with self._lock:
+            for format_, is_fixed_width in zip(new_formats, fixed_width):
+                self._add(self.formats, format_, is_fixed_width)
+        self._last_formats = formats
+
+    def record_timezone(self, name: str):
+        with self._lock:
+            self._add(self.timezones, name)
+
+    def record_locales(self, locales: Tuple[str, ...]):
+        with self._lock:
+            self._add(self.locales, tuple(locales))
+
+    def to_dict(self) -> dict:
+        self.flush()
+        with self._lock:
+            return {
+                "long_format_hits": dict(self.long_format_hits),
+                "shape_formats": dict(self.shape_formats),
+                "formats": dict(self.formats),
+                "timezones": list(self.timezones),
+                "locales": [list(locales) for locales in self.locales],
+            }
+
+    def update(self, state: dict):
+        """Merge a state returned by `to_dict` into this cache.
+
+        Raises:
+            TypeError, ValueError: When `state` is malformed
+        """
+        long_format_hits = {
+            str(format_): int(hits)
+            for format_, hits in state["long_format_hits"].items()
+        }
+        shape_formats = {
+            str(shape): str(format_)
+            for shape, format_ in state["shape_formats"].items()
+        }
+        formats = {
+            str(format_): bool(fixed) for format_, fixed in state["formats"].items()
+        }
+        timezones = [str(name) for name in state["timezones"]]
+        locales = [tuple(str(locale) for locale in value) for value in state["locales"]]
+
+        with self._lock:
+            for format_, hits in long_format_hits.items():
+                self._add(
+                    self.long_format_hits,
+                    format_,
+                    self.long_format_hits.get(format_, 0) + hits,
+                )
+            for shape, format_ in shape_formats.items():
+                if shape not in self.shape_formats:
+                    self._add(self.shape_formats, shape, format_)
+            for format_, fixed in formats.items():
+                self._add(self.formats, format_, fixed)
+            for name in timezones:
+                self._add(self.timezones, name)
+            for value in locales:
+                self._add(self.locales, value)
+
+
+PARSER_CACHE = ParserCache()
+
+
+def _read_cache_file(path: str) -> Optional[dict]:
+    """Return the content of a cache file, or None if it is missing,
+    corrupt or written by another cache or pendulum version.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as cache_file:
+            content = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(content, dict)
+        or content.get("version") != CACHE_VERSION
+        or content.get("pendulum_version") != _pendulum_version()
+        or not isinstance(content.get("entries"), dict)
+    ):
+        return None
+    return content
+
+
+def save_parser_cache(path: str, config: Optional[DatetimeConfig] = None):
+    """Persist the state learned by the datetime parser to a JSON file.
+    The state is stored under the fingerprint of `config`, entries of other
+    configs already in the file are kept.
+
+    Args:
+        path (str): Path of the cache file
+        config (DatetimeConfig, optional): Datetime Configuration used for
+        parsing. Defaults to DEFAULT_DATETIME_CONFIG.
+    """
+    # pylint: disable=C0415
+    from .datetime_config import DEFAULT_DATETIME_CONFIG
+
+    config = config or DEFAULT_DATETIME_CONFIG
+    content = _read_cache_file(path) or {
+        "version": CACHE_VERSION,
+        "pendulum_version": _pendulum_version(),
+        "entries": {},
+    }
+    content["entries"][config_fingerprint(config)] = PARSER_CACHE.to_dict()
+
+    # Write to a temporary file first, so that concurrent readers
+    # never see a partially written cache file
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
+            json.dump(content, temp_file, separators=(",", ":"))
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_parser_cache(path: str, config: Optional[DatetimeConfig] = None) -> bool:
+    """Load the state saved by `save_parser_cache` for `config`, then compile
+    the cached formats and load the cached timezones and locales.
+    Missing, stale or corrupt cache files are ignored.
+
+    Args:
+        path (str): Path of the cache file
+        config (DatetimeConfig, optional): Datetime Configuration used for
+        parsing. Defaults to DEFAULT_DATETIME_CONFIG.
+
+    Returns:
+        bool: True if a cached state was loaded
+    """
+    # pylint: disable=C0415
+    from .datetime_config import DEFAULT_DATETIME_CONFIG
+    from .locale_index import get_locale_index
+    from .warmup import _compile_formats, _load_timezones
+
+    config = config or DEFAULT_DATETIME_CONFIG
+    content = _read_cache_file(path)
+    if content is None:
+        return False
+
+    state = content["entries"].get(config_fingerprint(config))
+    if not isinstance(state, dict):
+        return False
+
+    loaded_cache = ParserCache()
+    try:
+        loaded_cache.update(state)
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return False
+
+    PARSER_CACHE.update(loaded_cache.to_dict())
+    _compile_formats(list(loaded_cache.formats))
+    _load_timezones(list(loaded_cache.timezones))
+    for locales in loaded_cache.locales:
+        try:
+            get_locale_index(locales)
+        except ValueError:
+            pass
+    return True
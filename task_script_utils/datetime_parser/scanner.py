@@ -0,0 +1,148 @@
+# Scanner of the datetimes in raw text files, eg. instrument reports with
+# timestamps in headers and free form lines. Files are memory mapped and a
+# compiled regex finds candidate datetimes in the bytes, so only candidates
+# are decoded and parsed. The regex follows the token rules of
+# `ShortDateTimeInfo` and `LongDateTimeInfo`.
+import mmap
+import os
+import re
+from functools import lru_cache
+from typing import Iterator, NamedTuple, Sequence, Tuple, Union
+
+from .datetime_config import DEFAULT_DATETIME_CONFIG, DatetimeConfig
+from .ts_datetime import TSDatetime
+
+# Short dates, as matched by `ShortDateTimeInfo._match_short_date`
+_SHORT_DATE = (
+    rb"\d{4}[-./\\]\d{1,2}[-./\\]\d{1,2}"
+    rb"|\d{1,2}[-./\\]\d{1,2}[-./\\]\d{4}"
+    rb"|\d{1,2}[-./\\]\d{1,2}[-./\\]\d{1,2}"
+)
+# Times, as matched by `ShortDateTimeInfo._match_time`
+_TIME = rb"\d{1,2}:\d{1,2}(?::\d{1,2}(?:\.\d+)?)?"
+_MERIDIEM = rb"[AaPp][Mm]"
+# Offsets, IANA timezones and abbreviated timezones
+_TIMEZONE = (
+    rb"Z|[Uu][Tt][Cc][+-]\d{1,4}|[+-]\d{1,2}:?\d{2}"
+    rb"|[A-Za-z_]+(?:/[A-Za-z0-9_+-]+){1,2}|[A-Z]{2,5}"
+)
+_OFFSET = re.compile(r"Z|[Uu][Tt][Cc][+-]\d{1,4}|[+-]\d{1,2}:?\d{2}")
+
+
+class DatetimeMatch(NamedTuple):
+    # Offset of the first byte of the datetime in the file
+    offset: int
+    text: str
+    datetime: TSDatetime
+
+
+def _alternatives(names) -> bytes:
+    """Regex alternation of names, longest first so that "June" isn't matched
+    as "Jun"
+    """
+    encoded = sorted({name.encode("utf-8") for name in names}, key=len, reverse=True)
+    return b"|".join(re.escape(name) for name in encoded)
+
+
+@lru_cache(maxsize=32)
+def candidate_pattern(locales: Tuple[str, ...]) -> "re.Pattern":
+    """Return the compiled regex of candidate datetimes with month and weekday
+    names of `locales`. The groups `core` and `tz` end before and after the
+    timezone.
+    """
+    from .locale_index import get_locale_index  # pylint: disable=C0415
+
+    locale_index = get_locale_index(locales)
+    months = _alternatives(locale_index.months)
+    days = _alternatives(locale_index.days)
+    # Long dates, as built by `LongDateTimeInfo._build_long_date_format`
+    long_date = (
+        rb"(?:(?:" + days + rb"),?[ \t]+)?(?:" + months + rb")[ \t]+"
+        rb"\d{1,2}(?:st|nd|rd|th)?,?[ \t]+\d{2,4}[ \t]+"
+    )
+    short_date = rb"(?:" + _SHORT_DATE + rb")(?:T|[ \t]+)"
+    time = _TIME + rb"(?:[ \t]*" + _MERIDIEM + rb")?"
+    core = rb"(?:" + long_date + rb"|" + short_date + rb")" + time
+    timezone = rb"[ \t]*(?:" + _TIMEZONE + rb")"
+    # Candidates aren't part of a longer token, eg. a version or a path
+    return re.compile(
+        rb"(?<![\w.:/\\-])(?P<core>" + core + rb")(?P<tz>" + timezone + rb")?(?![\w:/])"
+    )
+
+
+def _is_timezone(token: str, config: DatetimeConfig) -> bool:
+    """Return True if `token` is an offset or a known timezone, as opposed to
+    a word following the datetime, eg. "ERROR"
+    """
+    # pylint: disable=C0415
+    from .tz_registry import is_abbreviated_timezone, is_iana_timezone
+
+    return bool(
+        _OFFSET.fullmatch(token)
+        or is_iana_timezone(token)
+        or is_abbreviated_timezone(token)
+        or token in config.tz_dict
+    )
+
+
+def _parse_candidate(match, formats, config):
+    """Parse the candidate, with its timezone when it has one.
+    Return the text and the TSDatetime, or None if it can't be parsed.
+    """
+    # pylint: disable=C0415
+    from .parser import parse
+
+    end = match.end("core")
+    tz = match.group("tz")
+    # A timezone that can't be parsed makes the candidate fail: without it,
+    # the datetime would be naive and mean another instant
+    if tz is not None and _is_timezone(bytes(tz).decode("ascii").strip(), config):
+        end = match.end("tz")
+    # Buffers may be memoryviews, whose slices aren't bytes
+    text = bytes(match.string[match.start() : end]).decode("utf-8", "replace")
+    try:
+        return text, parse(text, formats, config)
+    except Exception:  # pylint: disable=W0703
+        return None
+
+
+def _scan(buffer, formats, config) -> Iterator[DatetimeMatch]:
+    pattern = candidate_pattern(tuple(config.locales))
+    for match in pattern.finditer(buffer):
+        parsed = _parse_candidate(match, formats, config)
+        if parsed is not None:
+            yield DatetimeMatch(match.start(), *parsed)
+
+
+def find_datetimes(
+    path_or_buffer: Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap],
+    config: DatetimeConfig = DEFAULT_DATETIME_CONFIG,
+    formats: Sequence[str] = (),
+) -> Iterator[DatetimeMatch]:
+    """Find the datetimes of a file or buffer of UTF-8 or ASCII text.
+    Files are memory mapped, so files larger than memory can be scanned.
+    Candidates are short or long datetimes with a date and a time, followed by
+    an optional timezone; each candidate is parsed with
+    `parse(text, formats, config)` and skipped if it can't be parsed,
+    including when its timezone can't be parsed.
+
+    Args:
+        path_or_buffer: Path of the file, or a bytes-like object
+        config (DatetimeConfig, optional): Datetime Configuration. Month and
+        weekday names are matched in its locales.
+        formats (Sequence[str], optional): Datetime formats passed to `parse()`
+
+    Yields:
+        DatetimeMatch: The byte offset, text and TSDatetime of each datetime,
+        in the order of the file
+    """
+    if not isinstance(path_or_buffer, (str, os.PathLike)):
+        yield from _scan(path_or_buffer, formats, config)
+        return
+
+    with open(path_or_buffer, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # Empty files can't be mapped
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from _scan(buffer, formats, config)
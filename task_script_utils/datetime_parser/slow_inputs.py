@@ -0,0 +1,118 @@
+# Records the slowest input shapes seen by `parse()`, fed by `instrumentation`
+# hooks. Only the K slowest distinct shapes are kept, in a min-heap keyed by
+# parse time, so a parse faster than the fastest kept one costs one comparison.
+import heapq
+import json
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from . import instrumentation
+from .instrumentation import Event, ParseEvent, input_shape
+
+DEFAULT_TOP_K = 20
+
+
+class SlowInput(NamedTuple):
+    """The slowest parse seen of one input shape"""
+
+    shape: str
+    example: str
+    # Stage that resolved the datetime, None when parsing failed
+    stage: Optional[str]
+    attempts: int
+    total_ns: int
+    error: Optional[str]
+
+
+class SlowInputRecorder:
+    """An `instrumentation` hook that keeps the `top_k` slowest distinct input
+    shapes, with the slowest example string of each.
+    """
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K):
+        if top_k < 1:
+            raise ValueError(f"top_k must be at least 1, got {top_k}")
+        self.top_k = top_k
+        # (total_ns, shape) of the kept shapes, fastest first
+        self._heap: List[Tuple[int, str]] = []
+        self._inputs: Dict[str, SlowInput] = {}
+        # Time of the fastest kept shape once the heap is full, read without
+        # the lock to skip faster parses
+        self._min_ns = -1
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """Register this recorder as an instrumentation hook"""
+        instrumentation.add_hook(self)
+
+    def disable(self):
+        """Unregister this recorder
+
+        Raises:
+            ValueError: When the recorder is not enabled
+        """
+        instrumentation.remove_hook(self)
+
+    def __call__(self, event: Event):
+        if not isinstance(event, ParseEvent):
+            return
+        # A shape that is kept was at least as slow as the heap's minimum
+        if event.total_ns <= self._min_ns:
+            return
+
+        example = event.datetime_str
+        if isinstance(example, str):
+            shape = input_shape(example)
+        else:
+            # Values that aren't strings are kept by type, with their repr
+            shape, example = type(example).__name__, repr(example)
+        slow_input = SlowInput(
+            shape=shape,
+            example=example,
+            stage=event.stage,
+            attempts=event.attempts,
+            total_ns=event.total_ns,
+            error=event.error,
+        )
+        with self._lock:
+            heap = self._heap
+            kept = self._inputs.get(shape)
+            if kept is not None:
+                if event.total_ns <= kept.total_ns:
+                    return
+                heap.remove((kept.total_ns, shape))
+                heap.append((event.total_ns, shape))
+                heapq.heapify(heap)
+            elif len(heap) < self.top_k:
+                heapq.heappush(heap, (event.total_ns, shape))
+            elif event.total_ns > heap[0][0]:
+                _, evicted = heapq.heapreplace(heap, (event.total_ns, shape))
+                del self._inputs[evicted]
+            else:
+                return
+            self._inputs[shape] = slow_input
+            if len(heap) == self.top_k:
+                self._min_ns = heap[0][0]
+
+    def slowest(self) -> List[SlowInput]:
+        """Return the kept inputs, slowest first"""
+        with self._lock:
+            inputs = list(self._inputs.values())
+        return sorted(inputs, key=lambda slow_input: slow_input.total_ns, reverse=True)
+
+    def clear(self):
+        with self._lock:
+            self._heap.clear()
+            self._inputs.clear()
+            self._min_ns = -1
+
+    def to_dict(self) -> dict:
+        return {
+            "top_k": self.top_k,
+            "inputs": [slow_input._asdict() for slow_input in self.slowest()],
+        }
+
+    def dump(self, path: str):
+        """Write the kept inputs, slowest first, to `path` as JSON"""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
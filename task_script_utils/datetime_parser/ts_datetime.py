@@ -4,6 +4,7 @@ from typing import Optional
 
 import pendulum
 
+from . import instrumentation
 from .parser_exceptions import AmbiguousFoldError
 
 
@@ -42,6 +43,11 @@ class TSDatetime:
     def tsformat(self) -> str:
         """Returns datetime string in Tetrascience's ISO8601 DateTime
         format"""
+        if instrumentation.ENABLED:
+            return instrumentation.trace_format(self._tsformat, "tsformat")
+        return self._tsformat()
+
+    def _tsformat(self) -> str:
         minimal_format = "YYYY-MM-DDTHH:mm:ss"
 
         if self.tzinfo is not None:
@@ -60,6 +66,11 @@ class TSDatetime:
 
     def isoformat(self) -> str:
         """Returns datetime string in ISO format with offset values"""
+        if instrumentation.ENABLED:
+            return instrumentation.trace_format(self._isoformat, "isoformat")
+        return self._isoformat()
+
+    def _isoformat(self) -> str:
         iso_str = self._datetime.format("YYYY-MM-DDTHH:mm:ss")
         if self._subseconds:
             iso_str += f".{str(self._subseconds)}"
@@ -97,9 +108,9 @@ class TSDatetime:
         # Copy because TSDatetime is mutable
         date_time = copy.deepcopy(self)
         date_time.change_fold(0)
-        dt_before_fold = date_time.tsformat()
+        dt_before_fold = date_time._tsformat()
         date_time.change_fold(1)
-        dt_after_fold = date_time.tsformat()
+        dt_after_fold = date_time._tsformat()
         return dt_before_fold != dt_after_fold
 
     @staticmethod
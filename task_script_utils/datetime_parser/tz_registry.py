@@ -0,0 +1,86 @@
+# Hash indexed lookups for IANA timezone names and abbreviated timezones,
+# and a bounded cache of constructed pendulum timezone objects.
+# Every timezone matcher and constructor in the datetime parser goes through
+# this module, instead of scanning `pendulum.timezones` and
+# `_all_abbreviated_tz_list` or loading timezones through pendulum on every parse.
+from functools import lru_cache
+from typing import Dict
+
+import pendulum
+from pendulum.tz.timezone import FixedTimezone, Timezone
+
+from . import tz_dicts
+from .parser_cache import PARSER_CACHE
+from .tz_list import _all_abbreviated_tz_list
+
+IANA_TIMEZONES = frozenset(pendulum.timezones)
+
+# Regional dicts defined in `tz_dicts`, eg. {"USA": {"EST": "-05:00", ...}}
+REGIONAL_TZ_DICTS: Dict[str, Dict[str, str]] = {
+    name: value
+    for name, value in vars(tz_dicts).items()
+    if name.isupper() and isinstance(value, dict)
+}
+
+ABBREVIATED_TIMEZONES = frozenset(_all_abbreviated_tz_list) | frozenset(
+    abbreviation for tz_dict in REGIONAL_TZ_DICTS.values() for abbreviation in tz_dict
+)
+
+TIMEZONE_CACHE_SIZE = 1024
+
+
+def is_iana_timezone(name: str) -> bool:
+    """Return True if `name` is an IANA timezone name known to pendulum,
+    eg. `America/Chicago`
+    """
+    return name in IANA_TIMEZONES
+
+
+def is_abbreviated_timezone(token: str) -> bool:
+    """Return True if `token` is a known abbreviated timezone, ignoring case"""
+    return token.upper() in ABBREVIATED_TIMEZONES
+
+
+def parse_offset(value: str) -> int:
+    """Convert a utc offset matched by pendulum's `Z` or `ZZ` tokens
+    to seconds, eg. `+05:30`, `+0530` or `+05` -> 19800
+
+    Raises:
+        ValueError: When `value` is not a valid offset
+    """
+    negative = value.startswith("-")
+    offset = value[1:]
+    if ":" not in offset:
+        if len(offset) == 2:
+            offset = f"{offset}00"
+        hours, minutes = offset[0:2], offset[2:4]
+    else:
+        hours, minutes = offset.split(":")
+
+    seconds = (int(hours) * 60 + int(minutes)) * 60
+    return -seconds if negative else seconds
+
+
+@lru_cache(maxsize=TIMEZONE_CACHE_SIZE)
+def get_timezone(name: str) -> Timezone:
+    """Return the pendulum Timezone for an IANA timezone name.
+
+    Raises:
+        ValueError: When `name` is not an IANA timezone name
+    """
+    if not is_iana_timezone(name) and name.lower() != "utc":
+        raise ValueError(f"Unknown timezone: {name}")
+    PARSER_CACHE.record_timezone(name)
+    return pendulum.timezone(name)
+
+
+@lru_cache(maxsize=TIMEZONE_CACHE_SIZE)
+def get_fixed_timezone(offset: int) -> FixedTimezone:
+    """Return the pendulum FixedTimezone for a utc offset in seconds"""
+    return pendulum.timezone(offset)
+
+
+def clear_cache():
+    """Drop all cached timezone objects"""
+    get_timezone.cache_clear()
+    get_fixed_timezone.cache_clear()
@@ -0,0 +1,201 @@
+from functools import lru_cache
+from typing import Callable, Optional
+
+from pendulum import now
+from pendulum.formatting import Formatter
+from task_script_utils.datetime_parser.tz_registry import (
+    get_fixed_timezone,
+    parse_offset,
+)
+
+# Width of every pendulum token that can be parsed from a fixed slice
+# of digits. Tokens missing from this map (`M`, `D`, `Do`, `MMMM`, `A`, `z`, ...)
+# have variable width, so formats containing them use the generic parser.
+_FIXED_WIDTH_TOKENS = {
+    "YYYY": 4,
+    "YY": 2,
+    "MM": 2,
+    "DD": 2,
+    "HH": 2,
+    "hh": 2,
+    "mm": 2,
+    "ss": 2,
+    "S": 1,
+    "SS": 2,
+    "SSS": 3,
+    "SSSS": 4,
+    "SSSSS": 5,
+    "SSSSSS": 6,
+    "Z": 6,
+    "ZZ": 5,
+}
+
+_TOKEN_PARTS = {
+    "YYYY": "year",
+    "YY": "year",
+    "MM": "month",
+    "DD": "day",
+    "HH": "hour",
+    "hh": "hour",
+    "mm": "minute",
+    "ss": "second",
+    "Z": "tz",
+    "ZZ": "tz",
+}
+
+# pendulum matches fractional seconds with an open ended regex (`\d+`),
+# so they are only fixed width when no digit can follow them.
+_FRACTIONAL_TOKENS = {"S", "SS", "SSS", "SSSS", "SSSSS", "SSSSSS"}
+_SIGNED_TOKENS = {"Z", "ZZ"}
+
+# When False, `from_pendulum_format` parses every format with the generic
+# parser, eg. to compare both parsers in differential tests
+ENABLED = True
+
+
+def _century() -> int:
+    return now().year // 100 * 100
+
+
+def _tokenize_format(fmt: str) -> Optional[list]:
+    """Split `fmt` into `(is_token, text)` pairs using pendulum's own token
+    regex. Returns None if `fmt` uses escaping, which is left to pendulum.
+    """
+    if any(char in fmt for char in "[]\\"):
+        return None
+
+    parts = []
+    position = 0
+    for match in Formatter._FORMAT_RE.finditer(fmt):
+        if match.start() > position:
+            parts.append((False, fmt[position : match.start()]))
+        parts.append((True, match.group(0)))
+        position = match.end()
+    if position < len(fmt):
+        parts.append((False, fmt[position:]))
+    return parts
+
+
+# pylint: disable=R0912,R0914
+def _generate_source(parts: list) -> Optional[str]:
+    """Generate the source of a function that parses strings laid out
+    exactly as described by `parts`. Returns None if the layout has any
+    variable width part.
+    """
+    checks = []
+    values = {}
+    offset = 0
+    seen_parts = set()
+    for idx, (is_token, text) in enumerate(parts):
+        if not is_token:
+            if any(char.isdigit() for char in text):
+                return None
+            end = offset + len(text)
+            checks.append(f"value[{offset}:{end}] != {text!r}")
+            offset = end
+            continue
+
+        if text not in _FIXED_WIDTH_TOKENS:
+            return None
+        width = _FIXED_WIDTH_TOKENS[text]
+        start, end = offset, offset + width
+        offset = end
+
+        if text in _FRACTIONAL_TOKENS:
+            next_part = parts[idx + 1] if idx + 1 < len(parts) else (False, "")
+            if next_part[0] and next_part[1] not in _SIGNED_TOKENS:
+                return None
+            part = "microsecond"
+        else:
+            part = _TOKEN_PARTS[text]
+        if part in seen_parts:
+            return None
+        seen_parts.add(part)
+
+        if part == "tz":
+            sign_check = f"value[{start}] not in '+-'"
+            if text == "Z":
+                checks.append(sign_check)
+                checks.append(f"value[{start + 3}] != ':'")
+                checks.append(f"not value[{start + 1}:{start + 3}].isdecimal()")
+                checks.append(f"not value[{start + 4}:{end}].isdecimal()")
+            else:
+                checks.append(sign_check)
+                checks.append(f"not value[{start + 1}:{end}].isdecimal()")
+            values[part] = f"_timezone(_parse_offset(value[{start}:{end}]))"
+            continue
+
+        checks.append(f"not value[{start}:{end}].isdecimal()")
+        if part == "microsecond":
+            # Fractional seconds are kept as strings by
+            # FractionalSecondsFormatter to retain every digit.
+            values[part] = f"value[{start}:{end}]"
+        elif text == "YY":
+            values[part] = f"_century() + int(value[{start}:{end}])"
+        else:
+            values[part] = f"int(value[{start}:{end}])"
+
+    if "year" not in values:
+        # pendulum fills missing dates from `now()`, leave it the generic path
+        return None
+
+    # Missing values are filled in the same way as
+    # pendulum.formatting.Formatter._check_parsed
+    values.setdefault("month", "1")
+    values.setdefault("day", "1")
+    for part in ("hour", "minute", "second", "microsecond"):
+        values.setdefault(part, "0")
+    values.setdefault("tz", "None")
+
+    lines = ["def parse_fixed_width(value):"]
+    lines.append(f"    if len(value) != {offset}:")
+    lines.append("        return None")
+    for check in checks:
+        lines.append(f"    if {check}:")
+        lines.append("        return None")
+    if "hh" in (text for is_token, text in parts if is_token):
+        hour = values["hour"]
+        lines.append(f"    if {hour} > 12:")
+        lines.append("        raise ValueError('Invalid date')")
+    lines.append("    return {")
+    for part in ("year", "month", "day", "hour", "minute", "second"):
+        lines.append(f"        {part!r}: {values[part]},")
+    lines.append(f"        'microsecond': {values['microsecond']},")
+    lines.append(f"        'tz': {values['tz']},")
+    lines.append("    }")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=1024)
+def compile_fixed_width_format(fmt: str) -> Optional[Callable[[str], Optional[dict]]]:
+    """Compile a pendulum format with fixed character positions, such as
+    `YYYY-MM-DD HH:mm:ss.SSSSSS` or `YYYYMMDDHHmmss`, into a specialized
+    parsing function. Compiled functions are cached per format.
+
+    The returned function takes a datetime string and returns the same dict
+    as `FractionalSecondsFormatter.parse`. It returns None when the string
+    is not laid out exactly as `fmt`, in which case the caller must fall
+    back to the generic parser, because pendulum also accepts unpadded values.
+
+    Args:
+        fmt (str): datetime format built using `pendulum` tokens
+
+    Returns:
+        Optional[Callable]: None if `fmt` has any variable width token
+    """
+    parts = _tokenize_format(fmt)
+    if not parts:
+        return None
+
+    source = _generate_source(parts)
+    if source is None:
+        return None
+
+    namespace = {
+        "_timezone": get_fixed_timezone,
+        "_parse_offset": parse_offset,
+        "_century": _century,
+    }
+    # pylint: disable=W0122
+    exec(compile(source, f"<fixed width format {fmt!r}>", "exec"), namespace)
+    return namespace["parse_fixed_width"]
@@ -6,11 +6,11 @@ from typing import Mapping, Optional, Sequence, Tuple
 from pendulum import now
 from pendulum.tz import timezone as pendulum_timezone
 from pendulum import datetime as pendulum_datetime
-from pydash.arrays import flatten
 from task_script_utils.datetime_parser.fractional_seconds_formatter import (
     FractionalSecondsFormatter,
 )
 from task_script_utils.datetime_parser.ts_datetime import TSDatetime
+from task_script_utils.datetime_parser.utils import fixed_width_formats
 
 _formatter = FractionalSecondsFormatter()
 
@@ -34,6 +34,9 @@ def map_offset_to_seconds(tz_dict):
 
 
 def get_time_formats_for_long_date(fractional_seconds: Optional[str]) -> Tuple:
+    # pylint: disable=C0401,C0415
+    from pydash.arrays import flatten
+
     def map_am_pm(time_format):
         return time_format if time_format.startswith("H") else time_format + " A"
 
@@ -98,9 +101,18 @@ def from_pendulum_format(
 ) -> TSDatetime:
     """
     Creates a DateTime instance from a specific format.
+    Formats with fixed character positions are parsed by a compiled
+    fixed width parser, everything else by `FractionalSecondsFormatter`.
     """
     subseconds = None
-    parts = _formatter.parse(datetime_string, fmt, now(), locale=locale)
+    parts = None
+    parse_fixed_width = None
+    if fixed_width_formats.ENABLED:
+        parse_fixed_width = fixed_width_formats.compile_fixed_width_format(fmt)
+    if parse_fixed_width is not None:
+        parts = parse_fixed_width(datetime_string)
+    if parts is None:
+        parts = _formatter.parse(datetime_string, fmt, now(), locale=locale)
     if not isinstance(parts, dict):
         raise TypeError(f"Could not match any datetime tokens in '{fmt}'.")
     if parts["tz"] is None:
@@ -63,6 +63,7 @@ def _parse_with_formats(
     datetime_str: str,
     formats: Sequence[str] = (),
     config: DatetimeConfig = DEFAULT_DATETIME_CONFIG,
+    locale: Optional[str] = None,
 ) -> Tuple[Optional[TSDatetime], Optional[str]]:
     # If the input datetime string contains Z to denote UTC+0,
     # then Z is replaced by +00:00
@@ -90,7 +91,10 @@ def _parse_with_formats(
                 parsed_times.append(
                     (
                         from_pendulum_format(
-                            datetime_str_with_no_abbreviated_tz, format_, tz=None
+                            datetime_str_with_no_abbreviated_tz,
+                            format_,
+                            tz=None,
+                            locale=locale,
                         ),
                         formats[idx],
                     )
@@ -103,7 +107,8 @@ def _parse_with_formats(
             return parsed_times[0]
         if len(parsed_times) > 1:
             unique_parsed_times = Counter(
-                [parsed_time[0].isoformat() for parsed_time in parsed_times]
+                # pylint: disable=W0212
+                [parsed_time[0]._isoformat() for parsed_time in parsed_times]
             )
             if len(Counter(unique_parsed_times).values()) > 1:
                 raise AmbiguousDatetimeFormatsError(
@@ -117,7 +122,7 @@ def _parse_with_formats(
     for format_ in formats:
         try:
             parsed = from_pendulum_format(
-                datetime_str_with_no_abbreviated_tz, format_, tz=None
+                datetime_str_with_no_abbreviated_tz, format_, tz=None, locale=locale
             )
             return parsed, format_
         except (ValueError, re_error):
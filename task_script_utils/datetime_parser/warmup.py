@@ -0,0 +1,119 @@
+import re
+from time import perf_counter
+from typing import Dict, Optional, Sequence
+
+from .datetime_config import DEFAULT_DATETIME_CONFIG, DatetimeConfig
+from .parser_exceptions import DatetimeParserError
+
+# Datetime strings that take `parse()` through the short and the
+# long datetime paths, including fractional seconds, meridiem and offsets.
+_WARM_UP_SAMPLES = (
+    "2021-01-13T12:13:14.123456 +00:00",
+    "13/01/2021 12:13 PM",
+    "Wednesday, January 13th 2021 12:13:14 PM",
+    "Jan 13 2021 12:13:14.5 +00:00",
+)
+
+
+def warm_up(
+    config: Optional[DatetimeConfig] = None,
+    formats: Sequence[str] = (),
+    timezones: Sequence[str] = (),
+) -> Dict[str, float]:
+    """Eagerly load everything that the first call to `parse()` would
+    otherwise load lazily, so that the first parsed datetime is as fast as
+    any later one. Meant to be called once when a long-lived worker starts.
+
+    Args:
+        config (DatetimeConfig, optional): Datetime Configuration that will be
+        passed to `parse()`. Defaults to DEFAULT_DATETIME_CONFIG.
+        formats (Sequence[str], optional): Datetime formats that will be
+        passed to `parse()`. Defaults to empty tuple.
+        timezones (Sequence[str], optional): IANA timezone names to load.
+        Defaults to empty tuple.
+
+    Returns:
+        Dict[str, float]: Seconds spent on each warm up step
+    """
+    config = config or DEFAULT_DATETIME_CONFIG
+    timings = {}
+
+    def timed(step, func):
+        start = perf_counter()
+        func()
+        timings[step] = perf_counter() - start
+
+    timed("imports", _import_parser)
+    timed("locales", lambda: _load_locales(config))
+    timed("timezones", lambda: _load_timezones(timezones))
+    timed("formats", lambda: _compile_formats(formats))
+    timed("config", lambda: _parse_samples(config))
+    return timings
+
+
+def _import_parser():
+    # pylint: disable=C0401,C0415,W0611
+    import pydash.arrays  # noqa: F401
+    from . import datetime_info, parser  # noqa: F401
+
+
+def _load_locales(config: DatetimeConfig):
+    # pylint: disable=C0415
+    import pendulum
+    from pendulum.locales.locale import Locale
+    from .locale_index import get_locale_index
+
+    Locale.load(pendulum.get_locale())
+    get_locale_index(config.locales)
+
+
+def _load_timezones(timezones: Sequence[str]):
+    from .tz_registry import get_timezone  # pylint: disable=C0415
+
+    get_timezone("UTC")
+    for name in timezones:
+        get_timezone(name)
+
+
+def _compile_formats(formats: Sequence[str]):
+    """Compile fixed width parsers and pre-compile the regular expressions
+    `FractionalSecondsFormatter.parse` builds for every other format.
+    """
+    # pylint: disable=C0415
+    import pendulum
+    from pendulum.locales.locale import Locale
+    from .utils.fixed_width_formats import compile_fixed_width_format
+    from .utils.manipulation import _formatter, replace_zz_with_Z
+
+    locale = Locale.load(pendulum.get_locale())
+    for format_ in {*formats, *replace_zz_with_Z(formats)}:
+        compile_fixed_width_format(format_)
+        escaped_format = re.escape(format_)
+        try:
+            # pylint: disable=W0212
+            pattern = _formatter._FROM_FORMAT_RE.sub(
+                lambda match: _formatter._replace_tokens(match.group(0), locale),
+                escaped_format,
+            )
+        except (ValueError, AttributeError):
+            # Unsupported tokens fail the same way in `parse()`
+            continue
+        re.compile("^" + pattern + "$")
+        re.compile(pattern)
+
+
+def _parse_samples(config: DatetimeConfig):
+    """Run samples through the parser with `config`, which compiles the
+    matcher regexes and builds the long datetime formats. Samples skip the
+    instrumentation hooks and aren't recorded in the parser cache.
+    """
+    # pylint: disable=C0415
+    from .parser import _parse
+    from .parser_cache import PARSER_CACHE
+
+    with PARSER_CACHE.not_recording():
+        for sample in _WARM_UP_SAMPLES:
+            try:
+                _parse(sample, (), config)
+            except (DatetimeParserError, ValueError):
+                pass
@@ -1,3 +1,7 @@
+import re
+from typing import Optional
+
+
 def isnumber(value):
     """Check if the target value is a number.
 
@@ -17,3 +21,88 @@ def isnumber(value):
         return True
     except ValueError:
         return False
+
+
+# Chunks of string cells are first converted with one numpy cast. The cells
+# of chunks that don't all convert are matched against the syntax of `float()`
+# before converting them, so that non-numbers don't raise exceptions.
+_CHUNK_SIZE = 1024
+_DIGITS = r"\d(?:_?\d)*"
+_NUMBER = re.compile(
+    rf"[+-]?(?:(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?"
+    r"|inf(?:inity)?|nan)",
+    re.IGNORECASE,
+)
+
+
+def _to_float(value) -> Optional[float]:
+    """Return the float of a number, or None, with the rules of `isnumber`"""
+    if isinstance(value, str):
+        if not _NUMBER.fullmatch(value.strip()):
+            return None
+    elif isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_numeric(values) -> tuple:
+    """Convert a column of values to floats, with the rules of `isnumber`.
+
+    Args:
+        values (Sequence): A list or a one dimensional numpy array of values.
+        None is not a number.
+
+    Returns:
+        (tuple): A numpy boolean array, True for the numbers, and a numpy
+        float64 array of the numbers, with NaN for the values that are not
+        numbers.
+    """
+    import numpy as np  # pylint: disable=C0415
+
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind in "iuf":
+            return np.ones(values.shape, dtype=bool), values.astype(np.float64)
+        if values.dtype.kind == "b":
+            return np.zeros(values.shape, dtype=bool), np.full(values.shape, np.nan)
+        if values.dtype.kind == "U":
+            try:
+                numbers = values.astype(np.float64)
+                return np.ones(values.shape, dtype=bool), numbers
+            except ValueError:
+                pass
+        values = values.tolist()
+    else:
+        values = list(values)
+    mask = np.zeros(len(values), dtype=bool)
+    numbers = np.full(len(values), np.nan)
+    for start in range(0, len(values), _CHUNK_SIZE):
+        chunk = values[start : start + _CHUNK_SIZE]
+        # Booleans would be converted too
+        if set(map(type, chunk)) == {str}:
+            try:
+                numbers[start : start + len(chunk)] = np.array(chunk, dtype=np.float64)
+                mask[start : start + len(chunk)] = True
+                continue
+            except ValueError:
+                pass
+        for index, value in enumerate(chunk, start):
+            number = _to_float(value)
+            if number is not None:
+                mask[index] = True
+                numbers[index] = number
+    return mask, numbers
+
+
+def isnumber_many(values):
+    """Check which values of a column are numbers, with the rules of `isnumber`.
+
+    Args:
+        values (Sequence): A list or a one dimensional numpy array of values
+
+    Returns:
+        (numpy.ndarray): A boolean array, True for the numbers
+    """
+    return to_numeric(values)[0]